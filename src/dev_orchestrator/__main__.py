@@ -0,0 +1,37 @@
+"""Entry point for ``python -m dev_orchestrator`` and the ``orchestrator`` script.
+
+Version and run-list invocations are answered without importing Typer;
+everything else is dispatched to the Typer app in cli.py. ``list`` is an
+alias for ``status`` handled here rather than registered as a command.
+"""
+
+import sys
+
+
+def main() -> None:
+    """Run the CLI, taking the fast path for trivial invocations."""
+    args = sys.argv[1:]
+
+    if args in (["--version"], ["-v"]):
+        from . import __version__
+
+        print(f"dev-orchestrator v{__version__}")
+        return
+
+    if args in (["list"], ["status"]):
+        from .console import print_recent_runs
+
+        print_recent_runs()
+        return
+
+    if args[:1] == ["list"]:
+        sys.argv[1] = "status"
+
+    from .cli import app, select_command
+
+    select_command(sys.argv[1:])
+    app()
+
+
+if __name__ == "__main__":
+    main()
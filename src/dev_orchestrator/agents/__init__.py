@@ -1,28 +1,44 @@
 """Agentic modules for dev-orchestrator.
 
 LangChain-powered agents with LangGraph orchestration.
+
+Exports are imported lazily (PEP 562) so that importing the package, e.g.
+for CLI ``--help``, does not pay for LangChain until an agent is used.
 """
 
-from .base_agent import AgentOutput, BaseAgent, AgentState
-from .architect_agent import ArchitectAgent
-from .implementer_agent import ImplementerAgent
-from .tester_agent import TesterAgent
-from .documenter_agent import DocumenterAgent
-from .reviewer_agent import ReviewerAgent
-from .workflow import AgentWorkflow, run_workflow
-from .agent_executor import AgentExecutor, execute_agent_run
-
-__all__ = [
-    "BaseAgent",
-    "AgentOutput",
-    "AgentState",
-    "ArchitectAgent",
-    "ImplementerAgent",
-    "TesterAgent",
-    "DocumenterAgent",
-    "ReviewerAgent",
-    "AgentWorkflow",
-    "run_workflow",
-    "AgentExecutor",
-    "execute_agent_run",
-]
+import importlib
+from typing import Any
+
+# Public name -> (submodule, attribute)
+_LAZY: dict[str, tuple[str, str]] = {
+    "BaseAgent": ("base_agent", "BaseAgent"),
+    "AgentOutput": ("base_agent", "AgentOutput"),
+    "AgentState": ("base_agent", "AgentState"),
+    "ArchitectAgent": ("architect_agent", "ArchitectAgent"),
+    "ImplementerAgent": ("implementer_agent", "ImplementerAgent"),
+    "TesterAgent": ("tester_agent", "TesterAgent"),
+    "DocumenterAgent": ("documenter_agent", "DocumenterAgent"),
+    "ReviewerAgent": ("reviewer_agent", "ReviewerAgent"),
+    "BatchedParallelAgent": ("batched_agent", "BatchedParallelAgent"),
+    "ParallelOutputs": ("batched_agent", "ParallelOutputs"),
+    "AgentWorkflow": ("workflow", "AgentWorkflow"),
+    "run_workflow": ("workflow", "run_workflow"),
+    "AgentExecutor": ("agent_executor", "AgentExecutor"),
+    "execute_agent_run": ("agent_executor", "execute_agent_run"),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        mod_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{mod_name}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
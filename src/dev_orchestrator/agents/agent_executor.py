@@ -4,34 +4,99 @@ Coordinates LangChain agents through LangGraph workflow.
 """
 
 import asyncio
-import json
+import dataclasses
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from ..agents.base_agent import AgentOutput, AgentState, FileChange
+import orjson
+
+from ..agents.base_agent import (
+    AgentOutput,
+    AgentOutputRecord,
+    AgentState,
+    FileChangeRecord,
+    format_repo_context,
+)
 from ..agents.workflow import AgentWorkflow
 from ..core.config import get_config
 from ..core.git_ops import GitOps
-from ..core.llm_config import check_llm_available
+from ..core.llm_config import check_llm_available, close_http_async_client
 from ..core.run_context import RunContext, RunStatus
 
+# Files read into the agents' context, matched by basename (first match wins)
+IMPORTANT_FILES = (
+    "README.md", "readme.md",
+    "pyproject.toml", "package.json", "setup.py",
+    "requirements.txt",
+    "src/__init__.py", "src/main.py", "app.py", "main.py",
+)
+
+_IMPORTANT_BY_BASENAME: dict[str, tuple[str, ...]] = {}
+for _pattern in IMPORTANT_FILES:
+    _basename = _pattern.rsplit("/", 1)[-1]
+    _IMPORTANT_BY_BASENAME[_basename] = _IMPORTANT_BY_BASENAME.get(_basename, ()) + (_pattern,)
+del _pattern, _basename
+
+
+# (agent name, state key, saved output filename), in report order
+_AGENT_OUTPUT_KEYS: tuple[tuple[str, str, str], ...] = tuple(
+    (name, f"{name}_output", f"{name}.json")
+    for name in ("architect", "implementer", "tester", "documenter", "reviewer")
+)
+
+# Threads writing file changes; writes release the GIL
+_WRITE_WORKERS = 8
+
+
+def select_important_files(files: list[str]) -> list[str]:
+    """Pick the first file matching each entry of IMPORTANT_FILES.
+
+    Single pass over ``files``; stops early once every pattern matched.
+    """
+    matched: set[str] = set()
+    selected: list[str] = []
+
+    for f in files:
+        patterns = _IMPORTANT_BY_BASENAME.get(f.rsplit("/", 1)[-1])
+        if not patterns or matched.issuperset(patterns):
+            continue
+        matched.update(patterns)
+        selected.append(f)
+        if len(matched) == len(IMPORTANT_FILES):
+            break
+
+    return selected
+
 
 class AgentExecutor:
     """Executor that coordinates multi-agent workflow."""
 
-    def __init__(self, context: RunContext):
+    def __init__(
+        self,
+        context: RunContext,
+        pretty_save: bool = False,
+        use_llm_cache: bool = False,
+    ):
         """Initialize executor.
 
         Args:
             context: Run context for this execution
+            pretty_save: Indent saved agent outputs for human inspection
+                (compact JSON otherwise)
+            use_llm_cache: Answer repeated prompts from the LLM cache
         """
         self.context = context
+        self.pretty_save = pretty_save
+        self.use_llm_cache = use_llm_cache
         self.config = get_config()
         self.git_ops: GitOps | None = None
         self.workflow: AgentWorkflow | None = None
         self.final_state: AgentState | None = None
         self.modified_files: list[str] = []
+        self._repo_ctx_cache: dict[str, Any] | None = None
 
     def setup(self) -> None:
         """Set up executor for a run."""
@@ -54,19 +119,32 @@ class AgentExecutor:
             raise ValueError(f"Not a valid git repository: {self.context.repo_path}")
 
         # Initialize workflow
-        self.workflow = AgentWorkflow(self.context)
+        self.workflow = AgentWorkflow(self.context, use_llm_cache=self.use_llm_cache)
 
         self.context.log("INFO", "Agent executor setup complete")
 
-    def _gather_repo_context(self) -> dict[str, Any]:
-        """Gather repository context for agents."""
-        context: dict[str, Any] = {
+    def _new_repo_context(self) -> dict[str, Any]:
+        """Create an empty repository context."""
+        return {
             "repo_path": str(self.context.repo_path),
             "files": [],
             "file_contents": {},
             "git_status": None,
         }
 
+    def _read_context_files(self, paths: list[str]) -> dict[str, str]:
+        """Read the important files for the context in one batch."""
+        return self.git_ops.read_files(paths, max_bytes=5000)  # Limit file size
+
+    def _gather_repo_context(self) -> dict[str, Any]:
+        """Gather repository context for agents.
+
+        The result is cached until the branch or working tree changes.
+        """
+        if self._repo_ctx_cache is not None:
+            return self._repo_ctx_cache
+
+        context = self._new_repo_context()
         if not self.git_ops:
             return context
 
@@ -80,29 +158,49 @@ class AgentExecutor:
             context["git_status"] = status
 
             # Read important files (limit to avoid token overflow)
-            important_patterns = [
-                "README.md", "readme.md",
-                "pyproject.toml", "package.json", "setup.py",
-                "requirements.txt",
-                "src/__init__.py", "src/main.py", "app.py", "main.py",
-            ]
-
-            for pattern in important_patterns:
-                for f in files:
-                    if f.endswith(pattern.split("/")[-1]) or f == pattern:
-                        try:
-                            content = self.git_ops.read_file(f)
-                            if len(content) < 5000:  # Limit file size
-                                context["file_contents"][f] = content
-                        except Exception:
-                            pass
-                        break
+            context["file_contents"] = self._read_context_files(select_important_files(files))
 
         except Exception as e:
             self.context.log("WARNING", f"Error gathering repo context: {e}")
 
+        self._repo_ctx_cache = context
         return context
 
+    async def _gather_repo_context_async(self) -> dict[str, Any]:
+        """Gather repository context, running the git queries concurrently.
+
+        Shares the cache of _gather_repo_context.
+        """
+        if self._repo_ctx_cache is not None:
+            return self._repo_ctx_cache
+
+        context = self._new_repo_context()
+        if not self.git_ops:
+            return context
+
+        try:
+            files, status = await asyncio.gather(
+                asyncio.to_thread(self.git_ops.get_file_list),
+                asyncio.to_thread(self.git_ops.get_status),
+            )
+            context["files"] = files
+            context["git_status"] = status
+
+            # One cat-file batch beats a thread per file
+            context["file_contents"] = await asyncio.to_thread(
+                self._read_context_files, select_important_files(files)
+            )
+
+        except Exception as e:
+            self.context.log("WARNING", f"Error gathering repo context: {e}")
+
+        self._repo_ctx_cache = context
+        return context
+
+    def invalidate_repo_context(self) -> None:
+        """Drop the cached repository context."""
+        self._repo_ctx_cache = None
+
     def create_branch(self) -> str:
         """Create dedicated branch for this run."""
         if not self.git_ops:
@@ -113,6 +211,7 @@ class AgentExecutor:
 
         try:
             self.git_ops.create_branch(branch_name)
+            self.invalidate_repo_context()
             self.context.branch_name = branch_name
             return branch_name
         except Exception as e:
@@ -127,37 +226,54 @@ class AgentExecutor:
         self.context.set_status(RunStatus.EXECUTING)
         self.context.log("INFO", "Executing multi-agent workflow...")
 
-        # Gather repo context
-        repo_context = self._gather_repo_context()
-
-        # Execute workflow
-        self.final_state = await self.workflow.execute(
-            goal=self.context.goal,
-            repo_path=str(self.context.repo_path),
-            repo_context=repo_context,
-        )
+        # Gather repo context and format it once for all agents
+        repo_context = await self._gather_repo_context_async()
+        if "_formatted" not in repo_context:
+            repo_context["_formatted"] = format_repo_context(repo_context)
 
-        # Save state
-        self._save_agent_outputs()
+        # Execute workflow. The parallel phase runs its agents concurrently;
+        # the outputs of finished phases are persisted even if a later phase
+        # raises.
+        partial_state: dict[str, Any] = {}
+        try:
+            state = await self.workflow.execute(
+                goal=self.context.goal,
+                repo_path=str(self.context.repo_path),
+                repo_context=repo_context,
+                state_sink=partial_state,
+            )
+            self.final_state = _freeze_outputs(state)
+        except Exception:
+            if partial_state:
+                self.final_state = _freeze_outputs(partial_state)
+            raise
+        finally:
+            await self._save_agent_outputs()
 
         return self.final_state
 
-    def _save_agent_outputs(self) -> None:
-        """Save agent outputs to run directory."""
+    async def _save_agent_outputs(self) -> None:
+        """Save agent outputs to run directory.
+
+        Outputs are serialized with orjson and written concurrently in
+        worker threads, off the event loop.
+        """
         if not self.final_state:
             return
 
         outputs_dir = self.context.run_dir / "agent_outputs"
         outputs_dir.mkdir(exist_ok=True)
 
-        agent_names = ["architect", "implementer", "tester", "documenter", "reviewer"]
-
-        for name in agent_names:
-            output: AgentOutput | None = self.final_state.get(f"{name}_output")
+        pending: list[tuple[Path, AgentOutputRecord]] = []
+        for _, key, filename in _AGENT_OUTPUT_KEYS:
+            output: AgentOutputRecord | None = self.final_state.get(key)
             if output:
-                output_file = outputs_dir / f"{name}.json"
-                with open(output_file, "w", encoding="utf-8") as f:
-                    json.dump(output.model_dump(), f, indent=2, default=str)
+                pending.append((outputs_dir / filename, output))
+
+        option = orjson.OPT_INDENT_2 if self.pretty_save else 0
+        await asyncio.gather(
+            *(asyncio.to_thread(_write_json, path, data, option) for path, data in pending)
+        )
 
     def apply_file_changes(self) -> list[str]:
         """Apply file changes from agents to repository."""
@@ -168,42 +284,69 @@ class AgentExecutor:
         self.context.log("INFO", "Applying file changes...")
 
         # Use reviewer's changes if available, otherwise aggregate
-        all_changes: list[FileChange] = self.final_state.get("all_file_changes", [])
+        all_changes: list[FileChangeRecord] = self.final_state.get("all_file_changes", [])
 
         if not all_changes and self.final_state.get("reviewer_output"):
             all_changes = self.final_state["reviewer_output"].file_changes
 
-        # Deduplicate by path (prefer later changes)
-        changes_by_path: dict[str, FileChange] = {}
-        for change in all_changes:
-            changes_by_path[change.path] = change
-
-        for path, change in changes_by_path.items():
+        # Deduplicate by path in one reverse pass (later changes win)
+        seen: set[str] = set()
+        ordered: deque[FileChangeRecord] = deque()
+        for change in reversed(all_changes):
+            if change.path in seen:
+                continue
+            seen.add(change.path)
+            ordered.appendleft(change)
+
+        # Create each target directory once instead of once per file
+        parents = {
+            (self.context.repo_path / change.path).parent
+            for change in ordered
+            if change.action in ("create", "modify")
+        }
+        for parent in parents:
             try:
-                self._apply_single_change(change)
-                self.modified_files.append(path)
-                self.context.log("INFO", f"Applied: {change.action} {path}")
-            except Exception as e:
-                self.context.add_error(f"Failed to apply {path}: {e}")
+                parent.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                pass  # Reported when writing the file below
+
+        # Paths are unique after deduplication, so files can be written in
+        # any order; outcomes are still recorded in change order
+        if len(ordered) > 1:
+            with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as pool:
+                errors = list(pool.map(self._try_apply_change, ordered))
+        else:
+            errors = [self._try_apply_change(change) for change in ordered]
 
+        for change, error in zip(ordered, errors):
+            if error is None:
+                self.modified_files.append(change.path)
+                self.context.log("INFO", f"Applied: {change.action} {change.path}")
+            else:
+                self.context.add_error(f"Failed to apply {change.path}: {error}")
+
+        self.invalidate_repo_context()
         return self.modified_files
 
-    def _apply_single_change(self, change: FileChange) -> None:
-        """Apply a single file change."""
-        file_path = self.context.repo_path / change.path
+    def _try_apply_change(self, change: FileChangeRecord) -> Exception | None:
+        """Apply a single file change, returning the error if it failed."""
+        try:
+            self._apply_single_change(change)
+        except Exception as e:
+            return e
+        return None
 
-        if change.action == "create":
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(change.content, encoding="utf-8")
+    def _apply_single_change(self, change: FileChangeRecord) -> None:
+        """Apply a single file change.
 
-        elif change.action == "modify":
-            if file_path.exists():
-                # For now, just overwrite. Could do smart merge later.
-                file_path.write_text(change.content, encoding="utf-8")
-            else:
-                # Create if doesn't exist
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_path.write_text(change.content, encoding="utf-8")
+        Parent directories are created up front by apply_file_changes.
+        """
+        file_path = self.context.repo_path / change.path
+
+        if change.action in ("create", "modify"):
+            # Modify just overwrites for now (creating the file if missing).
+            # Could do smart merge later.
+            file_path.write_bytes(change.content.encode("utf-8"))
 
         elif change.action == "delete":
             if file_path.exists():
@@ -226,89 +369,52 @@ class AgentExecutor:
             self.context.add_error(f"Commit failed: {e}")
             return False
 
-    def generate_report(self) -> str:
-        """Generate final run report."""
-        self.context.log("INFO", "Generating report...")
-
-        report_parts = [
-            "# Multi-Agent Orchestrator Run Report",
-            "",
-            "## Run Information",
-            "",
-            f"| Property | Value |",
-            f"|----------|-------|",
-            f"| Run ID | `{self.context.run_id}` |",
-            f"| Goal | {self.context.goal} |",
-            f"| Repository | `{self.context.repo_path}` |",
-            f"| Branch | `{self.context.branch_name or 'N/A'}` |",
-            f"| Status | {self.context.status.value} |",
-            f"| Created | {self.context.created_at.isoformat()} |",
-            "",
-            "## Agent Outputs",
-            "",
-        ]
-
+    def _report_inputs(
+        self,
+    ) -> tuple[dict[str, str], list[tuple[str, dict[str, Any]]], list[str], list[str]]:
+        """Collect the picklable inputs of render_report."""
+        run_info = {
+            "run_id": self.context.run_id,
+            "goal": self.context.goal,
+            "repo_path": str(self.context.repo_path),
+            "branch": self.context.branch_name or "N/A",
+            "status": self.context.status.value,
+            "created": self.context.created_at.isoformat(),
+        }
+        outputs: list[tuple[str, dict[str, Any]]] = []
         if self.final_state:
-            agent_names = ["architect", "implementer", "tester", "documenter", "reviewer"]
-
-            for name in agent_names:
-                output: AgentOutput | None = self.final_state.get(f"{name}_output")
+            for name, key, _ in _AGENT_OUTPUT_KEYS:
+                output: AgentOutputRecord | None = self.final_state.get(key)
                 if output:
-                    status = "✅" if output.success else "❌"
-                    report_parts.append(f"### {status} {name.capitalize()}")
-                    report_parts.append("")
-                    report_parts.append(f"**Summary:** {output.summary}")
-                    report_parts.append("")
-                    report_parts.append("<details>")
-                    report_parts.append("<summary>Reasoning</summary>")
-                    report_parts.append("")
-                    report_parts.append(output.reasoning)
-                    report_parts.append("")
-                    report_parts.append("</details>")
-                    report_parts.append("")
-
-                    if output.file_changes:
-                        report_parts.append("**File Changes:**")
-                        for fc in output.file_changes:
-                            report_parts.append(f"- `{fc.path}` ({fc.action}): {fc.description}")
-                        report_parts.append("")
-
-        report_parts.extend([
-            "## Applied Changes",
-            "",
-        ])
-
-        if self.modified_files:
-            for f in self.modified_files:
-                report_parts.append(f"- `{f}`")
-        else:
-            report_parts.append("No files modified.")
-
-        report_parts.extend([
-            "",
-            "## Errors",
-            "",
-        ])
+                    outputs.append((name, dataclasses.asdict(output)))
+        return run_info, outputs, list(self.modified_files), list(self.context.errors)
 
-        if self.context.errors:
-            for err in self.context.errors:
-                report_parts.append(f"- ❌ {err}")
-        else:
-            report_parts.append("No errors.")
+    def _store_report(self, report: str) -> None:
+        """Write the report to the run directory and register it."""
+        self.context.report_file.write_text(report, encoding="utf-8")
+        self.context.artifacts["report"] = str(self.context.report_file)
 
-        report_parts.extend([
-            "",
-            "---",
-            "*Generated by dev-orchestrator v0.2.0 (Multi-Agent)*",
-        ])
+    def generate_report(self) -> str:
+        """Generate final run report.
 
-        report = "\n".join(report_parts)
+        Returns:
+            Path to the report
+        """
+        self.context.log("INFO", "Generating report...")
+        report = render_report(*self._report_inputs())
+        self._store_report(report)
+        return str(self.context.report_file)
 
-        # Save report
-        self.context.report_file.write_text(report, encoding="utf-8")
-        self.context.artifacts["report"] = str(self.context.report_file)
+    async def generate_report_async(self) -> str:
+        """Generate final run report in a worker thread, keeping the event loop free.
 
-        return report
+        Returns:
+            Path to the report
+        """
+        self.context.log("INFO", "Generating report...")
+        report = await asyncio.to_thread(render_report, *self._report_inputs())
+        self._store_report(report)
+        return str(self.context.report_file)
 
     async def run(self) -> str:
         """Execute the full orchestration workflow.
@@ -324,7 +430,7 @@ class AgentExecutor:
             self.commit_changes()
 
             self.context.set_status(RunStatus.COMPLETED)
-            report = self.generate_report()
+            await self.generate_report_async()
             self.context.save()
 
             return str(self.context.report_file)
@@ -332,10 +438,133 @@ class AgentExecutor:
         except Exception as e:
             self.context.set_status(RunStatus.FAILED)
             self.context.add_error(str(e))
-            self.generate_report()
+            await self.generate_report_async()
             self.context.save()
             raise
 
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release the run's git processes and the agents' HTTP connections."""
+        if self.git_ops:
+            self.git_ops.close()
+        await close_http_async_client()
+
+
+_REPORT_HEADER = "# Multi-Agent Orchestrator Run Report\n\n## Run Information\n\n"
+
+_REPORT_TABLE_TEMPLATE = """| Property | Value |
+|----------|-------|
+| Run ID | `{run_id}` |
+| Goal | {goal} |
+| Repository | `{repo_path}` |
+| Branch | `{branch}` |
+| Status | {status} |
+| Created | {created} |
+
+## Agent Outputs
+
+"""
+
+_AGENT_SECTION_TEMPLATE = """### {status} {title}
+
+**Summary:** {summary}
+
+<details>
+<summary>Reasoning</summary>
+
+{reasoning}
+
+</details>
+"""
+
+_REPORT_SECTIONS_TEMPLATE = """## Applied Changes
+
+{changes}
+
+## Errors
+
+{errors}
+"""
+
+_REPORT_FOOTER = "\n---\n*Generated by dev-orchestrator v0.2.0 (Multi-Agent)*"
+
+
+def render_report(
+    run_info: dict[str, str],
+    outputs: list[tuple[str, dict[str, Any]]],
+    modified_files: list[str],
+    errors: list[str],
+) -> str:
+    """Render the run report from plain data.
+
+    Pure function of picklable arguments so it can run in a worker process.
+
+    Args:
+        run_info: run_id, goal, repo_path, branch, status and created values
+        outputs: (agent name, asdict(AgentOutputRecord)) pairs in report order
+        modified_files: Paths of the applied changes
+        errors: Errors recorded during the run
+
+    Returns:
+        The report as markdown
+    """
+    agent_section = "".join(_render_agent_block(name, output) + "\n" for name, output in outputs)
+    sections = _REPORT_SECTIONS_TEMPLATE.format(
+        changes=(
+            "\n".join(f"- `{f}`" for f in modified_files)
+            if modified_files
+            else "No files modified."
+        ),
+        errors="\n".join(f"- ❌ {err}" for err in errors) if errors else "No errors.",
+    )
+    return (
+        _REPORT_HEADER
+        + _REPORT_TABLE_TEMPLATE.format_map(run_info)
+        + agent_section
+        + sections
+        + _REPORT_FOOTER
+    )
+
+
+def _render_agent_block(name: str, output: dict[str, Any]) -> str:
+    """Render one agent's section of the run report."""
+    block = _AGENT_SECTION_TEMPLATE.format(
+        status="✅" if output["success"] else "❌",
+        title=name.capitalize(),
+        summary=output["summary"],
+        reasoning=output["reasoning"],
+    )
+    if output["file_changes"]:
+        changes = "\n".join(
+            f"- `{fc['path']}` ({fc['action']}): {fc['description']}"
+            for fc in output["file_changes"]
+        )
+        block += f"\n**File Changes:**\n{changes}\n"
+    return block
+
+
+def _freeze_outputs(state: AgentState) -> AgentState:
+    """Replace the Pydantic agent outputs in a final state with records."""
+    frozen = dict(state)
+    for key, value in state.items():
+        if key.endswith("_output") and isinstance(value, AgentOutput):
+            frozen[key] = AgentOutputRecord.from_model(value)
+    frozen["all_file_changes"] = [
+        FileChangeRecord(fc.path, fc.action, fc.content, fc.description)
+        for fc in state.get("all_file_changes", [])
+    ]
+    return frozen
+
+
+def _write_json(path: Path, data: Any, option: int = 0) -> None:
+    """Serialize ``data`` with orjson and write it to ``path``.
+
+    orjson serializes dataclasses natively, so records need no asdict().
+    """
+    path.write_bytes(orjson.dumps(data, option=option))
+
 
 async def execute_agent_run(repo_path: str | Path, goal: str) -> str:
     """Convenience function to execute a multi-agent run.
@@ -7,24 +7,13 @@ Responsible for:
 - Decomposing work for other agents
 """
 
-from typing import Any
+import sys
+from typing import Any, Final
 
 from .base_agent import AgentOutput, BaseAgent
 
-
-class ArchitectAgent(BaseAgent):
-    """Architect agent for analysis and design tasks.
-
-    First in the 1-N-1 workflow. Analyzes the goal and repository,
-    then provides guidance for Implementer, Tester, and Documenter.
-    """
-
-    name = "architect"
-    description = "Analyzes codebase and designs solutions"
-
-    @property
-    def system_prompt(self) -> str:
-        return """You are an expert Software Architect agent. Your role is to:
+SYSTEM_PROMPT: Final[str] = sys.intern(
+    """You are an expert Software Architect agent. Your role is to:
 
 1. **Analyze** the codebase structure and understand existing patterns
 2. **Design** solutions that fit the codebase architecture
@@ -56,12 +45,27 @@ You will receive:
 - Repository context (file structure, relevant file contents)
 
 Analyze thoroughly and provide a detailed technical design."""
+)
+
+
+class ArchitectAgent(BaseAgent):
+    """Architect agent for analysis and design tasks.
+
+    First in the 1-N-1 workflow. Analyzes the goal and repository,
+    then provides guidance for Implementer, Tester, and Documenter.
+    """
+
+    name = "architect"
+    description = "Analyzes codebase and designs solutions"
+    system_prompt = SYSTEM_PROMPT
 
     async def execute(
         self,
         goal: str,
         repo_context: dict[str, Any],
         previous_outputs: dict[str, AgentOutput] | None = None,
+        architect_summary: str | None = None,
+        pre_formatted_previous: str | None = None,
     ) -> AgentOutput:
         """Analyze repository and design solution.
 
@@ -69,6 +73,8 @@ Analyze thoroughly and provide a detailed technical design."""
             goal: The goal to accomplish
             repo_context: Context about the repository
             previous_outputs: Not used (architect is first)
+            architect_summary: Not used (architect is first)
+            pre_formatted_previous: Not used (architect is first)
 
         Returns:
             Design document with recommendations for other agents
@@ -77,13 +83,7 @@ Analyze thoroughly and provide a detailed technical design."""
 
         context_str = self._format_repo_context(repo_context)
 
-        input_text = f"""## Goal
-{goal}
-
-## Repository Context
-{context_str}
-
-## Your Task
+        input_text = f"""## Your Task
 1. Analyze the repository structure and understand the context
 2. Design a solution for the goal
 3. Identify specific files to create or modify
@@ -92,7 +92,13 @@ Analyze thoroughly and provide a detailed technical design."""
    - Tester: What tests to create
    - Documenter: What documentation to update
 
-Be specific and actionable. Include file paths, function signatures, and implementation details."""
+Be specific and actionable. Include file paths, function signatures, and implementation details.
+
+## Repository Context
+{context_str}
+
+## Goal
+{goal}"""
 
         result = await self._invoke_llm(input_text)
 
@@ -3,18 +3,51 @@
 Provides common functionality for all agentic roles.
 """
 
+import asyncio
+import functools
+import sys
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Collection
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, TypedDict
+from io import StringIO
+from typing import Any, TypedDict, TypeVar
 
+import orjson
+from langchain_core.caches import BaseCache
+from langchain_core.globals import get_llm_cache
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.output_parsers.openai_tools import PydanticToolsParser
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_openai import ChatOpenAI
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError, field_validator
 
 from ..core.llm_config import create_chat_model, get_llm_config
 from ..core.run_context import RunContext
+from .response_cache import ResponseCache, get_response_cache
+
+T = TypeVar("T")
+
+
+# One semaphore per event loop, shared by every agent running on it
+_llm_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_llm_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent LLM requests on the running loop.
+
+    The limit comes from ``LLMConfig.max_concurrency`` so parallel agents
+    respect provider rate limits.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _llm_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_llm_config().max_concurrency)
+        _llm_semaphores[loop] = semaphore
+    return semaphore
 
 
 class FileChange(BaseModel):
@@ -25,6 +58,12 @@ class FileChange(BaseModel):
     content: str = Field(description="New file content or diff")
     description: str = Field(description="What this change does")
 
+    @field_validator("path")
+    @classmethod
+    def _intern_path(cls, value: str) -> str:
+        """Share one string per path across agents' changes and dedup dicts."""
+        return sys.intern(value)
+
 
 class AgentOutput(BaseModel):
     """Structured output from an agent."""
@@ -36,6 +75,50 @@ class AgentOutput(BaseModel):
     recommendations: list[str] = Field(default_factory=list, description="Recommendations for next steps")
     issues: list[str] = Field(default_factory=list, description="Issues or concerns found")
 
+    # Prompt rendering cached by _format_output_body (outputs are not mutated once shared)
+    _prompt_body: str | None = PrivateAttr(default=None)
+
+
+@dataclass(slots=True, frozen=True)
+class FileChangeRecord:
+    """Immutable mirror of FileChange used on the executor's read path."""
+
+    path: str
+    action: str
+    content: str
+    description: str
+
+
+@dataclass(slots=True, frozen=True)
+class AgentOutputRecord:
+    """Immutable mirror of AgentOutput used on the executor's read path.
+
+    Pydantic models are kept at the LLM boundary; once a run finishes the
+    executor works on these slotted records instead.
+    """
+
+    success: bool
+    summary: str
+    reasoning: str
+    file_changes: tuple[FileChangeRecord, ...] = ()
+    recommendations: tuple[str, ...] = ()
+    issues: tuple[str, ...] = ()
+
+    @classmethod
+    def from_model(cls, output: AgentOutput) -> "AgentOutputRecord":
+        """Convert a validated AgentOutput into a record."""
+        return cls(
+            success=output.success,
+            summary=output.summary,
+            reasoning=output.reasoning,
+            file_changes=tuple(
+                FileChangeRecord(fc.path, fc.action, fc.content, fc.description)
+                for fc in output.file_changes
+            ),
+            recommendations=tuple(output.recommendations),
+            issues=tuple(output.issues),
+        )
+
 
 class AgentState(TypedDict, total=False):
     """Shared state between agents in the workflow.
@@ -55,6 +138,9 @@ class AgentState(TypedDict, total=False):
     documenter_output: AgentOutput | None
     reviewer_output: AgentOutput | None
 
+    # Compact architect memory passed to downstream agents instead of the full output
+    architect_summary: str
+
     # Aggregated results
     all_file_changes: list[FileChange]
     all_issues: list[str]
@@ -66,6 +152,63 @@ class AgentState(TypedDict, total=False):
     errors: list[str]
 
 
+# Responses larger than this are parsed in a worker thread
+_OFFLOAD_BYTES = 64 * 1024
+
+# Characters of each file's content shown in prompts: files in focus are
+# shown up to _FULL_CONTENT_CHARS, all others only up to _HEAD_CHARS
+_FULL_CONTENT_CHARS = 2000
+_HEAD_CHARS = 500
+
+
+def format_repo_context(
+    repo_context: dict[str, Any],
+    full_contents_for: Collection[str] | None = None,
+) -> str:
+    """Format repository context for an agent prompt.
+
+    Args:
+        repo_context: Repository context (files, contents, etc.)
+        full_contents_for: Paths whose contents are shown in full (up to
+            the truncation limit); other files only show their head. All
+            files are shown in full if None.
+
+    Returns:
+        Markdown context section
+    """
+    if not repo_context:
+        return "No repository context available."
+
+    buf = StringIO()
+    sep = ""
+
+    if "files" in repo_context:
+        files = repo_context["files"]
+        buf.write(f"**Files ({len(files)} total):**\n")
+        buf.write("\n".join(f"- {f}" for f in files[:50]))  # Limit to 50 files
+        sep = "\n\n"
+
+    if "file_contents" in repo_context:
+        buf.write(sep)
+        buf.write("**File Contents:**")
+        for path, content in repo_context["file_contents"].items():
+            # Truncate long files
+            limit = (
+                _FULL_CONTENT_CHARS
+                if full_contents_for is None or path in full_contents_for
+                else _HEAD_CHARS
+            )
+            truncated = content[:limit] + "..." if len(content) > limit else content
+            buf.write(f"\n\n\n`{path}`:\n```\n{truncated}\n```")
+        sep = "\n\n"
+
+    if "git_status" in repo_context:
+        buf.write(sep)
+        buf.write(f"**Git Status:** {repo_context['git_status']}")
+
+    return buf.getvalue()
+
+
 class BaseAgent(ABC):
     """Base class for LangChain-powered agents.
 
@@ -78,6 +221,7 @@ class BaseAgent(ABC):
 
     name: str = "base"
     description: str = "Base agent"
+    output_model: type[BaseModel] = AgentOutput
 
     def __init__(
         self,
@@ -96,6 +240,11 @@ class BaseAgent(ABC):
         self._llm = llm
         self._temperature = temperature
         self._chain = None
+        self._output_parser = None
+        # Set as soon as the streamed response starts listing file changes
+        self.first_file_change = asyncio.Event()
+        # Receives each file change as soon as it has been fully streamed
+        self.file_change_queue: asyncio.Queue[FileChange] | None = None
 
     @property
     def llm(self) -> ChatOpenAI:
@@ -104,23 +253,79 @@ class BaseAgent(ABC):
             self._llm = create_chat_model(temperature=self._temperature)
         return self._llm
 
+    @llm.setter
+    def llm(self, value: ChatOpenAI) -> None:
+        """Swap the LLM; the cached chain is rebuilt on next use."""
+        self._llm = value
+        self._chain = None
+
+    @property
+    def temperature(self) -> float | None:
+        """Temperature override for this agent."""
+        return self._temperature
+
+    @temperature.setter
+    def temperature(self, value: float | None) -> None:
+        """Change the temperature; the LLM and chain are recreated on next use."""
+        self._temperature = value
+        self._llm = None
+        self._chain = None
+
     @property
     @abstractmethod
     def system_prompt(self) -> str:
-        """System prompt for this agent."""
+        """System prompt for this agent.
+
+        Agents with a fixed prompt override this with a module-level
+        interned SYSTEM_PROMPT constant assigned as a class attribute.
+        """
         pass
 
-    def _build_prompt(self) -> ChatPromptTemplate:
-        """Build the prompt template for this agent."""
+    @classmethod
+    def _class_system_prompt(cls) -> str:
+        """System prompt of the class, without creating an instance.
+
+        Agent prompts are constants, so the property is evaluated on the class.
+        """
+        prompt = cls.system_prompt
+        if isinstance(prompt, property):
+            prompt = prompt.fget(cls)
+        return prompt
+
+    @classmethod
+    @functools.cache
+    def _get_prompt_template(cls) -> ChatPromptTemplate:
+        """Prompt template for this agent class, built once per class."""
         return ChatPromptTemplate.from_messages([
-            ("system", self.system_prompt),
+            ("system", cls._class_system_prompt()),
             MessagesPlaceholder(variable_name="messages", optional=True),
             ("human", "{input}"),
         ])
 
+    def _build_prompt(self) -> ChatPromptTemplate:
+        """Build the prompt template for this agent."""
+        return type(self)._get_prompt_template()
+
     def _get_structured_llm(self) -> Any:
-        """Get LLM configured for structured output."""
-        return self.llm.with_structured_output(AgentOutput, method="function_calling")
+        """Get LLM bound to the output model as its only tool.
+
+        The tool call is parsed by ``_output_parser`` once the streamed
+        response is complete.
+        """
+        return self.llm.bind_tools(
+            [self.output_model],
+            tool_choice=self.output_model.__name__,
+            parallel_tool_calls=False,
+        )
+
+    def prepare(self) -> None:
+        """Build the prompt chain and output parser ahead of the first call."""
+        if self._chain is None:
+            self._chain = self._build_prompt() | self._get_structured_llm()
+        if self._output_parser is None:
+            self._output_parser = PydanticToolsParser(
+                tools=[self.output_model], first_tool_only=True
+            )
 
     def log(self, level: str, message: str) -> None:
         """Log through context if available."""
@@ -128,28 +333,14 @@ class BaseAgent(ABC):
             self.context.log(level, f"[{self.name}] {message}")
 
     def _format_repo_context(self, repo_context: dict[str, Any]) -> str:
-        """Format repository context for the prompt."""
-        if not repo_context:
-            return "No repository context available."
-
-        parts = []
-
-        if "files" in repo_context:
-            files = repo_context["files"][:50]  # Limit to 50 files
-            parts.append(f"**Files ({len(repo_context['files'])} total):**\n" +
-                        "\n".join(f"- {f}" for f in files))
+        """Format repository context for the prompt.
 
-        if "file_contents" in repo_context:
-            parts.append("**File Contents:**")
-            for path, content in repo_context["file_contents"].items():
-                # Truncate long files
-                truncated = content[:2000] + "..." if len(content) > 2000 else content
-                parts.append(f"\n`{path}`:\n```\n{truncated}\n```")
-
-        if "git_status" in repo_context:
-            parts.append(f"**Git Status:** {repo_context['git_status']}")
-
-        return "\n\n".join(parts)
+        Uses the string pre-formatted by the executor when present, so all
+        agents in a run share one rendering.
+        """
+        if repo_context and "_formatted" in repo_context:
+            return repo_context["_formatted"]
+        return format_repo_context(repo_context)
 
     @abstractmethod
     async def execute(
@@ -157,6 +348,8 @@ class BaseAgent(ABC):
         goal: str,
         repo_context: dict[str, Any],
         previous_outputs: dict[str, AgentOutput] | None = None,
+        architect_summary: str | None = None,
+        pre_formatted_previous: str | None = None,
     ) -> AgentOutput:
         """Execute the agent's task.
 
@@ -164,6 +357,10 @@ class BaseAgent(ABC):
             goal: The goal to accomplish
             repo_context: Context about the repository
             previous_outputs: Outputs from previous agents in the workflow
+            architect_summary: Compact architect memory, used in place of
+                the full architect output when given
+            pre_formatted_previous: previous_outputs already rendered by
+                _format_previous_outputs, shared by agents with the same inputs
 
         Returns:
             Structured agent output
@@ -177,6 +374,12 @@ class BaseAgent(ABC):
     ) -> AgentOutput:
         """Invoke the LLM and get structured output.
 
+        The response is streamed so ``first_file_change`` can be set, and
+        completed file changes put on ``file_change_queue``, while the rest
+        of the output is still being generated. When an LLM cache is active
+        the call is made with ainvoke instead, since streamed calls bypass
+        the cache.
+
         Args:
             input_text: The input/question for the agent
             messages: Optional conversation history
@@ -186,54 +389,257 @@ class BaseAgent(ABC):
         """
         self.log("INFO", f"Invoking LLM...")
 
-        prompt = self._build_prompt()
-        structured_llm = self._get_structured_llm()
+        self.prepare()
 
-        chain = prompt | structured_llm
+        inputs = {"input": input_text, "messages": messages or []}
 
         try:
-            result = await chain.ainvoke({
-                "input": input_text,
-                "messages": messages or [],
-            })
+            cache, cache_key = self._response_cache_entry(input_text, messages)
+            if cache is not None:
+                cached = await asyncio.to_thread(cache.get, cache_key)
+                if cached is not None:
+                    result = await _off_loop_if_large(
+                        len(cached), self.output_model.model_validate_json, cached
+                    )
+                    self.first_file_change.set()
+                    self._publish_file_changes(getattr(result, "file_changes", []), 0)
+                    self.log("INFO", f"LLM response served from cache: {result.summary}")
+                    return result
+
+            message = None
+            published = 0
+            async for message in self._stream_invoke_llm(inputs):
+                if not self.first_file_change.is_set() and _has_file_change(message):
+                    self.first_file_change.set()
+                # Every listed change but the last is complete
+                published = self._publish_file_changes(
+                    _partial_file_changes(message)[:-1], published
+                )
+
+            result = None
+            if message is not None:
+                result = await _off_loop_if_large(
+                    _message_size(message), self._output_parser.invoke, message
+                )
+            if result is None:
+                raise ValueError("LLM response contained no structured output")
+            self._publish_file_changes(getattr(result, "file_changes", []), published)
+
+            if cache is not None:
+                await asyncio.to_thread(_cache_response, cache, cache_key, result)
 
             self.log("INFO", f"LLM response received: {result.summary}")
             return result
 
         except Exception as e:
             self.log("ERROR", f"LLM invocation failed: {e}")
-            return AgentOutput(
-                success=False,
-                summary=f"Agent failed: {e}",
-                reasoning="LLM invocation error",
-                issues=[str(e)],
-            )
+            return self._error_result(e)
 
-    def _format_previous_outputs(
+    async def _stream_invoke_llm(self, inputs: dict[str, Any]) -> AsyncIterator[Any]:
+        """Stream the response, yielding the accumulated message after each chunk.
+
+        When an LLM cache is active the complete message is yielded once.
+
+        Args:
+            inputs: Prompt inputs for the chain
+
+        Yields:
+            The response message received so far
+        """
+        async with get_llm_semaphore():
+            if _uses_llm_cache(self.llm):
+                yield await self._chain.ainvoke(inputs)
+                return
+            message = None
+            async for chunk in self._chain.astream(inputs):
+                message = chunk if message is None else message + chunk
+                yield message
+
+    def _publish_file_changes(self, changes: list[Any], published: int) -> int:
+        """Put changes past the first ``published`` on ``file_change_queue``.
+
+        Args:
+            changes: FileChanges or their (partially streamed) dicts
+            published: Number of changes already published
+
+        Returns:
+            Number of changes published so far
+        """
+        if self.file_change_queue is None:
+            return published
+        for change in changes[published:]:
+            if isinstance(change, dict):
+                try:
+                    change = FileChange.model_validate(change)
+                except ValidationError:
+                    break  # Published with the parsed result instead
+            self.file_change_queue.put_nowait(change)
+            published += 1
+        return published
+
+    def _response_cache_entry(
         self,
+        input_text: str,
+        messages: list[Any] | None,
+    ) -> tuple[ResponseCache | None, str | None]:
+        """Get the response cache and key for a prompt, (None, None) if not cached.
+
+        Prompts with conversation history are never cached.
+        """
+        if self.context is None or messages:
+            return None, None
+        cache = get_response_cache(self.context.cache_mode)
+        if cache is None:
+            return None, None
+        model_id = getattr(self.llm, "model_name", None) or type(self.llm).__name__
+        key = ResponseCache.make_key(
+            model_id, self.output_model.__name__, type(self)._class_system_prompt(), input_text
+        )
+        return cache, key
+
+    def _error_result(self, error: Exception) -> Any:
+        """Build the output returned when the LLM invocation fails."""
+        return AgentOutput(
+            success=False,
+            summary=f"Agent failed: {error}",
+            reasoning="LLM invocation error",
+            issues=[str(error)],
+        )
+
+    @staticmethod
+    def _format_previous_outputs(
         previous_outputs: dict[str, AgentOutput] | None,
+        architect_summary: str | None = None,
     ) -> str:
-        """Format previous agent outputs for context."""
+        """Format previous agent outputs for context.
+
+        The architect's output is replaced by ``architect_summary`` when
+        one is available.
+        """
         if not previous_outputs:
             return ""
 
         parts = ["## Previous Agent Outputs\n"]
 
-        for agent_name, output in previous_outputs.items():
+        # Sorted so the same outputs always render to the same prompt text
+        for agent_name, output in sorted(previous_outputs.items()):
             parts.append(f"### {agent_name.capitalize()}")
-            parts.append(f"**Summary:** {output.summary}")
-            parts.append(f"**Reasoning:** {output.reasoning[:500]}...")
+            if agent_name == "architect" and architect_summary:
+                parts.append(architect_summary)
+            else:
+                parts.append(_format_output_body(output))
+            parts.append("")
 
-            if output.file_changes:
-                parts.append("**Proposed Changes:**")
-                for fc in output.file_changes:
-                    parts.append(f"- `{fc.path}` ({fc.action}): {fc.description}")
+        return "\n".join(parts)
 
-            if output.recommendations:
-                parts.append("**Recommendations:**")
-                for rec in output.recommendations[:3]:
-                    parts.append(f"- {rec}")
 
-            parts.append("")
+def _uses_llm_cache(llm: Any) -> bool:
+    """Whether calls to ``llm`` go through an LLM cache."""
+    cache = getattr(llm, "cache", None)
+    if isinstance(cache, BaseCache):
+        return True
+    if cache is False:
+        return False
+    return get_llm_cache() is not None
 
-        return "\n".join(parts)
+
+def _has_file_change(message: Any) -> bool:
+    """Check whether a partial tool call already lists a file change.
+
+    Looks at the top-level ``file_changes`` and one level down, for outputs
+    grouping several roles.
+    """
+    for call in getattr(message, "tool_calls", None) or ():
+        args = call.get("args") or {}
+        if args.get("file_changes"):
+            return True
+        if any(isinstance(v, dict) and v.get("file_changes") for v in args.values()):
+            return True
+    return False
+
+
+async def _off_loop_if_large(size: int, func: Callable[..., T], *args: Any) -> T:
+    """Call ``func`` in a worker thread if the payload is large, else inline.
+
+    Parsing or dumping a large output on the event loop would stall the
+    other agents' streams; small payloads are not worth the thread hop.
+    """
+    if size > _OFFLOAD_BYTES:
+        return await asyncio.to_thread(func, *args)
+    return func(*args)
+
+
+def _message_size(message: Any) -> int:
+    """Size of the streamed tool call arguments in a response message."""
+    return sum(len(chunk.get("args") or "") for chunk in getattr(message, "tool_call_chunks", ()))
+
+
+def _cache_response(cache: ResponseCache, key: str, result: BaseModel) -> None:
+    """Serialize and store a parsed response (runs in a worker thread)."""
+    cache.put(key, result.model_dump_json())
+
+
+def _partial_file_changes(message: Any) -> list[Any]:
+    """Get the file changes listed so far in a partial tool call."""
+    for call in getattr(message, "tool_calls", None) or ():
+        changes = (call.get("args") or {}).get("file_changes")
+        if isinstance(changes, list):
+            return changes
+    return []
+
+
+def _format_output_body(output: AgentOutput) -> str:
+    """Format an agent output for downstream prompts.
+
+    The result is cached on the output, so the parallel agents sharing
+    the architect's output format it only once.
+    """
+    if output._prompt_body is None:
+        parts = [
+            f"**Summary:** {output.summary}",
+            f"**Reasoning:** {output.reasoning[:500]}...",
+        ]
+
+        if output.file_changes:
+            parts.append("**Proposed Changes:**")
+            for fc in output.file_changes:
+                parts.append(f"- `{fc.path}` ({fc.action}): {fc.description}")
+
+        if output.recommendations:
+            parts.append("**Recommendations:**")
+            for rec in output.recommendations[:3]:
+                parts.append(f"- {rec}")
+
+        output._prompt_body = "\n".join(parts)
+
+    return output._prompt_body
+
+
+def summarize_architect_output(output: AgentOutput, max_reasoning: int = 300) -> str:
+    """Condense the architect's output into a short memory for later agents.
+
+    Keeps the summary, the opening paragraph of the reasoning (where the
+    design decisions are stated) and the planned file changes as compact
+    JSON. File contents and recommendations are dropped.
+
+    Args:
+        output: The architect's output
+        max_reasoning: Maximum characters of reasoning to keep
+
+    Returns:
+        The summary as markdown
+    """
+    decisions = output.reasoning.strip().split("\n\n", 1)[0]
+    if len(decisions) > max_reasoning:
+        decisions = decisions[:max_reasoning].rstrip() + "..."
+
+    parts = [f"**Summary:** {output.summary}"]
+    if decisions:
+        parts.append(f"**Key Decisions:** {decisions}")
+    if output.file_changes:
+        planned = [
+            {"path": fc.path, "action": fc.action, "description": fc.description}
+            for fc in output.file_changes
+        ]
+        parts.append(f"**Planned Changes:** {orjson.dumps(planned).decode()}")
+    return "\n".join(parts)
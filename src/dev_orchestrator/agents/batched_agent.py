@@ -0,0 +1,119 @@
+"""Batched Parallel Agent - Implementer, Tester and Documenter in one request.
+
+Responsible for:
+- Producing the three parallel-phase outputs from a single LLM call
+- Sending the shared repository context and architect output only once
+"""
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from .base_agent import AgentOutput, BaseAgent
+from .documenter_agent import DocumenterAgent
+from .implementer_agent import ImplementerAgent
+from .tester_agent import TesterAgent
+
+
+class ParallelOutputs(BaseModel):
+    """Structured output holding one result per parallel-phase role."""
+
+    implementer: AgentOutput = Field(description="Output of the Implementer role")
+    tester: AgentOutput = Field(description="Output of the Tester role")
+    documenter: AgentOutput = Field(description="Output of the Documenter role")
+
+    @property
+    def summary(self) -> str:
+        """Combined one-line summary of the three roles."""
+        return " | ".join(
+            f"{name}: {getattr(self, name).summary}"
+            for name in ("implementer", "tester", "documenter")
+        )
+
+
+class BatchedParallelAgent(BaseAgent):
+    """Runs the parallel N phase of the 1-N-1 workflow as one request.
+
+    The role prompts are concatenated into one system prompt so the
+    repository context and architect output are paid for once instead
+    of three times.
+    """
+
+    name = "parallel"
+    description = "Implements, tests and documents in a single request"
+    output_model = ParallelOutputs
+
+    roles: tuple[type[BaseAgent], ...] = (ImplementerAgent, TesterAgent, DocumenterAgent)
+
+    @property
+    def system_prompt(self) -> str:
+        sections = [
+            "You play three roles at once: Implementer, Tester and Documenter.",
+            "Produce one independent output per role, following each role's instructions.",
+        ]
+        for role in self.roles:
+            sections.append(
+                f"===== ROLE: {role.name.upper()} =====\n{role._class_system_prompt()}"
+            )
+        return "\n\n".join(sections)
+
+    async def execute(
+        self,
+        goal: str,
+        repo_context: dict[str, Any],
+        previous_outputs: dict[str, AgentOutput] | None = None,
+        architect_summary: str | None = None,
+        pre_formatted_previous: str | None = None,
+    ) -> ParallelOutputs:
+        """Implement, test and document the goal in one LLM call.
+
+        Args:
+            goal: The goal to accomplish
+            repo_context: Context about the repository
+            previous_outputs: Should contain architect_output
+            architect_summary: Compact architect memory, preferred over its full output
+            pre_formatted_previous: Rendered previous_outputs, used instead of formatting them
+
+        Returns:
+            One AgentOutput per parallel role
+        """
+        self.log("INFO", f"Running batched parallel phase: {goal[:50]}...")
+
+        context_str = self._format_repo_context(repo_context)
+        prev_str = (
+            pre_formatted_previous
+            if pre_formatted_previous is not None
+            else self._format_previous_outputs(previous_outputs, architect_summary)
+        )
+
+        input_text = f"""## Your Task
+Based on the Architect's design, fill in all three outputs:
+
+- **implementer**: complete code changes (full file contents, create/modify)
+- **tester**: complete test files covering the implementation (pytest)
+- **documenter**: README/CHANGELOG and other documentation updates
+
+Each role reports its own summary, reasoning, file changes, recommendations and issues.
+
+{prev_str}
+
+## Repository Context
+{context_str}
+
+## Goal
+{goal}"""
+
+        result = await self._invoke_llm(input_text)
+
+        self.log(
+            "INFO",
+            f"Batched phase complete: {len(result.implementer.file_changes)} code, "
+            f"{len(result.tester.file_changes)} test, "
+            f"{len(result.documenter.file_changes)} doc files",
+        )
+        return result
+
+    def _error_result(self, error: Exception) -> ParallelOutputs:
+        """Fail all three roles with the same error."""
+        failed = super()._error_result(error)
+        return ParallelOutputs(implementer=failed, tester=failed, documenter=failed)
@@ -7,24 +7,13 @@ Responsible for:
 - Adding inline documentation
 """
 
-from typing import Any
+import sys
+from typing import Any, Final
 
 from .base_agent import AgentOutput, BaseAgent
 
-
-class DocumenterAgent(BaseAgent):
-    """Documenter agent for documentation tasks.
-
-    Part of the parallel N phase in 1-N-1 workflow.
-    Creates documentation based on the implementation.
-    """
-
-    name = "documenter"
-    description = "Creates and updates documentation"
-
-    @property
-    def system_prompt(self) -> str:
-        return """You are an expert Technical Documentation agent. Your role is to:
+SYSTEM_PROMPT: Final[str] = sys.intern(
+    """You are an expert Technical Documentation agent. Your role is to:
 
 1. **Document** new features and changes clearly
 2. **Update** existing documentation to reflect changes
@@ -63,12 +52,27 @@ You will receive:
 - Implementer's code (if available)
 
 Create documentation that helps users understand and use the new features."""
+)
+
+
+class DocumenterAgent(BaseAgent):
+    """Documenter agent for documentation tasks.
+
+    Part of the parallel N phase in 1-N-1 workflow.
+    Creates documentation based on the implementation.
+    """
+
+    name = "documenter"
+    description = "Creates and updates documentation"
+    system_prompt = SYSTEM_PROMPT
 
     async def execute(
         self,
         goal: str,
         repo_context: dict[str, Any],
         previous_outputs: dict[str, AgentOutput] | None = None,
+        architect_summary: str | None = None,
+        pre_formatted_previous: str | None = None,
     ) -> AgentOutput:
         """Create documentation for the implementation.
 
@@ -76,6 +80,8 @@ Create documentation that helps users understand and use the new features."""
             goal: The goal to accomplish
             repo_context: Context about the repository
             previous_outputs: Outputs from architect and possibly implementer
+            architect_summary: Compact architect memory, preferred over its full output
+            pre_formatted_previous: Rendered previous_outputs, used instead of formatting them
 
         Returns:
             Documentation changes
@@ -83,17 +89,13 @@ Create documentation that helps users understand and use the new features."""
         self.log("INFO", f"Documenting: {goal[:50]}...")
 
         context_str = self._format_repo_context(repo_context)
-        prev_str = self._format_previous_outputs(previous_outputs)
-
-        input_text = f"""## Goal
-{goal}
-
-## Repository Context
-{context_str}
+        prev_str = (
+            pre_formatted_previous
+            if pre_formatted_previous is not None
+            else self._format_previous_outputs(previous_outputs, architect_summary)
+        )
 
-{prev_str}
-
-## Your Task
+        input_text = f"""## Your Task
 Create or update documentation for the implementation:
 
 1. Review the design and implementation
@@ -108,7 +110,15 @@ For each documentation file, provide:
 - Full content or the sections to add/update
 - Description of the documentation change
 
-Make documentation clear, helpful, and consistent with the project style."""
+Make documentation clear, helpful, and consistent with the project style.
+
+{prev_str}
+
+## Repository Context
+{context_str}
+
+## Goal
+{goal}"""
 
         result = await self._invoke_llm(input_text)
 
@@ -7,24 +7,13 @@ Responsible for:
 - Producing working, clean code
 """
 
-from typing import Any
+import sys
+from typing import Any, Final
 
 from .base_agent import AgentOutput, BaseAgent
 
-
-class ImplementerAgent(BaseAgent):
-    """Implementer agent for code generation.
-
-    Part of the parallel N phase in 1-N-1 workflow.
-    Receives guidance from Architect and produces code changes.
-    """
-
-    name = "implementer"
-    description = "Writes and modifies code"
-
-    @property
-    def system_prompt(self) -> str:
-        return """You are an expert Software Developer agent. Your role is to:
+SYSTEM_PROMPT: Final[str] = sys.intern(
+    """You are an expert Software Developer agent. Your role is to:
 
 1. **Implement** code based on the Architect's design
 2. **Write** clean, maintainable, well-documented code
@@ -64,12 +53,27 @@ You will receive:
 - Architect's analysis and recommendations
 
 Implement the solution following the Architect's guidance."""
+)
+
+
+class ImplementerAgent(BaseAgent):
+    """Implementer agent for code generation.
+
+    Part of the parallel N phase in 1-N-1 workflow.
+    Receives guidance from Architect and produces code changes.
+    """
+
+    name = "implementer"
+    description = "Writes and modifies code"
+    system_prompt = SYSTEM_PROMPT
 
     async def execute(
         self,
         goal: str,
         repo_context: dict[str, Any],
         previous_outputs: dict[str, AgentOutput] | None = None,
+        architect_summary: str | None = None,
+        pre_formatted_previous: str | None = None,
     ) -> AgentOutput:
         """Implement code changes.
 
@@ -77,6 +81,8 @@ Implement the solution following the Architect's guidance."""
             goal: The goal to accomplish
             repo_context: Context about the repository
             previous_outputs: Should contain architect_output
+            architect_summary: Compact architect memory, preferred over its full output
+            pre_formatted_previous: Rendered previous_outputs, used instead of formatting them
 
         Returns:
             Code implementation with file changes
@@ -84,17 +90,13 @@ Implement the solution following the Architect's guidance."""
         self.log("INFO", f"Implementing: {goal[:50]}...")
 
         context_str = self._format_repo_context(repo_context)
-        prev_str = self._format_previous_outputs(previous_outputs)
-
-        input_text = f"""## Goal
-{goal}
-
-## Repository Context
-{context_str}
+        prev_str = (
+            pre_formatted_previous
+            if pre_formatted_previous is not None
+            else self._format_previous_outputs(previous_outputs, architect_summary)
+        )
 
-{prev_str}
-
-## Your Task
+        input_text = f"""## Your Task
 Based on the Architect's design, implement the required code changes:
 
 1. Create any new files needed
@@ -109,7 +111,15 @@ For each file change, provide:
 - Full file content
 - Brief description
 
-Make sure the code is production-ready and follows best practices."""
+Make sure the code is production-ready and follows best practices.
+
+{prev_str}
+
+## Repository Context
+{context_str}
+
+## Goal
+{goal}"""
 
         result = await self._invoke_llm(input_text)
 
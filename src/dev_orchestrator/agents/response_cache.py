@@ -0,0 +1,173 @@
+"""Response cache - on-disk store of structured agent responses.
+
+Responsible for:
+- Answering repeated agent prompts without an LLM call
+- Sharing responses across runs and agents through one SQLite file
+- Keeping that file under a size cap by evicting the least used responses
+"""
+
+import hashlib
+import sqlite3
+import threading
+from collections import Counter, OrderedDict
+from pathlib import Path
+
+from ..core.config import get_config
+
+# Supported RunContext.cache_mode values
+CACHE_MODES = ("off", "exact")
+
+# Payloads kept in memory per cache, most recently used last
+MEMORY_ENTRIES = 128
+
+# Payload size in bytes, as stored
+_SIZE = "length(CAST(payload AS BLOB))"
+
+_caches: dict[Path, "ResponseCache"] = {}
+
+
+class ResponseCache:
+    """Exact-match cache of agent responses keyed by prompt hash.
+
+    A new connection is opened per operation, so the cache can be used
+    from worker threads. The most recently used payloads are also kept in
+    memory, so hot prompts skip the database.
+
+    Hits are counted, in memory and written to the database with the next
+    put. When a new payload takes the stored payloads over max_bytes, the
+    least hit of the other payloads (oldest first among equals) are deleted
+    until they fit again.
+    """
+
+    def __init__(self, path: Path, max_bytes: int | None = None):
+        """Initialize cache.
+
+        Args:
+            path: SQLite database file (created if missing)
+            max_bytes: Cap on the stored payloads' total size (None = no cap)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self._hits: Counter[str] = Counter()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, payload TEXT NOT NULL, hits INTEGER NOT NULL DEFAULT 0)"
+        )
+
+    def _execute(self, sql: str, params: tuple[str | int, ...] = ()) -> list[tuple]:
+        """Run one statement in its own committed transaction."""
+        conn = sqlite3.connect(self.path)
+        try:
+            with conn:
+                return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def _executemany(self, sql: str, rows: list[tuple[str | int, ...]]) -> None:
+        """Run one statement per row in a single committed transaction."""
+        conn = sqlite3.connect(self.path)
+        try:
+            with conn:
+                conn.executemany(sql, rows)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the prompt parts into a cache key."""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Get a cached payload, or None on a miss."""
+        with self._memory_lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                self._hits[key] += 1
+                return payload
+
+        rows = self._execute("SELECT payload FROM responses WHERE key = ?", (key,))
+        if not rows:
+            return None
+        with self._memory_lock:
+            self._hits[key] += 1
+        self._remember(key, rows[0][0])
+        return rows[0][0]
+
+    def put(self, key: str, payload: str) -> None:
+        """Store a payload, replacing any previous one but keeping its hits."""
+        self._execute(
+            "INSERT INTO responses (key, payload) VALUES (?, ?)"
+            " ON CONFLICT (key) DO UPDATE SET payload = excluded.payload",
+            (key, payload),
+        )
+        self._remember(key, payload)
+        self._flush_hits()
+        if self.max_bytes is not None:
+            self._evict(self.max_bytes, keep=key)
+
+    def _flush_hits(self) -> None:
+        """Add the hits counted since the last put to the database."""
+        with self._memory_lock:
+            hits, self._hits = self._hits, Counter()
+        if hits:
+            self._executemany(
+                "UPDATE responses SET hits = hits + ? WHERE key = ?",
+                [(count, key) for key, count in hits.items()],
+            )
+
+    def _evict(self, max_bytes: int, keep: str) -> None:
+        """Delete the least hit payloads but keep's until the rest fit in max_bytes."""
+        [(total,)] = self._execute(f"SELECT COALESCE(SUM({_SIZE}), 0) FROM responses")
+        if total <= max_bytes:
+            return
+        # Delete rows, in eviction order, while the size of the rows before
+        # them is still short of the excess
+        evicted = self._execute(
+            "DELETE FROM responses WHERE key IN ("
+            f"SELECT key FROM (SELECT key, SUM({_SIZE}) OVER (ORDER BY hits, rowid) - {_SIZE}"
+            " AS before FROM responses WHERE key != ?) WHERE before < ?) RETURNING key",
+            (keep, total - max_bytes),
+        )
+        with self._memory_lock:
+            for (key,) in evicted:
+                self._memory.pop(key, None)
+                self._hits.pop(key, None)
+
+    def _remember(self, key: str, payload: str) -> None:
+        """Keep a payload in memory, evicting the least recently used."""
+        with self._memory_lock:
+            self._memory[key] = payload
+            self._memory.move_to_end(key)
+            if len(self._memory) > MEMORY_ENTRIES:
+                self._memory.popitem(last=False)
+
+
+def get_response_cache(mode: str) -> ResponseCache | None:
+    """Get the shared response cache for a cache mode.
+
+    Args:
+        mode: One of CACHE_MODES
+
+    Returns:
+        The cache in the configured cache directory, or None when off
+    """
+    if mode not in CACHE_MODES:
+        raise ValueError(f"Unknown cache mode: {mode!r} (expected one of {CACHE_MODES})")
+    if mode == "off":
+        return None
+
+    config = get_config()
+    path = config.cache_dir / "agent_responses.sqlite3"
+    cache = _caches.get(path)
+    if cache is None:
+        max_bytes = config.cache_max_mb * 1024 * 1024 if config.cache_max_mb else None
+        cache = _caches[path] = ResponseCache(path, max_bytes)
+    return cache
@@ -7,24 +7,14 @@ Responsible for:
 - Quality assurance
 """
 
-from typing import Any
+import sys
+from collections.abc import Iterable
+from typing import Any, Final
 
 from .base_agent import AgentOutput, BaseAgent, FileChange
 
-
-class ReviewerAgent(BaseAgent):
-    """Reviewer agent for final review and aggregation.
-
-    Final "1" in the 1-N-1 workflow.
-    Reviews outputs from all agents and creates final recommendations.
-    """
-
-    name = "reviewer"
-    description = "Reviews and aggregates all changes"
-
-    @property
-    def system_prompt(self) -> str:
-        return """You are an expert Code Reviewer agent. Your role is to:
+SYSTEM_PROMPT: Final[str] = sys.intern(
+    """You are an expert Code Reviewer agent. Your role is to:
 
 1. **Review** all proposed changes from other agents
 2. **Identify** conflicts or inconsistencies
@@ -69,12 +59,73 @@ You will receive outputs from:
 - Documenter: Documentation updates
 
 Synthesize these into a final, approved change set."""
+)
+
+
+class OutputAggregate:
+    """Running merge of agent outputs.
+
+    File changes are deduplicated by path (a later output's change wins,
+    and interned paths make the lookups identity compares); issues and
+    recommendations are deduplicated keeping first-seen order.
+    """
+
+    __slots__ = ("_changes_by_path", "_issues", "_recommendations")
+
+    def __init__(self, outputs: Iterable[AgentOutput] = ()):
+        """Initialize aggregate.
+
+        Args:
+            outputs: Agent outputs to merge, in workflow order
+        """
+        self._changes_by_path: dict[str, FileChange] = {}
+        self._issues: dict[str, None] = {}
+        self._recommendations: dict[str, None] = {}
+        for output in outputs:
+            self.add(output)
+
+    def add(self, output: AgentOutput) -> None:
+        """Merge one more output, after the ones already added."""
+        for fc in output.file_changes:
+            self._changes_by_path[fc.path] = fc
+        self._issues.update(dict.fromkeys(output.issues))
+        self._recommendations.update(dict.fromkeys(output.recommendations))
+
+    @property
+    def file_changes(self) -> list[FileChange]:
+        """Latest change per path."""
+        return list(self._changes_by_path.values())
+
+    @property
+    def issues(self) -> list[str]:
+        """Distinct issues."""
+        return list(self._issues)
+
+    @property
+    def recommendations(self) -> list[str]:
+        """Distinct recommendations."""
+        return list(self._recommendations)
+
+
+class ReviewerAgent(BaseAgent):
+    """Reviewer agent for final review and aggregation.
+
+    Final "1" in the 1-N-1 workflow.
+    Reviews outputs from all agents and creates final recommendations.
+    """
+
+    name = "reviewer"
+    description = "Reviews and aggregates all changes"
+    system_prompt = SYSTEM_PROMPT
 
     async def execute(
         self,
         goal: str,
         repo_context: dict[str, Any],
         previous_outputs: dict[str, AgentOutput] | None = None,
+        architect_summary: str | None = None,
+        pre_formatted_previous: str | None = None,
+        aggregate: OutputAggregate | None = None,
     ) -> AgentOutput:
         """Review and aggregate all agent outputs.
 
@@ -82,40 +133,32 @@ Synthesize these into a final, approved change set."""
             goal: The goal to accomplish
             repo_context: Context about the repository
             previous_outputs: All previous agent outputs
+            architect_summary: Compact architect memory, preferred over its full output
+            pre_formatted_previous: Rendered previous_outputs, used instead of formatting them
+            aggregate: previous_outputs already merged by the caller
 
         Returns:
             Final reviewed and aggregated changes
         """
         self.log("INFO", "Reviewing all changes...")
 
-        prev_str = self._format_previous_outputs(previous_outputs)
-
-        # Collect all file changes from previous agents
-        all_changes: list[FileChange] = []
-        all_issues: list[str] = []
+        prev_str = (
+            pre_formatted_previous
+            if pre_formatted_previous is not None
+            else self._format_previous_outputs(previous_outputs, architect_summary)
+        )
 
-        if previous_outputs:
-            for output in previous_outputs.values():
-                all_changes.extend(output.file_changes)
-                all_issues.extend(output.issues)
+        # Collect all file changes from previous agents, one per path
+        if aggregate is None:
+            aggregate = OutputAggregate((previous_outputs or {}).values())
+        all_changes, all_issues = aggregate.file_changes, aggregate.issues
 
         changes_summary = "\n".join(
             f"- `{fc.path}` ({fc.action}): {fc.description}"
             for fc in all_changes
         ) if all_changes else "No file changes proposed."
 
-        input_text = f"""## Goal
-{goal}
-
-{prev_str}
-
-## All Proposed File Changes
-{changes_summary}
-
-## Known Issues from Agents
-{chr(10).join(f"- {issue}" for issue in all_issues) if all_issues else "No issues reported."}
-
-## Your Task
+        input_text = f"""## Your Task
 1. Review all proposed changes for quality and consistency
 2. Identify any conflicts or issues
 3. Resolve conflicts by choosing or merging the best approaches
@@ -129,7 +172,18 @@ Provide:
 4. Recommended commit message
 5. Go/No-Go recommendation
 
-Be thorough but decisive. The goal is to produce a working, high-quality result."""
+Be thorough but decisive. The goal is to produce a working, high-quality result.
+
+{prev_str}
+
+## All Proposed File Changes
+{changes_summary}
+
+## Known Issues from Agents
+{chr(10).join(f"- {issue}" for issue in all_issues) if all_issues else "No issues reported."}
+
+## Goal
+{goal}"""
 
         result = await self._invoke_llm(input_text)
 
@@ -139,3 +193,4 @@ Be thorough but decisive. The goal is to produce a working, high-quality result.
 
         self.log("INFO", f"Review complete: {len(result.file_changes)} files approved")
         return result
+
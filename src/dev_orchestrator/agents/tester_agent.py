@@ -7,24 +7,13 @@ Responsible for:
 - Identifying edge cases
 """
 
-from typing import Any
+import sys
+from typing import Any, Final
 
 from .base_agent import AgentOutput, BaseAgent
 
-
-class TesterAgent(BaseAgent):
-    """Tester agent for test generation.
-
-    Part of the parallel N phase in 1-N-1 workflow.
-    Creates tests based on Architect's design and Implementer's code.
-    """
-
-    name = "tester"
-    description = "Creates tests and validates code"
-
-    @property
-    def system_prompt(self) -> str:
-        return """You are an expert Software Testing agent. Your role is to:
+SYSTEM_PROMPT: Final[str] = sys.intern(
+    """You are an expert Software Testing agent. Your role is to:
 
 1. **Create** comprehensive tests for new and modified code
 2. **Validate** that implementations meet requirements
@@ -65,12 +54,27 @@ You will receive:
 - Implementer's code (if available)
 
 Create tests that fully validate the implementation."""
+)
+
+
+class TesterAgent(BaseAgent):
+    """Tester agent for test generation.
+
+    Part of the parallel N phase in 1-N-1 workflow.
+    Creates tests based on Architect's design and Implementer's code.
+    """
+
+    name = "tester"
+    description = "Creates tests and validates code"
+    system_prompt = SYSTEM_PROMPT
 
     async def execute(
         self,
         goal: str,
         repo_context: dict[str, Any],
         previous_outputs: dict[str, AgentOutput] | None = None,
+        architect_summary: str | None = None,
+        pre_formatted_previous: str | None = None,
     ) -> AgentOutput:
         """Create tests for the implementation.
 
@@ -78,6 +82,8 @@ Create tests that fully validate the implementation."""
             goal: The goal to accomplish
             repo_context: Context about the repository
             previous_outputs: Should contain architect_output, maybe implementer_output
+            architect_summary: Compact architect memory, preferred over its full output
+            pre_formatted_previous: Rendered previous_outputs, used instead of formatting them
 
         Returns:
             Test files and validation results
@@ -85,17 +91,13 @@ Create tests that fully validate the implementation."""
         self.log("INFO", f"Creating tests for: {goal[:50]}...")
 
         context_str = self._format_repo_context(repo_context)
-        prev_str = self._format_previous_outputs(previous_outputs)
-
-        input_text = f"""## Goal
-{goal}
-
-## Repository Context
-{context_str}
+        prev_str = (
+            pre_formatted_previous
+            if pre_formatted_previous is not None
+            else self._format_previous_outputs(previous_outputs, architect_summary)
+        )
 
-{prev_str}
-
-## Your Task
+        input_text = f"""## Your Task
 Create comprehensive tests for the implementation:
 
 1. Analyze the Architect's design and any implementation code
@@ -113,7 +115,15 @@ Include test commands that should be run:
 - pytest command with appropriate flags
 - Any setup needed before testing
 
-Ensure tests are comprehensive and would catch common bugs."""
+Ensure tests are comprehensive and would catch common bugs.
+
+{prev_str}
+
+## Repository Context
+{context_str}
+
+## Goal
+{goal}"""
 
         result = await self._invoke_llm(input_text)
 
@@ -7,16 +7,30 @@ N. Implementer, Tester, Documenter (parallel execution)
 """
 
 import asyncio
+import functools
 from typing import Any, Literal
 
+from langchain_core.caches import BaseCache, InMemoryCache
+from langchain_core.globals import get_llm_cache, set_llm_cache
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, StateGraph
-
-from .base_agent import AgentOutput, AgentState
+from langgraph.graph.state import CompiledStateGraph
+
+from .base_agent import (
+    AgentOutput,
+    AgentState,
+    BaseAgent,
+    FileChange,
+    format_repo_context,
+    summarize_architect_output,
+)
 from .architect_agent import ArchitectAgent
 from .implementer_agent import ImplementerAgent
 from .tester_agent import TesterAgent
 from .documenter_agent import DocumenterAgent
-from .reviewer_agent import ReviewerAgent
+from .reviewer_agent import OutputAggregate, ReviewerAgent
+from .batched_agent import BatchedParallelAgent
+from ..core.llm_config import get_llm_config
 from ..core.run_context import RunContext
 
 
@@ -35,6 +49,10 @@ def create_initial_state(
     Returns:
         Initial AgentState
     """
+    # Format the repository context once; every agent reuses the string
+    if "_formatted" not in repo_context:
+        repo_context = {**repo_context, "_formatted": format_repo_context(repo_context)}
+
     return AgentState(
         goal=goal,
         repo_path=repo_path,
@@ -44,6 +62,7 @@ def create_initial_state(
         tester_output=None,
         documenter_output=None,
         reviewer_output=None,
+        architect_summary="",
         all_file_changes=[],
         all_issues=[],
         all_recommendations=[],
@@ -53,70 +72,283 @@ def create_initial_state(
     )
 
 
-async def architect_node(state: AgentState, context: RunContext | None = None) -> AgentState:
+async def architect_node(
+    state: AgentState,
+    context: RunContext | None = None,
+    agent: ArchitectAgent | None = None,
+    next_agents: tuple[BaseAgent, ...] = (),
+    config: RunnableConfig | None = None,
+) -> AgentState:
     """Execute architect agent.
 
-    Phase 1: Analyze and design.
+    Phase 1: Analyze and design. ``next_agents`` are prepared while the
+    architect's response is still streaming, once it lists file changes.
+    Agents not bound to the node are taken from the run's configurable.
     """
-    agent = ArchitectAgent(context=context)
+    agent = agent or _configured(config, "architect") or ArchitectAgent(context=context)
+    next_agents = next_agents or _configured(config, "parallel_agents") or ()
 
-    output = await agent.execute(
+    execution = asyncio.create_task(agent.execute(
         goal=state["goal"],
         repo_context=state.get("repo_context", {}),
-    )
+    ))
+    if next_agents:
+        await _prepare_during(execution, agent.first_file_change, next_agents)
+    output = await execution
 
     return {
         **state,
         "architect_output": output,
+        "architect_summary": summarize_architect_output(output),
         "current_phase": "architect_done",
     }
 
 
-async def parallel_agents_node(state: AgentState, context: RunContext | None = None) -> AgentState:
-    """Execute implementer, tester, and documenter in parallel.
+def create_parallel_agents(context: RunContext | None = None) -> tuple[BaseAgent, ...]:
+    """Create the agents of the parallel phase.
 
-    Phase N: Parallel execution.
+    Returns:
+        (BatchedParallelAgent,) in batched mode, otherwise
+        (ImplementerAgent, TesterAgent, DocumenterAgent)
     """
-    # Get architect's output for context
-    previous_outputs = {}
-    if state.get("architect_output"):
-        previous_outputs["architect"] = state["architect_output"]
+    if get_llm_config().batch_parallel_agents:
+        return (BatchedParallelAgent(context=context),)
+    return (
+        ImplementerAgent(context=context),
+        TesterAgent(context=context),
+        DocumenterAgent(context=context),
+    )
 
-    # Create agents
-    implementer = ImplementerAgent(context=context)
-    tester = TesterAgent(context=context)
-    documenter = DocumenterAgent(context=context)
 
-    # Execute in parallel
-    results = await asyncio.gather(
-        implementer.execute(
-            goal=state["goal"],
-            repo_context=state.get("repo_context", {}),
-            previous_outputs=previous_outputs,
-        ),
-        tester.execute(
-            goal=state["goal"],
-            repo_context=state.get("repo_context", {}),
-            previous_outputs=previous_outputs,
-        ),
-        documenter.execute(
-            goal=state["goal"],
-            repo_context=state.get("repo_context", {}),
-            previous_outputs=previous_outputs,
+# Parallel-phase agents and the agents whose outputs each one needs. Every
+# agent starts as soon as its dependencies finish, so the documenter
+# overlaps the implementer and tester.
+AGENT_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "implementer": ("architect",),
+    "tester": ("implementer",),
+    "documenter": ("architect",),
+}
+
+# Dependencies whose first streamed file change is enough to start on: the
+# tester starts with the implementer's changes streamed so far.
+STREAMED_DEPENDENCIES = frozenset({"implementer"})
+
+
+async def parallel_agents_node(
+    state: AgentState,
+    context: RunContext | None = None,
+    agents: tuple[BaseAgent, ...] | None = None,
+    config: RunnableConfig | None = None,
+) -> AgentState:
+    """Execute implementer, tester, and documenter in parallel.
+
+    Phase N: Parallel execution, scheduled by AGENT_DEPENDENCIES.
+    """
+    agents = agents or _configured(config, "parallel_agents") or create_parallel_agents(context)
+
+    # Agents in this phase see full contents only for the files in the design
+    phase_state = {
+        **state,
+        "repo_context": focus_repo_context(
+            state.get("repo_context", {}), state.get("architect_output")
         ),
-        return_exceptions=True,
-    )
+    }
+
+    if isinstance(agents[0], BatchedParallelAgent):
+        # Get architect's output for context
+        previous_outputs = {}
+        if state.get("architect_output"):
+            previous_outputs["architect"] = state["architect_output"]
+        result = await _batched_parallel_agents(phase_state, previous_outputs, context, agents[0])
+        return {**result, "repo_context": state.get("repo_context", {})}
 
-    # Process results
-    implementer_output = results[0] if not isinstance(results[0], Exception) else _error_output("implementer", results[0])
-    tester_output = results[1] if not isinstance(results[1], Exception) else _error_output("tester", results[1])
-    documenter_output = results[2] if not isinstance(results[2], Exception) else _error_output("documenter", results[2])
+    outputs = await run_dag(phase_state, context, {agent.name: agent for agent in agents})
 
     return {
         **state,
-        "implementer_output": implementer_output,
-        "tester_output": tester_output,
-        "documenter_output": documenter_output,
+        "implementer_output": outputs["implementer"],
+        "tester_output": outputs["tester"],
+        "documenter_output": outputs["documenter"],
+        "current_phase": "parallel_done",
+    }
+
+
+def focus_repo_context(
+    repo_context: dict[str, Any],
+    architect_output: AgentOutput | None,
+) -> dict[str, Any]:
+    """Narrow the formatted repository context to the architect's design.
+
+    Files the architect plans to change keep their full (truncated)
+    contents; all other files are cut down to their head.
+
+    Args:
+        repo_context: Repository context
+        architect_output: Architect output, if any
+
+    Returns:
+        Repository context with a focused ``_formatted`` prompt section
+    """
+    if architect_output is None or not repo_context:
+        return repo_context
+    paths = {fc.path for fc in architect_output.file_changes}
+    formatted = format_repo_context(repo_context, full_contents_for=paths)
+    return {**repo_context, "_formatted": formatted}
+
+
+async def run_dag(
+    state: AgentState,
+    context: RunContext | None = None,
+    agents: dict[str, BaseAgent] | None = None,
+) -> dict[str, AgentOutput]:
+    """Run the parallel-phase agents in dependency order.
+
+    Each agent is launched in the task group right away and waits only on
+    the agents it depends on. It receives the outputs of all its ancestors;
+    a STREAMED_DEPENDENCIES ancestor that is still running is waited on
+    only until its first file change, and is passed as an in-progress
+    output holding the changes streamed so far.
+
+    Args:
+        state: Workflow state after the architect phase
+        context: Run context for logging and the agent timeout
+        agents: Agent per AGENT_DEPENDENCIES name (created if None)
+
+    Returns:
+        Output per agent name
+    """
+    if agents is None:
+        agents = {
+            "implementer": ImplementerAgent(context=context),
+            "tester": TesterAgent(context=context),
+            "documenter": DocumenterAgent(context=context),
+        }
+    timeout = context.agent_timeout if context else None
+
+    outputs: dict[str, AgentOutput] = {}
+    if state.get("architect_output"):
+        outputs["architect"] = state["architect_output"]
+    # Set once an agent's dependents may start: when it finishes or, for
+    # streamed dependencies, when its first file change arrives
+    ready = {name: asyncio.Event() for name in AGENT_DEPENDENCIES}
+    streamed: dict[str, list[FileChange]] = {
+        name: [] for name in STREAMED_DEPENDENCIES if name in agents
+    }
+    # Previous outputs rendered once per set of ancestors, shared by the
+    # agents that depend on the same outputs
+    formatted_previous: dict[tuple[str, ...], str] = {}
+
+    async def collect(name: str, queue: asyncio.Queue[FileChange | None]) -> None:
+        while (change := await queue.get()) is not None:
+            streamed[name].append(change)
+            ready[name].set()
+
+    async def run_node(name: str) -> None:
+        try:
+            ancestors = _ancestors(name)
+            for dependency in ancestors:
+                if dependency in ready:
+                    await ready[dependency].wait()
+            previous_outputs = {
+                n: outputs[n] if n in outputs else _in_progress_output(n, streamed[n])
+                for n in ancestors
+                if n in outputs or n in streamed
+            }
+            key = tuple(previous_outputs)
+            if key not in formatted_previous:
+                formatted_previous[key] = BaseAgent._format_previous_outputs(
+                    previous_outputs, state.get("architect_summary")
+                )
+
+            implementer_output = previous_outputs.get("implementer")
+            if name == "tester" and implementer_output and not implementer_output.file_changes:
+                outputs[name] = _skipped_output(name, "the implementer made no file changes")
+            else:
+                outputs[name] = await _run_agent(
+                    name, agents[name], state, previous_outputs, formatted_previous[key], timeout
+                )
+        finally:
+            ready[name].set()
+            if name in streamed:
+                agents[name].file_change_queue.put_nowait(None)
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for name in streamed:
+                queue: asyncio.Queue[FileChange | None] = asyncio.Queue()
+                agents[name].file_change_queue = queue
+                tg.create_task(collect(name, queue))
+            for name in AGENT_DEPENDENCIES:
+                tg.create_task(run_node(name))
+    finally:
+        for name in streamed:
+            agents[name].file_change_queue = None
+
+    return outputs
+
+
+def _ancestors(name: str) -> list[str]:
+    """Get the transitive dependencies of an agent, nearest last."""
+    ancestors: list[str] = []
+    for dependency in AGENT_DEPENDENCIES.get(name, ()):
+        for ancestor in (*_ancestors(dependency), dependency):
+            if ancestor not in ancestors:
+                ancestors.append(ancestor)
+    return ancestors
+
+
+async def _run_agent(
+    name: str,
+    agent: BaseAgent,
+    state: AgentState,
+    previous_outputs: dict[str, AgentOutput],
+    pre_formatted_previous: str | None,
+    timeout: float | None,
+) -> AgentOutput:
+    """Execute one agent; failures and timeouts become error outputs."""
+    try:
+        async with asyncio.timeout(timeout):
+            return await agent.execute(
+                goal=state["goal"],
+                repo_context=state.get("repo_context", {}),
+                previous_outputs=previous_outputs,
+                architect_summary=state.get("architect_summary"),
+                pre_formatted_previous=pre_formatted_previous,
+            )
+    except TimeoutError:
+        return _error_output(name, TimeoutError(f"timed out after {timeout}s"))
+    except Exception as e:
+        return _error_output(name, e)
+
+
+async def _batched_parallel_agents(
+    state: AgentState,
+    previous_outputs: dict[str, AgentOutput],
+    context: RunContext | None = None,
+    agent: BatchedParallelAgent | None = None,
+) -> AgentState:
+    """Run the parallel phase as a single multi-role LLM request."""
+    agent = agent or BatchedParallelAgent(context=context)
+    timeout = context.agent_timeout if context else None
+
+    try:
+        async with asyncio.timeout(timeout):
+            outputs = await agent.execute(
+                goal=state["goal"],
+                repo_context=state.get("repo_context", {}),
+                previous_outputs=previous_outputs,
+                architect_summary=state.get("architect_summary"),
+            )
+    except TimeoutError:
+        outputs = agent._error_result(TimeoutError(f"timed out after {timeout}s"))
+    except Exception as e:
+        outputs = agent._error_result(e)
+
+    return {
+        **state,
+        "implementer_output": outputs.implementer,
+        "tester_output": outputs.tester,
+        "documenter_output": outputs.documenter,
         "current_phase": "parallel_done",
     }
 
@@ -126,8 +358,6 @@ async def reviewer_node(state: AgentState, context: RunContext | None = None) ->
 
     Phase 1 (final): Review and aggregate.
     """
-    agent = ReviewerAgent(context=context)
-
     # Collect all previous outputs
     previous_outputs = {}
     if state.get("architect_output"):
@@ -139,33 +369,32 @@ async def reviewer_node(state: AgentState, context: RunContext | None = None) ->
     if state.get("documenter_output"):
         previous_outputs["documenter"] = state["documenter_output"]
 
-    output = await agent.execute(
-        goal=state["goal"],
-        repo_context=state.get("repo_context", {}),
-        previous_outputs=previous_outputs,
-    )
-
-    # Aggregate all file changes
-    all_changes = []
-    all_issues = []
-    all_recommendations = []
-
-    for agent_output in previous_outputs.values():
-        all_changes.extend(agent_output.file_changes)
-        all_issues.extend(agent_output.issues)
-        all_recommendations.extend(agent_output.recommendations)
+    # Skip the LLM call when the earlier agents left nothing to review
+    aggregate = OutputAggregate(previous_outputs.values())
+    if not aggregate.file_changes and not aggregate.issues:
+        output = AgentOutput(
+            success=False,
+            summary="Nothing to review",
+            reasoning="No file changes or issues were produced by the previous agents",
+        )
+    else:
+        output = await ReviewerAgent(context=context).execute(
+            goal=state["goal"],
+            repo_context=state.get("repo_context", {}),
+            previous_outputs=previous_outputs,
+            architect_summary=state.get("architect_summary"),
+            aggregate=aggregate,
+        )
 
-    # Add reviewer's changes/issues
-    all_changes.extend(output.file_changes)
-    all_issues.extend(output.issues)
-    all_recommendations.extend(output.recommendations)
+    # All file changes, one per path; the reviewer's changes win
+    aggregate.add(output)
 
     return {
         **state,
         "reviewer_output": output,
-        "all_file_changes": all_changes,
-        "all_issues": all_issues,
-        "all_recommendations": all_recommendations,
+        "all_file_changes": aggregate.file_changes,
+        "all_issues": aggregate.issues,
+        "all_recommendations": aggregate.recommendations,
         "current_phase": "complete",
     }
 
@@ -180,52 +409,89 @@ def _error_output(agent_name: str, error: Exception) -> AgentOutput:
     )
 
 
-def create_workflow(context: RunContext | None = None) -> StateGraph:
+def _configured(config: RunnableConfig | None, key: str) -> Any:
+    """Get a per-run value from a node's configurable, None if unset."""
+    return ((config or {}).get("configurable") or {}).get(key)
+
+
+def _in_progress_output(agent_name: str, file_changes: list[FileChange]) -> AgentOutput:
+    """Create output for an agent that is still streaming its file changes."""
+    return AgentOutput(
+        success=True,
+        summary=f"{agent_name} in progress: {len(file_changes)} file change(s) so far",
+        reasoning="Agent is still running; only its completed file changes are known",
+        file_changes=list(file_changes),
+    )
+
+
+def _skipped_output(agent_name: str, reason: str) -> AgentOutput:
+    """Create output for an agent that was not run."""
+    return AgentOutput(
+        success=True,
+        summary=f"{agent_name} skipped: {reason}",
+        reasoning="Agent was not run because it had no useful work",
+    )
+
+
+def route_after_architect(state: AgentState) -> Literal["parallel_agents", "reviewer"]:
+    """Route to the reviewer directly when the architect failed."""
+    architect_output = state.get("architect_output")
+    if architect_output is not None and not architect_output.success:
+        return "reviewer"
+    return "parallel_agents"
+
+
+def create_workflow(
+    context: RunContext | None = None,
+    architect: ArchitectAgent | None = None,
+    parallel_agents: tuple[BaseAgent, ...] | None = None,
+) -> StateGraph:
     """Create the LangGraph workflow for multi-agent orchestration.
 
     Workflow:
         [START] -> architect -> parallel_agents -> reviewer -> [END]
 
+    A failed architect routes straight to the reviewer.
+
     The parallel_agents node internally runs:
         - Implementer
-        - Tester
+        - Tester (from the implementer's first streamed file change)
         - Documenter
-    in parallel using asyncio.gather.
+    in an asyncio.TaskGroup following AGENT_DEPENDENCIES, each bounded
+    by the run's agent_timeout.
+
+    The graph can be compiled once and reused: agents that are not bound
+    here are read from the ``architect`` and ``parallel_agents`` keys of
+    each run's configurable (see run_workflow).
 
     Args:
         context: Run context for logging
+        architect: Architect agent to use (per run if None)
+        parallel_agents: Parallel-phase agents, prepared while the
+            architect runs (per run if None)
 
     Returns:
-        Compiled LangGraph StateGraph
+        Uncompiled LangGraph StateGraph
     """
     # Create the graph
     workflow = StateGraph(AgentState)
 
-    # Add nodes with context binding
+    # Nodes are coroutine functions with the run's context bound
     workflow.add_node(
         "architect",
-        lambda state: asyncio.get_event_loop().run_until_complete(
-            architect_node(state, context)
-        ) if not asyncio.get_event_loop().is_running() else architect_node(state, context)
+        functools.partial(
+            architect_node, context=context, agent=architect, next_agents=parallel_agents or ()
+        ),
     )
-
     workflow.add_node(
         "parallel_agents",
-        lambda state: asyncio.get_event_loop().run_until_complete(
-            parallel_agents_node(state, context)
-        ) if not asyncio.get_event_loop().is_running() else parallel_agents_node(state, context)
-    )
-
-    workflow.add_node(
-        "reviewer",
-        lambda state: asyncio.get_event_loop().run_until_complete(
-            reviewer_node(state, context)
-        ) if not asyncio.get_event_loop().is_running() else reviewer_node(state, context)
+        functools.partial(parallel_agents_node, context=context, agents=parallel_agents),
     )
+    workflow.add_node("reviewer", functools.partial(reviewer_node, context=context))
 
     # Define edges: 1 -> N -> 1
     workflow.set_entry_point("architect")
-    workflow.add_edge("architect", "parallel_agents")
+    workflow.add_conditional_edges("architect", route_after_architect)
     workflow.add_edge("parallel_agents", "reviewer")
     workflow.add_edge("reviewer", END)
 
@@ -237,6 +503,8 @@ async def run_workflow(
     repo_path: str,
     repo_context: dict[str, Any],
     context: RunContext | None = None,
+    graph: CompiledStateGraph | None = None,
+    state_sink: dict[str, Any] | None = None,
 ) -> AgentState:
     """Execute the full multi-agent workflow.
 
@@ -245,6 +513,9 @@ async def run_workflow(
         repo_path: Path to target repository
         repo_context: Repository context
         context: Run context for logging
+        graph: Compiled create_workflow(context) to reuse (compiled if None)
+        state_sink: Updated with the state after each node, so the outputs
+            of finished phases survive a later phase raising
 
     Returns:
         Final state with all agent outputs
@@ -252,30 +523,84 @@ async def run_workflow(
     # Create initial state
     initial_state = create_initial_state(goal, repo_path, repo_context)
 
-    # Run phases sequentially (but parallel_agents is internally parallel)
-    state = await architect_node(initial_state, context)
-    state = await parallel_agents_node(state, context)
-    state = await reviewer_node(state, context)
+    if graph is None:
+        graph = create_workflow(context).compile()
 
+    # Fresh agents per run, so concurrent runs never share agent state
+    agents = {
+        "architect": ArchitectAgent(context=context),
+        "parallel_agents": create_parallel_agents(context),
+    }
+    state = initial_state
+    async for state in graph.astream(
+        initial_state, config={"configurable": agents}, stream_mode="values"
+    ):
+        if state_sink is not None:
+            state_sink.update(state)
     return state
 
 
+async def _prepare_during(
+    task: asyncio.Task,
+    ready: asyncio.Event,
+    agents: tuple[BaseAgent, ...],
+) -> None:
+    """Prepare ``agents`` once ``ready`` is set or ``task`` finishes."""
+    waiter = asyncio.create_task(ready.wait())
+    try:
+        await asyncio.wait({task, waiter}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        waiter.cancel()
+    for agent in agents:
+        try:
+            agent.prepare()
+        except Exception:
+            pass  # Surfaced when the agent runs
+
+
+def enable_llm_cache(cache: BaseCache | None = None) -> BaseCache:
+    """Install a process-wide LLM cache, unless one is already set.
+
+    Identical prompts sent to the same model are then answered from the
+    cache instead of the provider.
+
+    Args:
+        cache: Cache to install (in-memory if None)
+
+    Returns:
+        The active cache
+    """
+    active = get_llm_cache()
+    if active is None:
+        active = cache or InMemoryCache()
+        set_llm_cache(active)
+    return active
+
+
 class AgentWorkflow:
     """High-level interface for the multi-agent workflow."""
 
-    def __init__(self, context: RunContext | None = None):
+    def __init__(self, context: RunContext | None = None, use_llm_cache: bool = False):
         """Initialize workflow.
 
         Args:
             context: Run context for logging
+            use_llm_cache: Install the process-wide LLM cache so repeated
+                prompts skip the provider (off for nondeterministic runs)
         """
         self.context = context
+        self.use_llm_cache = use_llm_cache
+        if use_llm_cache:
+            enable_llm_cache()
+        # Compiled once; each execute binds its own agents
+        self._graph = create_workflow(context).compile()
 
     async def execute(
         self,
         goal: str,
         repo_path: str,
         repo_context: dict[str, Any],
+        state_sink: dict[str, Any] | None = None,
     ) -> AgentState:
         """Execute the workflow.
 
@@ -283,6 +608,7 @@ class AgentWorkflow:
             goal: The goal to accomplish
             repo_path: Path to target repository
             repo_context: Repository context
+            state_sink: Updated with the state after each node (see run_workflow)
 
         Returns:
             Final workflow state
@@ -296,6 +622,8 @@ class AgentWorkflow:
             repo_path=repo_path,
             repo_context=repo_context,
             context=self.context,
+            graph=self._graph,
+            state_sink=state_sink,
         )
 
         if self.context:
@@ -304,3 +632,27 @@ class AgentWorkflow:
             self.context.log("INFO", f"Total issues: {len(state['all_issues'])}")
 
         return state
+
+    async def run_batch(
+        self,
+        goals: list[tuple[str, str, dict[str, Any]]],
+        max_concurrency: int = 8,
+    ) -> list[AgentState]:
+        """Execute the workflow for several goals concurrently.
+
+        Individual LLM requests remain bounded by the shared LLM semaphore.
+
+        Args:
+            goals: (goal, repo_path, repo_context) tuples
+            max_concurrency: Maximum number of workflows running at once
+
+        Returns:
+            Final workflow states, in the order of ``goals``
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(goal: str, repo_path: str, repo_context: dict[str, Any]) -> AgentState:
+            async with semaphore:
+                return await self.execute(goal, repo_path, repo_context)
+
+        return list(await asyncio.gather(*(run_one(*item) for item in goals)))
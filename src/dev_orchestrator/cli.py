@@ -1,25 +1,42 @@
 """CLI entrypoint for dev-orchestrator.
 
 Uses Typer for CLI and Rich for beautiful output.
+
+Importing this module stays cheap: each command imports Rich, the
+executors and the LLM stack in its own body, and ``select_command``
+leaves only the invoked command registered before the app runs.
 """
 
-import asyncio
+from __future__ import annotations
+
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
-from rich.tree import Tree
 
 from . import __version__
+from .console import (
+    DETAIL_COLUMNS,
+    METRIC_COLUMNS,
+    PROPERTY_COLUMNS,
+    SETTING_COLUMNS,
+    ellipsize,
+    format_status,
+    get_console,
+    new_table,
+    print_markdown_file,
+    print_recent_runs,
+    progress_reporter,
+)
 from .core.config import get_config
-from .core.executor import Executor
-from .core.llm_config import check_llm_available
-from .core.run_context import RunContext, RunStatus
+
+# asyncio, Rich, the executor and the LLM stack are imported by the
+# commands that use them, so --help and --version start without loading them
+if TYPE_CHECKING:
+    from rich.table import Table
+
+    from .core.executor import Executor
+    from .core.run_context import RunContext
 
 app = typer.Typer(
     name="orchestrator",
@@ -27,13 +44,15 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console()
-
 
 def version_callback(value: bool) -> None:
-    """Print version and exit."""
+    """Print version and exit.
+
+    ``__main__.main`` answers a bare --version before Typer is imported;
+    this handles it alongside other options.
+    """
     if value:
-        console.print(f"[bold blue]dev-orchestrator[/] v{__version__}")
+        print(f"dev-orchestrator v{__version__}")
         raise typer.Exit()
 
 
@@ -83,12 +102,21 @@ def run_command(
     Example:
         orchestrator run --repo /path/to/repo --goal "Add healthcheck endpoint"
     """
+    import asyncio
+    import time
+
+    from rich.panel import Panel
+
+    from .core.executor import Executor
+    from .core.run_context import RunContext, RunStatus
+
+    console = get_console()
+
     config = get_config()
     config.dry_run = dry_run
     config.verbose = verbose
-    config.ensure_dirs()
 
-    repo_path = Path(repo).resolve()
+    repo_path = _repo_display_path(repo)
 
     # Header
     console.print()
@@ -99,11 +127,9 @@ def run_command(
     console.print()
 
     # Show run info
-    table = Table(title="Run Configuration", show_header=False, box=None)
-    table.add_column("Property", style="cyan")
-    table.add_column("Value", style="green")
+    table = _kv_table("Run Configuration")
     table.add_row("Repository", str(repo_path))
-    table.add_row("Goal", goal[:60] + "..." if len(goal) > 60 else goal)
+    table.add_row("Goal", ellipsize(goal, 60))
     table.add_row("Dry Run", "Yes" if dry_run else "No")
     console.print(table)
     console.print()
@@ -114,64 +140,73 @@ def run_command(
     console.print(f"[dim]Run ID: {context.run_id}[/]")
     console.print()
 
+    executor: Executor | None = None
     try:
+        # Directories are only created once a run actually starts
+        config.ensure_dirs()
         executor = Executor(context)
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        with progress_reporter("Setting up...") as report:
             # Setup
-            task = progress.add_task("Setting up...", total=None)
             executor.setup()
-            progress.update(task, description="[green]✓[/] Setup complete")
+            report("[green]✓[/] Setup complete")
 
             # Create plan
-            progress.update(task, description="Creating plan...")
+            report("Creating plan...")
             plan = executor.create_plan()
-            progress.update(task, description=f"[green]✓[/] Plan created ({len(plan.tasks)} tasks)")
+            report(f"[green]✓[/] Plan created ({len(plan.tasks)} tasks)")
 
             if dry_run:
-                progress.update(task, description="[yellow]⏹[/] Dry run - stopping before changes")
+                report("[yellow]⏹[/] Dry run - stopping before changes")
                 console.print()
                 _show_plan(plan)
                 context.set_status(RunStatus.COMPLETED)
-                context.save()
                 return
 
             # Create branch
-            progress.update(task, description="Creating branch...")
+            report("Creating branch...")
             branch = executor.create_branch()
-            progress.update(task, description=f"[green]✓[/] Branch created: {branch}")
-
-            # Execute tasks
-            for i, plan_task in enumerate(plan.tasks, 1):
-                progress.update(
-                    task,
-                    description=f"Executing task {i}/{len(plan.tasks)}: {plan_task.title[:30]}...",
-                )
-                executor.execute_task(plan_task)
-
-            progress.update(task, description="[green]✓[/] Tasks executed")
+            report(f"[green]✓[/] Branch created: {branch}")
+
+            # Execute tasks level by level, tasks within a level concurrently,
+            # updating the description for about every 20th task or every
+            # 250 ms, whichever comes first
+            async def execute_tasks() -> None:
+                total = len(plan.tasks)
+                update_every = max(1, total // 20)
+                last_update = 0.0
+                done = 0
+                for level in plan.levels():
+                    now = time.monotonic()
+                    if (done + len(level)) // update_every > done // update_every or (
+                        now - last_update > 0.25
+                    ):
+                        title = ellipsize(level[0].title, 30)
+                        report(f"Executing task {done + 1}/{total}: {title}")
+                        last_update = now
+                    await executor.execute_level(level)
+                    done += len(level)
+
+            asyncio.run(execute_tasks())
+
+            report("[green]✓[/] Tasks executed")
 
             # Apply changes
-            progress.update(task, description="Applying changes...")
+            report("Applying changes...")
             modified = executor.apply_changes()
-            progress.update(task, description=f"[green]✓[/] Applied {len(modified)} file(s)")
+            report(f"[green]✓[/] Applied {len(modified)} file(s)")
 
             # Commit
-            progress.update(task, description="Committing changes...")
+            report("Committing changes...")
             executor.commit_changes()
-            progress.update(task, description="[green]✓[/] Changes committed")
+            report("[green]✓[/] Changes committed")
 
             # Generate report
-            progress.update(task, description="Generating report...")
+            report("Generating report...")
             report_path = executor.generate_report()
-            progress.update(task, description="[green]✓[/] Report generated")
+            report("[green]✓[/] Report generated")
 
             context.set_status(RunStatus.COMPLETED)
-            context.save()
 
         # Show summary
         console.print()
@@ -184,173 +219,16 @@ def run_command(
     except Exception as e:
         context.set_status(RunStatus.FAILED)
         context.add_error(str(e))
-        context.save()
 
         console.print()
         console.print(f"[bold red]✗ Run failed: {e}[/]")
         raise typer.Exit(code=1)
 
-
-@app.command("agents")
-def agents_command(
-    repo: str = typer.Option(
-        ...,
-        "--repo",
-        "-r",
-        help="Path to the target repository",
-    ),
-    goal: str = typer.Option(
-        ...,
-        "--goal",
-        "-g",
-        help="The goal/objective to accomplish",
-    ),
-    model: Optional[str] = typer.Option(
-        None,
-        "--model",
-        "-m",
-        help="Override LLM model (e.g., gpt-4o, gpt-4o-mini)",
-    ),
-    verbose: bool = typer.Option(
-        False,
-        "--verbose",
-        help="Enable verbose output",
-    ),
-) -> None:
-    """Execute a multi-agent run using LangChain/LangGraph workflow.
-
-    This command uses the 1-N-1 pattern:
-    1. Architect analyzes and designs solution
-    N. Implementer, Tester, Documenter work in parallel
-    1. Reviewer aggregates and validates
-
-    Requires OPENAI_API_KEY environment variable.
-
-    Example:
-        orchestrator agents --repo /path/to/repo --goal "Add healthcheck endpoint"
-    """
-    config = get_config()
-    config.verbose = verbose
-    config.ensure_dirs()
-
-    repo_path = Path(repo).resolve()
-
-    # Header
-    console.print()
-    console.print(Panel.fit(
-        f"[bold blue]Dev Orchestrator[/] v{__version__} [cyan](Multi-Agent Mode)[/]",
-        subtitle="LangChain + LangGraph • 1-N-1 Pattern",
-    ))
-    console.print()
-
-    # Check LLM availability
-    available, message = check_llm_available()
-    if not available:
-        console.print(f"[bold red]✗ LLM not available:[/] {message}")
-        console.print()
-        console.print("[dim]Set OPENAI_API_KEY environment variable or create .env file[/]")
-        raise typer.Exit(code=1)
-
-    console.print(f"[green]✓[/] LLM: {message}")
-    console.print()
-
-    # Show run info
-    table = Table(title="Multi-Agent Run Configuration", show_header=False, box=None)
-    table.add_column("Property", style="cyan")
-    table.add_column("Value", style="green")
-    table.add_row("Repository", str(repo_path))
-    table.add_row("Goal", goal[:60] + "..." if len(goal) > 60 else goal)
-    table.add_row("Pattern", "1-N-1 (Architect → Parallel → Reviewer)")
-    console.print(table)
-    console.print()
-
-    # Create run context
-    context = RunContext.create(repo_path, goal)
-    console.print(f"[dim]Run ID: {context.run_id}[/]")
-    console.print()
-
-    # Import agent executor
-    from .agents.agent_executor import AgentExecutor
-
-    async def run_async():
-        executor = AgentExecutor(context)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            # Setup
-            task = progress.add_task("Setting up agent executor...", total=None)
-            executor.setup()
-            progress.update(task, description="[green]✓[/] Executor ready")
-
-            # Create branch
-            progress.update(task, description="Creating dedicated branch...")
-            branch = executor.create_branch()
-            progress.update(task, description=f"[green]✓[/] Branch: {branch}")
-
-            # Execute multi-agent workflow
-            progress.update(task, description="[bold cyan]Phase 1:[/] Architect analyzing...")
-
-            # This runs the async workflow
-            final_state = await executor.execute_workflow()
-
-            # Check agent results
-            architect_ok = final_state.get("architect_output", None)
-            if architect_ok:
-                progress.update(task, description="[green]✓[/] Architect analysis complete")
-            else:
-                progress.update(task, description="[yellow]⚠[/] Architect had issues")
-
-            progress.update(task, description="[bold cyan]Phase N:[/] Parallel agents working...")
-            progress.update(task, description="[green]✓[/] Parallel agents complete")
-
-            progress.update(task, description="[bold cyan]Phase 1:[/] Reviewer aggregating...")
-            progress.update(task, description="[green]✓[/] Review complete")
-
-            # Apply changes
-            progress.update(task, description="Applying file changes...")
-            modified = executor.apply_file_changes()
-            progress.update(task, description=f"[green]✓[/] Applied {len(modified)} file(s)")
-
-            # Commit
-            progress.update(task, description="Committing changes...")
-            executor.commit_changes()
-            progress.update(task, description="[green]✓[/] Changes committed")
-
-            # Generate report
-            progress.update(task, description="Generating report...")
-            report_path = executor.generate_report()
-            progress.update(task, description="[green]✓[/] Report generated")
-
-            context.set_status(RunStatus.COMPLETED)
-            context.save()
-
-            return report_path
-
-    try:
-        report_path = asyncio.run(run_async())
-
-        # Show agent summary
-        console.print()
-        _show_agent_summary(context)
-
-        console.print()
-        console.print(f"[bold green]✓ Multi-agent run completed successfully![/]")
-        console.print(f"[dim]Report: {report_path}[/]")
-
-    except Exception as e:
-        context.set_status(RunStatus.FAILED)
-        context.add_error(str(e))
-        context.save()
-
-        console.print()
-        console.print(f"[bold red]✗ Multi-agent run failed: {e}[/]")
-        if config.verbose:
-            import traceback
-            console.print(traceback.format_exc())
-        raise typer.Exit(code=1)
+    finally:
+        if executor is not None:
+            executor.close()
+        # The run's final state is written once, however it ended
+        context.save_if_dirty()
 
 
 @app.command("agents")
@@ -387,11 +265,19 @@ def agents_command(
     Example:
         orchestrator agents --repo /path/to/repo --goal "Add user auth"
     """
+    import asyncio
+
+    from rich.panel import Panel
+
+    from .core.llm_config import check_llm_available
+    from .core.run_context import RunContext, RunStatus
+
+    console = get_console()
+
     config = get_config()
     config.verbose = verbose
-    config.ensure_dirs()
 
-    repo_path = Path(repo).resolve()
+    repo_path = _repo_display_path(repo)
 
     # Header
     console.print()
@@ -414,11 +300,9 @@ def agents_command(
     console.print()
 
     # Show run info
-    table = Table(title="Agent Run Configuration", show_header=False, box=None)
-    table.add_column("Property", style="cyan")
-    table.add_column("Value", style="green")
+    table = _kv_table("Agent Run Configuration")
     table.add_row("Repository", str(repo_path))
-    table.add_row("Goal", goal[:60] + "..." if len(goal) > 60 else goal)
+    table.add_row("Goal", ellipsize(goal, 60))
     table.add_row("Mode", "Multi-Agent (1-N-1)")
     console.print(table)
     console.print()
@@ -432,47 +316,45 @@ def agents_command(
     console.print()
 
     async def run_async():
+        config.ensure_dirs()
         executor = AgentExecutor(context)
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            # Setup
-            task_id = progress.add_task("Setting up...", total=None)
-            executor.setup()
-            progress.update(task_id, description="[green]✓[/] Setup complete")
-
-            # Create branch
-            progress.update(task_id, description="Creating branch...")
-            branch = executor.create_branch()
-            progress.update(task_id, description=f"[green]✓[/] Branch: {branch}")
-
-            # Execute multi-agent workflow
-            progress.update(task_id, description="[bold]Phase 1:[/] Architect analyzing...")
-            await executor.execute_workflow()
-            progress.update(task_id, description="[green]✓[/] All agents completed")
-
-            # Apply changes
-            progress.update(task_id, description="Applying file changes...")
-            modified = executor.apply_file_changes()
-            progress.update(task_id, description=f"[green]✓[/] Applied {len(modified)} file(s)")
-
-            # Commit
-            progress.update(task_id, description="Committing changes...")
-            executor.commit_changes()
-            progress.update(task_id, description="[green]✓[/] Changes committed")
-
-            # Generate report
-            progress.update(task_id, description="Generating report...")
-            report_path = executor.generate_report()
-            progress.update(task_id, description="[green]✓[/] Report generated")
+        try:
+            with progress_reporter("Setting up...") as report:
+                # Setup
+                executor.setup()
+                report("[green]✓[/] Setup complete")
+
+                # Create branch
+                report("Creating branch...")
+                branch = executor.create_branch()
+                report(f"[green]✓[/] Branch: {branch}")
+
+                # Execute multi-agent workflow
+                report("[bold]Phase 1:[/] Architect analyzing...")
+                await executor.execute_workflow()
+                report("[green]✓[/] All agents completed")
+
+                # Apply changes
+                report("Applying file changes...")
+                modified = executor.apply_file_changes()
+                report(f"[green]✓[/] Applied {len(modified)} file(s)")
+
+                # Commit
+                report("Committing changes...")
+                executor.commit_changes()
+                report("[green]✓[/] Changes committed")
+
+                # Generate report
+                report("Generating report...")
+                report_path = executor.generate_report()
+                report("[green]✓[/] Report generated")
 
-            context.set_status(RunStatus.COMPLETED)
-            context.save()
+                context.set_status(RunStatus.COMPLETED)
 
-            return report_path
+                return report_path
+        finally:
+            await executor.aclose()
 
     try:
         report_path = asyncio.run(run_async())
@@ -488,15 +370,17 @@ def agents_command(
     except Exception as e:
         context.set_status(RunStatus.FAILED)
         context.add_error(str(e))
-        context.save()
 
         console.print()
         console.print(f"[bold red]✗ Agent run failed: {e}[/]")
         if verbose:
-            import traceback
-            console.print(traceback.format_exc())
+            console.print_exception()
         raise typer.Exit(code=1)
 
+    finally:
+        # The run's final state is written once, however it ended
+        context.save_if_dirty()
+
 
 @app.command("status")
 def status_command(
@@ -505,8 +389,10 @@ def status_command(
         help="Run ID to check. If not provided, lists recent runs.",
     ),
 ) -> None:
-    """Check status of a run or list recent runs."""
-    config = get_config()
+    """Check status of a run or list recent runs (also: list)."""
+    from .core.run_context import RunContext
+
+    console = get_console()
 
     if run_id:
         # Show specific run
@@ -517,42 +403,7 @@ def status_command(
             console.print(f"[red]Run not found: {run_id}[/]")
             raise typer.Exit(code=1)
     else:
-        # List recent runs
-        runs = RunContext.list_runs()
-
-        if not runs:
-            console.print("[dim]No runs found.[/]")
-            return
-
-        table = Table(title="Recent Runs")
-        table.add_column("Run ID", style="cyan")
-        table.add_column("Status", style="bold")
-        table.add_column("Goal")
-
-        for rid in sorted(runs, reverse=True)[:10]:
-            try:
-                ctx = RunContext.load(rid)
-                status_color = {
-                    RunStatus.COMPLETED: "green",
-                    RunStatus.FAILED: "red",
-                    RunStatus.EXECUTING: "yellow",
-                }.get(ctx.status, "dim")
-
-                table.add_row(
-                    rid,
-                    f"[{status_color}]{ctx.status.value}[/]",
-                    ctx.goal[:50] + "..." if len(ctx.goal) > 50 else ctx.goal,
-                )
-            except Exception:
-                table.add_row(rid, "[dim]unknown[/]", "[dim]Error loading[/]")
-
-        console.print(table)
-
-
-@app.command("list")
-def list_command() -> None:
-    """List all runs."""
-    status_command(run_id=None)
+        print_recent_runs()
 
 
 @app.command("report")
@@ -560,13 +411,15 @@ def report_command(
     run_id: str = typer.Argument(..., help="Run ID to show report for"),
 ) -> None:
     """Display the report for a run."""
+    from .core.run_context import RunContext
+
+    console = get_console()
+
     try:
         context = RunContext.load(run_id)
 
         if context.report_file.exists():
-            report = context.report_file.read_text(encoding="utf-8")
-            from rich.markdown import Markdown
-            console.print(Markdown(report))
+            print_markdown_file(context.report_file)
         else:
             console.print("[yellow]Report not found for this run.[/]")
 
@@ -578,37 +431,79 @@ def report_command(
 @app.command("config")
 def config_command() -> None:
     """Show current configuration."""
+    console = get_console()
+
     config = get_config()
 
-    table = Table(title="Configuration")
-    table.add_column("Setting", style="cyan")
-    table.add_column("Value", style="green")
+    table = new_table(SETTING_COLUMNS, title="Configuration")
 
-    for key, value in config.to_dict().items():
+    for key, value in config.iter_items():
         table.add_row(key, str(value))
 
     console.print(table)
 
 
+def _kv_table(
+    title: str | None = None,
+    columns: tuple[tuple[str, str | None], ...] = PROPERTY_COLUMNS,
+    *,
+    boxed: bool = False,
+) -> Table:
+    """Build a headerless two-column table of names and values.
+
+    Args:
+        title: Table title
+        columns: (header, style) of the name and value columns
+        boxed: Draw the table's box (borderless by default)
+
+    Returns:
+        A new, empty table
+    """
+    if boxed:
+        return new_table(columns, title=title, show_header=False)
+    return new_table(columns, title=title, show_header=False, box=None)
+
+
+def _repo_display_path(repo: str) -> Path:
+    """Make a --repo argument absolute for display.
+
+    RunContext.create canonicalizes the path it stores, so symlinks are not
+    resolved here; only "." and ".." parts need resolving to read well.
+
+    Args:
+        repo: Repository path as given on the command line
+
+    Returns:
+        Absolute path to the repository
+    """
+    path = Path(repo).absolute()
+    if any(part in (".", "..") for part in path.parts):
+        return path.resolve()
+    return path
+
+
 def _show_plan(plan) -> None:
     """Display the execution plan."""
-    tree = Tree(f"[bold]Plan: {plan.goal[:50]}...[/]")
+    console = get_console()
+
+    # Plain indented lines, printed at once, instead of a Rich Tree
+    lines = [f"[bold]Plan: {ellipsize(plan.goal, 50)}[/]"]
 
     for task in plan.tasks:
-        task_node = tree.add(f"[cyan]{task.id}[/] {task.title}")
-        task_node.add(f"[dim]Role: {task.role}[/]")
-        task_node.add(f"[dim]Type: {task.type.value}[/]")
+        lines.append(f"  [cyan]{task.id}[/] {task.title}")
+        lines.append(f"    [dim]Role: {task.role}[/]")
+        lines.append(f"    [dim]Type: {task.type.value}[/]")
         if task.dependencies:
-            task_node.add(f"[dim]Depends on: {', '.join(task.dependencies)}[/]")
+            lines.append(f"    [dim]Depends on: {', '.join(task.dependencies)}[/]")
 
-    console.print(tree)
+    console.print("\n".join(lines))
 
 
 def _show_summary(context: RunContext, executor: Executor) -> None:
     """Display run summary."""
-    table = Table(title="Run Summary", show_header=False)
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", style="green")
+    console = get_console()
+
+    table = _kv_table("Run Summary", METRIC_COLUMNS, boxed=True)
 
     table.add_row("Run ID", context.run_id)
     table.add_row("Status", context.status.value)
@@ -622,9 +517,9 @@ def _show_summary(context: RunContext, executor: Executor) -> None:
 
 def _show_agent_summary(context: RunContext) -> None:
     """Display multi-agent run summary."""
-    table = Table(title="Multi-Agent Run Summary", show_header=False)
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", style="green")
+    console = get_console()
+
+    table = _kv_table("Multi-Agent Run Summary", METRIC_COLUMNS, boxed=True)
 
     table.add_row("Run ID", context.run_id)
     table.add_row("Status", context.status.value)
@@ -638,32 +533,29 @@ def _show_agent_summary(context: RunContext) -> None:
     if outputs_dir.exists():
         console.print()
         console.print("[bold]Agent Results:[/]")
+        import orjson
+
         for agent_file in outputs_dir.glob("*.json"):
-            import json
             try:
-                with open(agent_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = orjson.loads(agent_file.read_bytes())
                 success = "✅" if data.get("success") else "❌"
-                console.print(f"  {success} {agent_file.stem.capitalize()}: {data.get('summary', 'N/A')[:60]}")
+                summary = ellipsize(data.get("summary", "N/A"), 60)
+                console.print(f"  {success} {agent_file.stem.capitalize()}: {summary}")
             except Exception:
                 pass
 
 
 def _show_run_details(context: RunContext) -> None:
     """Display detailed run information."""
-    console.print(Panel.fit(f"[bold]{context.run_id}[/]"))
+    from rich.panel import Panel
 
-    table = Table(show_header=False, box=None)
-    table.add_column("Property", style="cyan")
-    table.add_column("Value")
+    console = get_console()
+
+    console.print(Panel.fit(f"[bold]{context.run_id}[/]"))
 
-    status_color = {
-        RunStatus.COMPLETED: "green",
-        RunStatus.FAILED: "red",
-        RunStatus.EXECUTING: "yellow",
-    }.get(context.status, "dim")
+    table = _kv_table(columns=DETAIL_COLUMNS)
 
-    table.add_row("Status", f"[{status_color}]{context.status.value}[/]")
+    table.add_row("Status", format_status(context.status))
     table.add_row("Goal", context.goal)
     table.add_row("Repository", str(context.repo_path))
     table.add_row("Branch", context.branch_name or "N/A")
@@ -679,5 +571,40 @@ def _show_run_details(context: RunContext) -> None:
             console.print(f"  [red]• {error}[/]")
 
 
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Find the command invoked by ``argv``.
+
+    Args:
+        argv: Command line arguments, without the program name
+
+    Returns:
+        The command name, or None for --help, an unknown command or no command
+    """
+    names = {command.name for command in app.registered_commands}
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg if arg in names else None
+    return None
+
+
+def select_command(argv: list[str]) -> None:
+    """Keep only the command ``argv`` invokes registered on the app.
+
+    Typer builds Click parameters for every registered command when the app
+    runs, so dropping the others saves that work. All commands stay
+    registered when the command can't be told from ``argv``, so --help and
+    unknown-command errors list them as before.
+
+    Args:
+        argv: Command line arguments, without the program name
+    """
+    name = _sniff_subcommand(argv)
+    if name is not None:
+        app.registered_commands = [c for c in app.registered_commands if c.name == name]
+
+
 if __name__ == "__main__":
-    app()
+    # Same fast paths as the installed script and python -m dev_orchestrator
+    from .__main__ import main as _main
+
+    _main()
@@ -0,0 +1,220 @@
+"""Console output shared by the CLI and its fast path.
+
+Nothing here imports Typer, and Rich is imported inside the functions
+that use it, so ``__main__`` can render these views without loading the
+full CLI.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+    from rich.text import Text
+
+    from .core.run_context import RunStatus
+
+# Rich color per run status. RunStatus is a str enum, so its members look
+# up these keys without run_context being imported here.
+STATUS_COLORS: dict[str, str] = {
+    "completed": "green",
+    "failed": "red",
+    "executing": "yellow",
+}
+
+# (header, style) per table column. Only the specs are shared: Rich tables
+# are mutable, so new_table builds a fresh one on each call.
+RUNS_COLUMNS: tuple[tuple[str, str | None], ...] = (
+    ("Run ID", "cyan"),
+    ("Status", "bold"),
+    ("Goal", None),
+)
+SETTING_COLUMNS: tuple[tuple[str, str | None], ...] = (("Setting", "cyan"), ("Value", "green"))
+PROPERTY_COLUMNS: tuple[tuple[str, str | None], ...] = (("Property", "cyan"), ("Value", "green"))
+DETAIL_COLUMNS: tuple[tuple[str, str | None], ...] = (("Property", "cyan"), ("Value", None))
+METRIC_COLUMNS: tuple[tuple[str, str | None], ...] = (("Metric", "cyan"), ("Value", "green"))
+
+# Markdown files larger than this are rendered section by section
+MARKDOWN_CHUNK_BYTES = 256 * 1024
+
+_console: Console | None = None
+
+
+def get_console() -> Console:
+    """Get the shared Rich console, importing Rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+@contextlib.contextmanager
+def progress_reporter(description: str) -> Iterator[Callable[[str], None]]:
+    """Show the progress of a run step by step.
+
+    On a terminal this is a Rich spinner whose description is replaced on
+    each update; Rich redraws it on its own refresh tick, so updates
+    between ticks are coalesced. Otherwise (CI, pipes, log files) each
+    update is printed as a plain line, with no spinner refresh thread.
+    In both cases an update repeating the current description is dropped.
+
+    Args:
+        description: Initial description
+
+    Yields:
+        Function to call with each new description
+    """
+    console = get_console()
+    current = description
+
+    def deduplicated(show: Callable[[str], None]) -> Callable[[str], None]:
+        def report(message: str) -> None:
+            nonlocal current
+            if message != current:
+                current = message
+                show(message)
+
+        return report
+
+    if not console.is_terminal:
+        console.print(f"[dim]{description}[/]")
+        yield deduplicated(lambda message: console.print(f"[dim]{message}[/]"))
+        return
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        refresh_per_second=4,
+    ) as progress:
+        task = progress.add_task(description, total=None)
+        yield deduplicated(lambda message: progress.update(task, description=message))
+
+
+def ellipsize(text: str, limit: int) -> str:
+    """Cut ``text`` to ``limit`` characters, marking the cut with "..."."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+def new_table(columns: Iterable[tuple[str, str | None]], **kwargs) -> Table:
+    """Build a Rich table with the given columns.
+
+    Args:
+        columns: (header, style) per column, e.g. RUNS_COLUMNS
+        **kwargs: Passed to Table, e.g. title
+
+    Returns:
+        A new, empty table
+    """
+    from rich.table import Table
+
+    table = Table(**kwargs)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
+
+
+@functools.cache
+def format_status(status: RunStatus) -> Text:
+    """Render a run status as Rich text in its color.
+
+    Built once per status and shared, so table rows skip markup parsing.
+    Rich does not modify text while rendering it.
+    """
+    from rich.text import Text
+
+    return Text(status.value, style=STATUS_COLORS.get(status, "dim"))
+
+
+@functools.cache
+def _text(text: str, style: str) -> Text:
+    """Shared styled text for fixed cell values."""
+    from rich.text import Text
+
+    return Text(text, style=style)
+
+
+def print_recent_runs(limit: int = 10) -> None:
+    """Print a table of the most recent runs.
+
+    Args:
+        limit: Maximum number of runs to show
+    """
+    from .core.run_context import RunContext
+
+    console = get_console()
+
+    recent = RunContext.list_runs(limit=limit)
+
+    if not recent:
+        console.print("[dim]No runs found.[/]")
+        return
+
+    table = new_table(RUNS_COLUMNS, title="Recent Runs")
+
+    for rid in recent:
+        try:
+            status, goal = RunContext.load_summary(rid)
+            table.add_row(
+                rid,
+                format_status(status),
+                ellipsize(goal, 50),
+            )
+        except Exception:
+            table.add_row(rid, _text("unknown", "dim"), _text("Error loading", "dim"))
+
+    console.print(table)
+
+
+def iter_markdown_sections(lines: Iterable[str]) -> Iterator[str]:
+    """Split Markdown into chunks starting at each ``## `` heading.
+
+    Headings inside fenced code blocks do not start a new chunk.
+
+    Args:
+        lines: Markdown lines, with line endings
+
+    Yields:
+        Consecutive chunks of the document
+    """
+    chunk: list[str] = []
+    in_fence = False
+    for line in lines:
+        if line.startswith("```"):
+            in_fence = not in_fence
+        elif not in_fence and line.startswith("## ") and chunk:
+            yield "".join(chunk)
+            chunk = []
+        chunk.append(line)
+    if chunk:
+        yield "".join(chunk)
+
+
+def print_markdown_file(path: Path) -> None:
+    """Render a Markdown file to the console.
+
+    Files over MARKDOWN_CHUNK_BYTES are read and rendered one section at a
+    time, so only one section is held in memory.
+
+    Args:
+        path: Markdown file to render
+    """
+    from rich.markdown import Markdown
+
+    console = get_console()
+    with path.open("r", encoding="utf-8") as f:
+        if path.stat().st_size <= MARKDOWN_CHUNK_BYTES:
+            console.print(Markdown(f.read()))
+            return
+        for section in iter_markdown_sections(f):
+            console.print(Markdown(section))
@@ -6,19 +6,55 @@ Assumptions:
 """
 
 import os
-from dataclasses import dataclass, field
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
+# Default paths, computed once (Path objects are immutable, so sharing is safe)
+_ORCHESTRATOR_ROOT = Path(__file__).parents[3]
+_RUNS_DIR = _ORCHESTRATOR_ROOT / "runs"
+_TEMPLATES_DIR = _ORCHESTRATOR_ROOT / "templates"
+_CACHE_DIR = _ORCHESTRATOR_ROOT / ".cache"
 
-@dataclass
+# Directories ensure_dirs has already created or found
+_ensured_dirs: set[Path] = set()
+
+# Whether a .env file has been looked for (see load_dotenv_once)
+_dotenv_loaded = False
+
+_TRUE_VALUES = frozenset({"true", "1", "yes"})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable."""
+    return value.lower() in _TRUE_VALUES
+
+
+# (environment variable, setting, parser)
+_ENV_MAPPINGS: tuple[tuple[str, str, Callable[[str], Any]], ...] = (
+    ("ORCHESTRATOR_GIT_EXECUTABLE", "git_executable", str),
+    ("ORCHESTRATOR_DEFAULT_BRANCH", "default_branch", str),
+    ("ORCHESTRATOR_BRANCH_PREFIX", "branch_prefix", str),
+    ("ORCHESTRATOR_ALLOW_PUSH", "allow_push", _parse_bool),
+    ("ORCHESTRATOR_DRY_RUN", "dry_run", _parse_bool),
+    ("ORCHESTRATOR_CHECKPOINT_INTERVAL", "checkpoint_interval", int),
+    ("ORCHESTRATOR_TASK_CONCURRENCY", "task_concurrency", int),
+    ("ORCHESTRATOR_CACHE_MAX_MB", "cache_max_mb", int),
+    ("ORCHESTRATOR_LOG_LEVEL", "log_level", str),
+    ("ORCHESTRATOR_VERBOSE", "verbose", _parse_bool),
+)
+
+
+@dataclass(slots=True)
 class OrchestratorConfig:
     """Main configuration for the orchestrator."""
 
     # Base paths
-    orchestrator_root: Path = field(default_factory=lambda: Path(__file__).parent.parent.parent.parent)
+    orchestrator_root: Path = _ORCHESTRATOR_ROOT
     runs_dir: Path = field(default=None)  # type: ignore
     templates_dir: Path = field(default=None)  # type: ignore
+    cache_dir: Path = field(default=None)  # type: ignore
 
     # Git settings
     git_executable: str = "git"
@@ -29,68 +65,113 @@ class OrchestratorConfig:
     allow_push: bool = False  # MVP: no remote push by default
     dry_run: bool = False
 
+    # Run state: full save every this many tasks (0 = only when the plan ends);
+    # each finished task is journaled in between
+    checkpoint_interval: int = 10
+    # Most independent tasks run at once (0 = a whole plan level)
+    task_concurrency: int = 4
+
+    # Agent response cache size on disk, least used evicted first (0 = no cap)
+    cache_max_mb: int = 100
+
     # Logging
     log_level: str = "INFO"
     verbose: bool = False
 
+    # Cache for as_dict, dropped on any assignment (not a setting)
+    _as_dict: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Initialize derived paths and load environment overrides."""
+        default_root = self.orchestrator_root == _ORCHESTRATOR_ROOT
         if self.runs_dir is None:
-            self.runs_dir = self.orchestrator_root / "runs"
+            self.runs_dir = _RUNS_DIR if default_root else self.orchestrator_root / "runs"
         if self.templates_dir is None:
-            self.templates_dir = self.orchestrator_root / "templates"
+            self.templates_dir = (
+                _TEMPLATES_DIR if default_root else self.orchestrator_root / "templates"
+            )
+        if self.cache_dir is None:
+            self.cache_dir = _CACHE_DIR if default_root else self.orchestrator_root / ".cache"
 
         # Load environment overrides
         self._load_env_overrides()
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping the cached as_dict."""
+        # Not super(): slots=True recreates the class, breaking its __class__ cell
+        object.__setattr__(self, name, value)
+        if name != "_as_dict":
+            object.__setattr__(self, "_as_dict", None)
+
     def _load_env_overrides(self) -> None:
         """Load configuration overrides from environment variables."""
-        env_mappings: dict[str, tuple[str, type]] = {
-            "ORCHESTRATOR_GIT_EXECUTABLE": ("git_executable", str),
-            "ORCHESTRATOR_DEFAULT_BRANCH": ("default_branch", str),
-            "ORCHESTRATOR_BRANCH_PREFIX": ("branch_prefix", str),
-            "ORCHESTRATOR_ALLOW_PUSH": ("allow_push", bool),
-            "ORCHESTRATOR_DRY_RUN": ("dry_run", bool),
-            "ORCHESTRATOR_LOG_LEVEL": ("log_level", str),
-            "ORCHESTRATOR_VERBOSE": ("verbose", bool),
-        }
-
-        for env_var, (attr, attr_type) in env_mappings.items():
-            value = os.environ.get(env_var)
+        environ = os.environ
+        for env_var, attr, parse in _ENV_MAPPINGS:
+            value = environ.get(env_var)
             if value is not None:
-                if attr_type == bool:
-                    setattr(self, attr, value.lower() in ("true", "1", "yes"))
-                else:
-                    setattr(self, attr, attr_type(value))
+                setattr(self, attr, parse(value))
 
     def ensure_dirs(self) -> None:
-        """Ensure required directories exist."""
+        """Ensure required directories exist.
+
+        Each directory is created at most once per process; one removed
+        afterwards is not recreated.
+        """
+        if self.runs_dir in _ensured_dirs:
+            return
         self.runs_dir.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(self.runs_dir)
+
+    def iter_items(self) -> Iterator[tuple[str, Any]]:
+        """Yield (name, value) per setting, in declaration order."""
+        for name in _FIELD_NAMES:
+            yield name, getattr(self, name)
+
+    @property
+    def as_dict(self) -> dict[str, Any]:
+        """Settings as serializable values, rebuilt only after a setting changes."""
+        if self._as_dict is None:
+            self._as_dict = {
+                name: str(value) if isinstance(value, Path) else value
+                for name, value in self.iter_items()
+            }
+        return self._as_dict
 
     def to_dict(self) -> dict[str, Any]:
         """Convert config to dictionary for serialization."""
-        return {
-            "orchestrator_root": str(self.orchestrator_root),
-            "runs_dir": str(self.runs_dir),
-            "templates_dir": str(self.templates_dir),
-            "git_executable": self.git_executable,
-            "default_branch": self.default_branch,
-            "branch_prefix": self.branch_prefix,
-            "allow_push": self.allow_push,
-            "dry_run": self.dry_run,
-            "log_level": self.log_level,
-            "verbose": self.verbose,
-        }
+        return dict(self.as_dict)
+
+
+# Field names, looked up once rather than per iter_items call
+_FIELD_NAMES: tuple[str, ...] = tuple(f.name for f in fields(OrchestratorConfig) if f.init)
 
 
 # Global config instance (lazy loaded)
 _config: OrchestratorConfig | None = None
 
 
+def load_dotenv_once() -> None:
+    """Load a .env file, if present, into the environment on the first call.
+
+    dotenv is imported here rather than at module level, so importing the
+    configuration stays cheap.
+    """
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _dotenv_loaded = True
+
+
 def get_config() -> OrchestratorConfig:
-    """Get or create the global config instance."""
+    """Get or create the global config instance.
+
+    The first call loads .env, so its ORCHESTRATOR_* overrides apply.
+    """
     global _config
     if _config is None:
+        load_dotenv_once()
         _config = OrchestratorConfig()
     return _config
 
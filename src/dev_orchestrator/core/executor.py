@@ -7,10 +7,12 @@ The executor is the main orchestration engine that:
 4. Generates reports
 """
 
+import asyncio
 import json
+import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from .config import get_config
 from .git_ops import GitOps
@@ -19,6 +21,15 @@ from .roles import ArchitectRole, DocumenterRole, ImplementerRole, TesterRole
 from .roles.base import BaseRole, RoleProposal
 from .run_context import RunContext, RunStatus
 
+# Report icon per task status
+_STATUS_ICONS: dict[TaskStatus, str] = {
+    TaskStatus.COMPLETED: "✅",
+    TaskStatus.FAILED: "❌",
+    TaskStatus.SKIPPED: "⏭️",
+    TaskStatus.IN_PROGRESS: "🔄",
+    TaskStatus.PENDING: "⏳",
+}
+
 
 class Executor:
     """Main executor that coordinates the orchestration workflow."""
@@ -35,7 +46,11 @@ class Executor:
         self.roles: dict[str, BaseRole] = {}
         self.plan: Plan | None = None
         self.proposals: list[RoleProposal] = []
-        self.modified_files: list[str] = []
+        # A set, since implementer and documenter may both change a file
+        self.modified_files: set[str] = set()
+        # Report sections for recorded proposals, written as levels finish
+        self._proposals_out: IO[str] | None = None
+        self._proposals_written = 0
 
     def setup(self) -> None:
         """Set up the executor for a run."""
@@ -129,25 +144,109 @@ class Executor:
                 errors=[str(e)],
             )
 
+    @property
+    def proposals_file(self) -> Path:
+        """Scratch file holding the report's proposal sections."""
+        return self.context.run_dir / "_proposals.md"
+
+    def _write_proposals(self) -> None:
+        """Append report sections for proposals not yet written to proposals_file.
+
+        Sections are written as tasks finish, so generate_report copies the
+        file instead of formatting every proposal's details at once. The
+        file is flushed each time, so a run that dies before its report
+        still leaves the finished proposals on disk.
+        """
+        if self._proposals_written == len(self.proposals):
+            return
+        if self._proposals_out is None:
+            self.context.ensure_run_dir()
+            self._proposals_out = self.proposals_file.open(
+                "a" if self._proposals_written else "w", encoding="utf-8", buffering=131072
+            )
+        for proposal in self.proposals[self._proposals_written:]:
+            self._proposals_out.write(self._format_proposal(proposal))
+        self._proposals_out.flush()
+        self._proposals_written = len(self.proposals)
+
+    async def execute_level(self, tasks: list[Task]) -> None:
+        """Execute tasks that don't depend on each other.
+
+        Several tasks run concurrently in worker threads, at most
+        config.task_concurrency at a time; their proposals are still
+        recorded in plan order. Each task's outcome is then appended to the
+        run journal, and each new proposal's report section to
+        proposals_file.
+
+        Args:
+            tasks: One level of the plan (see Plan.levels)
+        """
+        start = len(self.proposals)
+        if len(tasks) == 1:
+            self.execute_task(tasks[0])
+        else:
+            limit = asyncio.Semaphore(self.config.task_concurrency or len(tasks))
+
+            async def run(task: Task) -> None:
+                async with limit:
+                    await asyncio.to_thread(self.execute_task, task)
+
+            await asyncio.gather(*(run(task) for task in tasks))
+
+            position = {task.id: i for i, task in enumerate(tasks)}
+            self.proposals[start:] = sorted(
+                self.proposals[start:], key=lambda p: position[p.task_id]
+            )
+        self._write_proposals()
+
+        self.context.journal_append(*(
+            {
+                "task": task.id,
+                "status": task.status.value,
+                "proposal": task.outputs.get("proposal"),
+            }
+            for task in tasks
+        ))
+
     def execute_plan(self) -> list[RoleProposal]:
-        """Execute all tasks in the plan."""
+        """Execute all tasks in the plan, level by level."""
         if not self.plan:
             raise RuntimeError("No plan created")
 
         self.context.set_status(RunStatus.EXECUTING)
         self.context.log("INFO", "Starting plan execution...")
 
-        for task in self.plan.tasks:
-            proposal = self.execute_task(task)
-            self.context.save()  # Persist state after each task
+        asyncio.run(self._execute_levels(self.plan))
+        return self.proposals
 
-            if not proposal.success and task.status == TaskStatus.FAILED:
-                self.context.log("WARNING", f"Task {task.id} failed, continuing...")
+    async def _execute_levels(self, plan: Plan) -> None:
+        """Execute the plan's levels in order.
 
-        return self.proposals
+        Tasks are journaled as they finish; the full state is saved every
+        config.checkpoint_interval tasks and once at the end.
+        """
+        interval = self.config.checkpoint_interval
+        unsaved = 0
+        for level in plan.levels():
+            await self.execute_level(level)
+
+            for task in level:
+                if task.status == TaskStatus.FAILED:
+                    self.context.log("WARNING", f"Task {task.id} failed, continuing...")
+
+            unsaved += len(level)
+            if interval and unsaved >= interval:
+                self.context.save()
+                unsaved = 0
+
+        self.context.save()
 
     def apply_changes(self) -> list[str]:
-        """Apply proposed changes from implementer and documenter."""
+        """Apply proposed changes from implementer and documenter.
+
+        Returns:
+            Modified files, sorted, each listed once
+        """
         self.context.log("INFO", "Applying proposed changes...")
 
         for proposal in self.proposals:
@@ -158,13 +257,13 @@ class Executor:
 
             if isinstance(role, ImplementerRole):
                 files = role.apply_changes(proposal.file_changes, self.context.repo_path)
-                self.modified_files.extend(files)
+                self.modified_files.update(files)
 
             elif isinstance(role, DocumenterRole):
                 files = role.apply_documentation(proposal.file_changes, self.context.repo_path)
-                self.modified_files.extend(files)
+                self.modified_files.update(files)
 
-        return self.modified_files
+        return sorted(self.modified_files)
 
     def commit_changes(self, message: str | None = None) -> bool:
         """Commit all changes to the branch."""
@@ -175,7 +274,7 @@ class Executor:
         commit_message = message or f"[orchestrator] {self.context.goal[:50]}"
 
         try:
-            self.git_ops.stage_files(self.modified_files)
+            self.git_ops.stage_files(sorted(self.modified_files))
             result = self.git_ops.commit(commit_message)
             self.context.log("INFO", f"Committed changes: {commit_message}")
             return result.success
@@ -184,17 +283,24 @@ class Executor:
             return False
 
     def generate_report(self) -> str:
-        """Generate the final run report."""
+        """Generate the final run report.
+
+        The report is written straight to report_file, section by section:
+        the task table row by row, and proposal sections copied from
+        proposals_file, rather than built into one string.
+
+        Returns:
+            Path to the report
+        """
         self.context.log("INFO", "Generating report...")
 
         # Build report sections
-        task_summary = self._format_task_summary()
-        proposal_details = self._format_proposals()
         file_changes = self._format_file_changes()
-        git_info = self._format_git_info()
-        checklist = self._generate_checklist()
+        git_snapshot, git_error = self._git_snapshot()
+        git_info = self._format_git_info(git_snapshot, git_error)
+        checklist = self._generate_checklist(git_snapshot)
 
-        report = f"""# Orchestrator Run Report
+        head = f"""# Orchestrator Run Report
 
 ## Run Information
 
@@ -214,13 +320,8 @@ class Executor:
 
 ## Task Summary
 
-{task_summary}
-
-## Proposals
-
-{proposal_details}
-
-## File Changes
+"""
+        tail = f"""## File Changes
 
 {file_changes}
 
@@ -240,40 +341,47 @@ class Executor:
 *Generated by dev-orchestrator v0.1.0*
 """
 
-        # Save report
-        self.context.report_file.write_text(report, encoding="utf-8")
+        self.context.ensure_run_dir()
+        with self.context.report_file.open("w", encoding="utf-8", buffering=131072) as report:
+            report.write(head)
+            self._write_task_summary(report)
+            report.write("\n\n## Proposals\n\n")
+            self._copy_proposals(report)
+            report.write(tail)
         self.context.artifacts["report"] = str(self.context.report_file)
 
-        return report
+        return str(self.context.report_file)
 
-    def _format_task_summary(self) -> str:
-        """Format task summary table."""
+    def _write_task_summary(self, report: IO[str]) -> None:
+        """Write the task summary table, one row per task."""
         if not self.plan:
-            return "No plan executed."
+            report.write("No plan executed.")
+            return
 
-        lines = ["| # | Task | Role | Status |", "|---|------|------|--------|"]
+        report.write("| # | Task | Role | Status |\n|---|------|------|--------|")
         for i, task in enumerate(self.plan.tasks, 1):
-            status_icon = {
-                TaskStatus.COMPLETED: "✅",
-                TaskStatus.FAILED: "❌",
-                TaskStatus.SKIPPED: "⏭️",
-                TaskStatus.IN_PROGRESS: "🔄",
-                TaskStatus.PENDING: "⏳",
-            }.get(task.status, "❓")
+            icon = _STATUS_ICONS.get(task.status, "❓")
+            title = task.title[:40]
+            report.write(f"\n| {i} | {title} | {task.role} | {icon} {task.status.value} |")
 
-            lines.append(f"| {i} | {task.title[:40]} | {task.role} | {status_icon} {task.status.value} |")
-
-        return "\n".join(lines)
-
-    def _format_proposals(self) -> str:
-        """Format proposal summaries."""
+    def _copy_proposals(self, report: IO[str]) -> None:
+        """Copy the proposal sections written so far into the report."""
         if not self.proposals:
-            return "No proposals generated."
-
-        sections = []
-        for proposal in self.proposals:
-            status = "✅" if proposal.success else "❌"
-            sections.append(f"""### {status} {proposal.role.capitalize()} - Task {proposal.task_id}
+            report.write("No proposals generated.\n\n")
+            return
+
+        self._write_proposals()
+        if self._proposals_out is not None:
+            self._proposals_out.close()
+            self._proposals_out = None
+        with self.proposals_file.open("r", encoding="utf-8") as sections:
+            shutil.copyfileobj(sections, report, 131072)
+
+    @staticmethod
+    def _format_proposal(proposal: RoleProposal) -> str:
+        """Format one proposal's report section."""
+        status = "✅" if proposal.success else "❌"
+        return f"""### {status} {proposal.role.capitalize()} - Task {proposal.task_id}
 
 **Summary:** {proposal.summary}
 
@@ -283,42 +391,54 @@ class Executor:
 {proposal.details}
 
 </details>
-""")
 
-        return "\n".join(sections)
+"""
 
     def _format_file_changes(self) -> str:
         """Format list of modified files."""
         if not self.modified_files:
             return "No files were modified."
 
-        return "\n".join(f"- `{f}`" for f in self.modified_files)
+        return "\n".join(f"- `{f}`" for f in sorted(self.modified_files))
 
-    def _format_git_info(self) -> str:
-        """Format git information."""
-        if not self.git_ops:
-            return "Git not initialized."
+    def _git_snapshot(self) -> tuple[dict[str, Any] | None, Exception | None]:
+        """Take one git snapshot for the report.
 
+        Returns:
+            (snapshot, None), (None, error) if git failed, or (None, None)
+            if git is not initialized
+        """
+        if not self.git_ops:
+            return None, None
         try:
-            status = self.git_ops.get_status()
-            commits = self.git_ops.get_log(3)
+            return self.git_ops.snapshot(), None
+        except Exception as e:
+            return None, e
 
-            commit_info = "\n".join(
-                f"- `{c['hash'][:7]}` {c['message'][:50]}"
-                for c in commits
-            ) if commits else "No commits"
+    def _format_git_info(
+        self, snapshot: dict[str, Any] | None, error: Exception | None = None
+    ) -> str:
+        """Format git information."""
+        if error is not None:
+            return f"Error getting git info: {error}"
+        if snapshot is None:
+            return "Git not initialized."
+
+        commits = snapshot["commits"]
+        commit_info = "\n".join(
+            f"- `{c['hash'][:7]}` {c['message'][:50]}"
+            for c in commits
+        ) if commits else "No commits"
 
-            return f"""
-**Current Branch:** `{status['branch']}`
-**Working Tree Clean:** {status['clean']}
+        return f"""
+**Current Branch:** `{snapshot['branch']}`
+**Working Tree Clean:** {snapshot['clean']}
 
 **Recent Commits:**
 {commit_info}
 """
-        except Exception as e:
-            return f"Error getting git info: {e}"
 
-    def _generate_checklist(self) -> str:
+    def _generate_checklist(self, snapshot: dict[str, Any] | None) -> str:
         """Generate verification checklist."""
         items = [
             ("Plan created", self.plan is not None),
@@ -326,7 +446,7 @@ class Executor:
             ("Tasks executed", len(self.proposals) > 0),
             ("All tasks successful", all(p.success for p in self.proposals)),
             ("Changes applied", len(self.modified_files) > 0),
-            ("Changes committed", self.git_ops.get_status()["clean"] if self.git_ops else False),
+            ("Changes committed", snapshot["clean"] if snapshot else False),
             ("Report generated", True),
         ]
 
@@ -357,7 +477,7 @@ class Executor:
             self.commit_changes()
 
             self.context.set_status(RunStatus.COMPLETED)
-            report = self.generate_report()
+            self.generate_report()
             self.context.save()
 
             return str(self.context.report_file)
@@ -369,6 +489,14 @@ class Executor:
             self.context.save()
             raise
 
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop the git processes kept open for the run."""
+        if self.git_ops:
+            self.git_ops.close()
+
 
 def execute_run(repo_path: str | Path, goal: str) -> str:
     """Convenience function to execute a complete run.
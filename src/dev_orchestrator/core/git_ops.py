@@ -7,7 +7,9 @@ Safety guarantees:
 - All operations are logged
 """
 
+import re
 import subprocess
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -16,6 +18,25 @@ from typing import Any
 from .config import get_config
 from .run_context import RunContext
 
+# Objects looked up per cat-file request/flush cycle
+_CAT_FILE_GROUP = 64
+
+# First git release with `cat-file --batch-command`
+_BATCH_COMMAND_VERSION = (2, 36)
+_GIT_VERSION = re.compile(r"(\d+)\.(\d+)")
+
+# Characters dropped from branch slugs: all but letters, digits and spaces
+# (\w is str.isalnum() plus the underscore)
+_SLUG_DROP = re.compile(r"[^\w ]|_")
+
+# Fields before the path in porcelain v2 status entries: 8 for changed, 9
+# for renamed or copied (followed by the original path), 10 for unmerged
+_STATUS_SPLITS = {"1": 8, "2": 9, "u": 10}
+
+# get_log fields, NUL-separated like the commits themselves (-z)
+_LOG_KEYS = ("hash", "author", "email", "date", "message")
+_LOG_FORMAT = "%x00".join(("%H", "%an", "%ae", "%ad", "%s"))
+
 
 class GitError(Exception):
     """Exception for git operation failures."""
@@ -26,7 +47,7 @@ class GitError(Exception):
         self.stderr = stderr
 
 
-@dataclass
+@dataclass(slots=True)
 class GitResult:
     """Result of a git command execution."""
 
@@ -56,12 +77,48 @@ class GitOps:
         self.repo_path = Path(repo_path).resolve()
         self.context = context
         self.config = get_config()
+        # Long-lived `git cat-file --batch-command` process, started on first read
+        self._cat_file: subprocess.Popen[bytes] | None = None
+        self._cat_file_lock = threading.Lock()
+        # Whether git supports --batch-command, checked on first read
+        self._batch_command: bool | None = None
+        # Lookups that do not change within a run, filled on first use.
+        # Only positive answers are kept for validity and branch existence,
+        # since a repo or branch can appear later but not disappear on its own.
+        self._is_valid = False
+        self._default_branch: str | None = None
+        self._current_branch: str | None = None
+        self._known_branches: set[str] = set()
+
+    def close(self) -> None:
+        """Stop the persistent cat-file process, if running."""
+        proc, self._cat_file = self._cat_file, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+        proc.stdout.close()
+
+    def __enter__(self) -> "GitOps":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Last resort only; owners close explicitly (see close)
+        if getattr(self, "_cat_file", None) is not None:
+            self.close()
 
     def _run_git(
         self,
         args: list[str],
         check: bool = True,
         capture_output: bool = True,
+        input: str | None = None,
     ) -> GitResult:
         """Execute a git command safely.
 
@@ -69,6 +126,7 @@ class GitOps:
             args: Git command arguments (without 'git' prefix)
             check: Raise exception on non-zero exit
             capture_output: Capture stdout/stderr
+            input: Text passed to the command's stdin
 
         Returns:
             GitResult with command output
@@ -84,6 +142,7 @@ class GitOps:
                 cmd,
                 cwd=self.repo_path,
                 capture_output=capture_output,
+                input=input,
                 text=True,
                 timeout=120,  # 2 minute timeout
             )
@@ -110,19 +169,37 @@ class GitOps:
 
     def validate_repo(self) -> bool:
         """Check if the path is a valid git repository."""
+        if self._is_valid:
+            return True
         if not self.repo_path.exists():
             return False
 
         result = self._run_git(["rev-parse", "--git-dir"], check=False)
+        self._is_valid = result.success
         return result.success
 
-    def get_current_branch(self) -> str:
-        """Get the current branch name."""
-        result = self._run_git(["rev-parse", "--abbrev-ref", "HEAD"])
-        return result.stdout
+    def get_current_branch(self, refresh: bool = False) -> str:
+        """Get the current branch name.
+
+        Args:
+            refresh: Ask git even if the branch is already known
+
+        Returns:
+            Branch name, tracked across checkouts made through this instance
+        """
+        if self._current_branch is None or refresh:
+            result = self._run_git(["rev-parse", "--abbrev-ref", "HEAD"])
+            self._current_branch = result.stdout
+        return self._current_branch
 
     def get_default_branch(self) -> str:
-        """Detect the default branch (main or master)."""
+        """Detect the default branch (main or master), once per instance."""
+        if self._default_branch is None:
+            self._default_branch = self._detect_default_branch()
+        return self._default_branch
+
+    def _detect_default_branch(self) -> str:
+        """Ask git for the default branch."""
         # Try to get from remote
         result = self._run_git(
             ["symbolic-ref", "refs/remotes/origin/HEAD"],
@@ -134,8 +211,7 @@ class GitOps:
 
         # Fallback: check if main or master exists
         for branch in ["main", "master"]:
-            result = self._run_git(["rev-parse", "--verify", branch], check=False)
-            if result.success:
+            if self.branch_exists(branch):
                 return branch
 
         return self.config.default_branch
@@ -145,9 +221,25 @@ class GitOps:
         return branch in self.PROTECTED_BRANCHES
 
     def branch_exists(self, branch: str) -> bool:
-        """Check if a branch exists locally."""
-        result = self._run_git(["rev-parse", "--verify", branch], check=False)
-        return result.success
+        """Check if a branch exists locally.
+
+        Asked of the persistent cat-file process (which reads refs afresh on
+        every request) when it is already running for file reads; otherwise a
+        one-off ``git rev-parse`` is cheaper than starting it.
+        """
+        if branch in self._known_branches:
+            return True
+        if "\n" in branch:
+            return False  # Not a valid branch name
+        ref = f"refs/heads/{branch}"
+        if self._cat_file is not None and self._cat_file.poll() is None:
+            [(size, _)] = self._cat_file_batch([ref], contents=False)
+            exists = size is not None
+        else:
+            exists = self._run_git(["rev-parse", "--verify", "--quiet", ref], check=False).success
+        if exists:
+            self._known_branches.add(branch)
+        return exists
 
     def create_branch(self, branch_name: str, base_branch: str | None = None) -> GitResult:
         """Create a new branch from base branch.
@@ -164,9 +256,12 @@ class GitOps:
 
         # Ensure we're starting from a clean state
         self._run_git(["checkout", base])
+        self._current_branch = base
         self._run_git(["pull", "--ff-only"], check=False)  # Try to pull, but don't fail
 
         result = self._run_git(["checkout", "-b", branch_name])
+        self._current_branch = branch_name
+        self._known_branches.add(branch_name)
 
         if self.context:
             self.context.log("INFO", f"Created branch: {branch_name} from {base}")
@@ -179,18 +274,38 @@ class GitOps:
         if not self.branch_exists(branch_name):
             raise GitError(f"Branch does not exist: {branch_name}")
 
-        return self._run_git(["checkout", branch_name])
+        result = self._run_git(["checkout", branch_name])
+        self._current_branch = branch_name
+        return result
 
     def get_status(self) -> dict[str, Any]:
-        """Get repository status."""
-        result = self._run_git(["status", "--porcelain"])
+        """Get repository status.
+
+        One ``git status --porcelain=v2 --branch`` gives both the branch and
+        the changed files.
+        """
+        result = self._run_git(["status", "--porcelain=v2", "--branch", "-z"])
 
+        branch = ""
         files = {"modified": [], "added": [], "deleted": [], "untracked": []}
-        for line in result.stdout.splitlines():
-            if not line.strip():
+        records = iter(result.stdout.split("\0"))
+        for record in records:
+            kind = record[:1]
+            if kind == "#":
+                if record.startswith("# branch.head "):
+                    branch = record[len("# branch.head "):]
+                continue
+            if kind == "?":
+                files["untracked"].append(record[2:])
                 continue
-            status = line[:2]
-            filepath = line[3:]
+            splits = _STATUS_SPLITS.get(kind)
+            if splits is None:
+                continue
+
+            filepath = record.split(" ", splits)[-1]
+            status = record[2:4]  # XY, right after the kind
+            if kind == "2":
+                next(records, None)
 
             if status[0] == "M" or status[1] == "M":
                 files["modified"].append(filepath)
@@ -198,31 +313,49 @@ class GitOps:
                 files["added"].append(filepath)
             elif status[0] == "D" or status[1] == "D":
                 files["deleted"].append(filepath)
-            elif status[0] == "?":
-                files["untracked"].append(filepath)
 
+        # Same as `rev-parse --abbrev-ref HEAD` for a detached HEAD
+        self._current_branch = "HEAD" if branch == "(detached)" else branch
         return {
-            "branch": self.get_current_branch(),
+            "branch": self._current_branch,
             "files": files,
             "clean": not any(files.values()),
         }
 
+    def snapshot(self, log_count: int = 3) -> dict[str, Any]:
+        """Get status, branch and recent commits for a report.
+
+        Args:
+            log_count: Number of commits to include
+
+        Returns:
+            get_status() result plus a "commits" list from get_log()
+        """
+        return {**self.get_status(), "commits": self.get_log(log_count)}
+
     def stage_files(self, files: list[str] | None = None) -> GitResult:
         """Stage files for commit.
 
         Args:
             files: List of files to stage, or None for all changes
+
+        Paths are streamed NUL-separated on stdin, so any number of files
+        is staged by one git process without hitting argv limits.
         """
         if files:
-            return self._run_git(["add"] + files)
+            return self._run_git(
+                ["add", "--pathspec-from-file=-", "--pathspec-file-nul"],
+                input="\0".join(files),
+            )
         return self._run_git(["add", "-A"])
 
     def commit(self, message: str, allow_empty: bool = False) -> GitResult:
         """Create a commit with the staged changes.
 
-        Safety: Refuses to commit on protected branches.
+        Safety: Refuses to commit on protected branches. The branch is
+        re-read from git, in case it was switched outside this instance.
         """
-        current_branch = self.get_current_branch()
+        current_branch = self.get_current_branch(refresh=True)
         if self.is_protected_branch(current_branch):
             raise GitError(f"Cannot commit directly to protected branch: {current_branch}")
 
@@ -260,27 +393,20 @@ class GitOps:
             count: Number of commits to retrieve
             branch: Branch to get log from (default: current)
         """
-        format_str = "%H|%an|%ae|%ad|%s"
-        args = ["log", f"-{count}", f"--format={format_str}", "--date=iso"]
+        args = ["log", f"-{count}", "-z", f"--format={_LOG_FORMAT}", "--date=iso"]
         if branch:
             args.append(branch)
 
         result = self._run_git(args)
 
-        commits = []
-        for line in result.stdout.splitlines():
-            if "|" in line:
-                parts = line.split("|", 4)
-                if len(parts) == 5:
-                    commits.append({
-                        "hash": parts[0],
-                        "author": parts[1],
-                        "email": parts[2],
-                        "date": parts[3],
-                        "message": parts[4],
-                    })
-
-        return commits
+        # NULs cannot appear in any field, so one split gives every field of
+        # every commit, in order
+        fields = result.stdout.split("\0") if result.stdout else []
+        n = len(_LOG_KEYS)
+        return [
+            dict(zip(_LOG_KEYS, fields[i:i + n]))
+            for i in range(0, len(fields) - n + 1, n)
+        ]
 
     def get_file_list(self, branch: str | None = None) -> list[str]:
         """Get list of all tracked files."""
@@ -288,22 +414,195 @@ class GitOps:
         result = self._run_git(args)
         return result.stdout.splitlines()
 
-    def read_file(self, file_path: str, ref: str = "HEAD") -> str:
-        """Read file content at a specific ref."""
-        result = self._run_git(["show", f"{ref}:{file_path}"])
+    def read_file(
+        self,
+        file_path: str,
+        ref: str = "HEAD",
+        max_bytes: int | None = None,
+    ) -> str | None:
+        """Read file content at a specific ref.
+
+        Reads go through one long-lived ``git cat-file --batch-command``
+        process rather than a ``git show`` per file, on git versions that
+        support it.
+
+        Args:
+            file_path: Path relative to the repository root
+            ref: Ref to read the file from
+            max_bytes: Skip files larger than this; their size is checked
+                before any content is read
+
+        Returns:
+            File content, or None if the file exceeds max_bytes
+        """
+        spec = f"{ref}:{file_path}"
+        if "\n" in spec or not self._has_batch_command():
+            # Newlines are not expressible in the line-based cat-file protocol
+            return self._show_file(spec, max_bytes)
+
+        [(size, data)] = self._cat_file_batch([spec], max_bytes)
+        if size is None:
+            raise GitError(f"Git object not found: {spec}")
+        return None if data is None else data.decode("utf-8", errors="replace").strip()
+
+    def read_files(
+        self,
+        file_paths: list[str],
+        ref: str = "HEAD",
+        max_bytes: int | None = None,
+    ) -> dict[str, str]:
+        """Read several files at a specific ref in one cat-file round trip.
+
+        Args:
+            file_paths: Paths relative to the repository root
+            ref: Ref to read the files from
+            max_bytes: Skip files larger than this
+
+        Returns:
+            Content per path, leaving out missing and skipped files
+        """
+        if not self._has_batch_command():
+            contents = {}
+            for path in file_paths:
+                try:
+                    content = self._show_file(f"{ref}:{path}", max_bytes)
+                except GitError:
+                    continue  # Missing
+                if content is not None:
+                    contents[path] = content
+            return contents
+
+        paths = [p for p in file_paths if "\n" not in p]
+        results = self._cat_file_batch([f"{ref}:{p}" for p in paths], max_bytes)
+        return {
+            path: data.decode("utf-8", errors="replace").strip()
+            for path, (_, data) in zip(paths, results)
+            if data is not None
+        }
+
+    def _cat_file_batch(
+        self, specs: list[str], max_bytes: int | None = None, contents: bool = True
+    ) -> list[tuple[int | None, bytes | None]]:
+        """Look up objects through the persistent cat-file process.
+
+        All sizes are requested under one flush, then the contents of the
+        objects within max_bytes under a second one: two round trips per
+        group of _CAT_FILE_GROUP objects, rather than one process per file.
+
+        Args:
+            specs: Objects to look up, as <ref>:<path> or any other revision
+            max_bytes: Don't read objects larger than this
+            contents: Read contents at all, rather than only sizes
+
+        Returns:
+            (size, content) per spec; size is None for a missing object and
+            content is None when the object is missing or too large
+        """
+        results: list[tuple[int | None, bytes | None]] = []
+        # Requests are sent in groups so a write never fills the stdin pipe
+        # while git is blocked writing replies nobody is reading yet
+        for start in range(0, len(specs), _CAT_FILE_GROUP):
+            group = specs[start:start + _CAT_FILE_GROUP]
+            with self._cat_file_lock:
+                try:
+                    results.extend(self._cat_file_group(group, max_bytes, contents))
+                except GitError:
+                    self.close()
+                    raise
+                except OSError as e:
+                    # BrokenPipeError once git has exited
+                    self.close()
+                    raise GitError(f"git cat-file failed: {e}") from e
+        return results
+
+    def _cat_file_group(
+        self, specs: list[str], max_bytes: int | None, contents: bool
+    ) -> list[tuple[int | None, bytes | None]]:
+        """Look up one group of objects; the caller holds _cat_file_lock."""
+        proc = self._cat_file_process()
+
+        # --buffer holds replies until an explicit flush
+        proc.stdin.write("".join(f"info {spec}\n" for spec in specs).encode() + b"flush\n")
+        proc.stdin.flush()
+        sizes = [self._read_cat_file_header(proc) for _ in specs]
+
+        wanted = [
+            i for i, size in enumerate(sizes)
+            if contents and size is not None and (max_bytes is None or size <= max_bytes)
+        ]
+        data: list[bytes | None] = [None] * len(specs)
+        if wanted:
+            request = "".join(f"contents {specs[i]}\n" for i in wanted)
+            proc.stdin.write(request.encode() + b"flush\n")
+            proc.stdin.flush()
+            for i in wanted:
+                size = self._read_cat_file_header(proc)
+                # Each object is followed by a newline
+                content = proc.stdout.read(size + 1)
+                if len(content) != size + 1:
+                    raise GitError("git cat-file exited unexpectedly")
+                data[i] = content[:size]
+
+        return list(zip(sizes, data))
+
+    def _cat_file_process(self) -> subprocess.Popen[bytes]:
+        """Get the cat-file process, starting it if needed."""
+        if self._cat_file is None or self._cat_file.poll() is not None:
+            cmd = [self.config.git_executable, "cat-file", "--batch-command", "--buffer"]
+            if self.context:
+                self.context.log("DEBUG", f"Git command: {' '.join(cmd)}")
+            self._cat_file = subprocess.Popen(
+                cmd,
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=131072,  # Amortize read syscalls over large objects
+            )
+        return self._cat_file
+
+    def _has_batch_command(self) -> bool:
+        """Check once whether git supports ``cat-file --batch-command`` (git 2.36+)."""
+        if self._batch_command is None:
+            result = self._run_git(["version"], check=False)
+            match = _GIT_VERSION.search(result.stdout)
+            self._batch_command = (
+                match is not None
+                and (int(match[1]), int(match[2])) >= _BATCH_COMMAND_VERSION
+            )
+        return self._batch_command
+
+    def _show_file(self, spec: str, max_bytes: int | None) -> str | None:
+        """Read one object with ``git show``, None if it exceeds max_bytes."""
+        result = self._run_git(["show", spec])
+        if max_bytes is not None and len(result.stdout.encode()) > max_bytes:
+            return None
         return result.stdout
 
+    @staticmethod
+    def _read_cat_file_header(proc: subprocess.Popen[bytes]) -> int | None:
+        """Read one reply header, returning the object size (None if missing).
+
+        Raises:
+            GitError: If git exited instead of replying
+        """
+        line = proc.stdout.readline()
+        if not line:
+            raise GitError("git cat-file exited unexpectedly")
+        # "<oid> <type> <size>", or "<spec> missing" / "<spec> ambiguous"
+        fields = line.rstrip(b"\n").rsplit(b" ", 2)
+        if len(fields) != 3 or not fields[2].isdigit():
+            return None
+        return int(fields[2])
+
     def generate_branch_name(self, goal: str) -> str:
         """Generate a deterministic branch name from goal.
 
         Format: {prefix}/{date}/{slug}
         """
-        # Create slug from goal
-        slug = goal.lower()
-        # Keep only alphanumeric and spaces
-        slug = "".join(c if c.isalnum() or c == " " else "" for c in slug)
-        # Replace spaces with dashes, limit length
-        slug = "-".join(slug.split())[:40]
+        # Keep only alphanumeric characters and spaces, then replace spaces
+        # with dashes and limit length
+        slug = "-".join(_SLUG_DROP.sub("", goal.lower()).split())[:40]
 
         date = datetime.now().strftime("%Y%m%d")
 
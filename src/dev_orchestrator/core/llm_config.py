@@ -4,16 +4,23 @@ Handles OpenAI setup with environment variables.
 Never stores secrets in code.
 """
 
+import asyncio
 import os
+import weakref
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
+from .config import load_dotenv_once
 
-# Load .env file if present
-load_dotenv()
+if TYPE_CHECKING:
+    import httpx
+    from langchain_openai import ChatOpenAI
+
+# One HTTP client per event loop, shared by every chat model created on it
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
 @dataclass
@@ -29,10 +36,19 @@ class LLMConfig:
     # Rate limiting
     max_retries: int = 3
     request_timeout: int = 60
+    max_concurrency: int = 4
+
+    # Send implementer/tester/documenter as one multi-role request
+    batch_parallel_agents: bool = False
 
     @classmethod
     def from_env(cls) -> "LLMConfig":
-        """Load configuration from environment variables."""
+        """Load configuration from environment variables.
+
+        A .env file, if present, is loaded into the environment first (see
+        load_dotenv_once).
+        """
+        load_dotenv_once()
         return cls(
             openai_api_key=os.getenv("OPENAI_API_KEY"),
             openai_model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
@@ -40,6 +56,9 @@ class LLMConfig:
             max_tokens=int(os.getenv("OPENAI_MAX_TOKENS", "4096")),
             max_retries=int(os.getenv("OPENAI_MAX_RETRIES", "3")),
             request_timeout=int(os.getenv("OPENAI_TIMEOUT", "60")),
+            max_concurrency=int(os.getenv("OPENAI_MAX_CONCURRENCY", "4")),
+            batch_parallel_agents=os.getenv("OPENAI_BATCH_PARALLEL_AGENTS", "false").lower()
+            in ("true", "1", "yes"),
         )
 
     def validate(self) -> bool:
@@ -57,13 +76,58 @@ def get_llm_config() -> LLMConfig:
     return LLMConfig.from_env()
 
 
+def get_http_async_client(config: LLMConfig | None = None) -> "httpx.AsyncClient | None":
+    """Get the HTTP client shared by chat models on the running event loop.
+
+    Reusing one connection pool saves a TCP and TLS handshake per agent.
+    Clients are bound to the loop they were created on, so each loop gets
+    its own.
+
+    Args:
+        config: LLM configuration (uses default if None)
+
+    Returns:
+        The loop's client, or None outside a running event loop
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    client = _http_clients.get(loop)
+    if client is None:
+        import httpx
+
+        config = config or get_llm_config()
+        client = _http_clients[loop] = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=httpx.Timeout(config.request_timeout),
+        )
+    return client
+
+
+async def close_http_async_client() -> None:
+    """Close the running event loop's shared HTTP client, if it has one.
+
+    Call before the loop shuts down; a later get_http_async_client on the
+    same loop creates a new client.
+    """
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 def create_chat_model(
     config: LLMConfig | None = None,
     temperature: float | None = None,
     model: str | None = None,
-) -> ChatOpenAI:
+) -> "ChatOpenAI":
     """Create a ChatOpenAI instance.
 
+    Models created inside a running event loop share its HTTP client.
+    langchain_openai (like httpx and dotenv) is imported on first use, so
+    importing this module to read the configuration stays cheap.
+
     Args:
         config: LLM configuration (uses default if None)
         temperature: Override temperature
@@ -84,6 +148,8 @@ def create_chat_model(
             "Set OPENAI_API_KEY environment variable or create .env file."
         )
 
+    from langchain_openai import ChatOpenAI
+
     return ChatOpenAI(
         api_key=config.openai_api_key,
         model=model or config.openai_model,
@@ -91,12 +157,17 @@ def create_chat_model(
         max_tokens=config.max_tokens,
         max_retries=config.max_retries,
         request_timeout=config.request_timeout,
+        http_async_client=get_http_async_client(config),
     )
 
 
+@lru_cache(maxsize=1)
 def check_llm_available() -> tuple[bool, str]:
     """Check if LLM is available and configured.
 
+    Cached like get_llm_config, which it checks; clear both with
+    cache_clear() after changing the environment.
+
     Returns:
         Tuple of (is_available, message)
     """
@@ -5,7 +5,6 @@ In MVP, this is a simple rule-based decomposition.
 Future: integrate with LLM for smarter planning.
 """
 
-import json
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -13,6 +12,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from .run_context import RunContext
 
 
@@ -108,14 +109,12 @@ class Plan:
 
     def save(self, path: Path) -> None:
         """Save plan to JSON file."""
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        path.write_bytes(orjson.dumps(self.to_dict()))
 
     @classmethod
     def load(cls, path: Path) -> "Plan":
         """Load plan from JSON file."""
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(path.read_bytes())
 
         return cls(
             goal=data["goal"],
@@ -138,6 +137,32 @@ class Plan:
 
         return pending
 
+    def levels(self) -> list[list[Task]]:
+        """Group tasks into levels whose tasks don't depend on each other.
+
+        Every task comes after the levels holding its dependencies, and keeps
+        plan order within its level. Dependencies on unknown task IDs are
+        ignored; tasks in a dependency cycle get one level each, in plan order.
+        """
+        known = {t.id for t in self.tasks}
+        placed: set[str] = set()
+        remaining = self.tasks
+        levels: list[list[Task]] = []
+
+        while remaining:
+            level = [
+                t for t in remaining
+                if all(dep in placed or dep not in known for dep in t.dependencies)
+            ]
+            if not level:
+                levels.extend([t] for t in remaining)
+                break
+            levels.append(level)
+            placed.update(t.id for t in level)
+            remaining = [t for t in remaining if t.id not in placed]
+
+        return levels
+
     def get_task(self, task_id: str) -> Task | None:
         """Get task by ID."""
         for task in self.tasks:
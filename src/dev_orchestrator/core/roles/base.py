@@ -9,7 +9,7 @@ from ..planner import Task
 from ..run_context import RunContext
 
 
-@dataclass
+@dataclass(slots=True)
 class RoleProposal:
     """Output from a role's execution.
 
@@ -3,20 +3,28 @@
 Each run has:
 - Unique ID (timestamp-based for determinism)
 - Dedicated directory for artifacts
-- State tracking (JSON)
+- State tracking (JSON), checkpointed in full and journaled per task
 - Timestamps for auditability
 """
 
-import json
+import heapq
+import os
 import uuid
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from .config import get_config
 
+# Separator after the summary fields in a saved state file (orjson output
+# is compact)
+_HEAD_END = b',"tasks":'
+
 
 class RunStatus(str, Enum):
     """Status of a run."""
@@ -47,6 +55,12 @@ class RunContext:
     logs: list[dict[str, Any]] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
     artifacts: dict[str, str] = field(default_factory=dict)
+    # Per-agent time limit in seconds for the parallel phase (None = no limit)
+    agent_timeout: float | None = None
+    # Agent response cache: "off" or "exact" (see agents.response_cache)
+    cache_mode: str = "off"
+    # Whether state changed since the last save (not persisted)
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)
 
     @classmethod
     def create(cls, repo_path: str | Path, goal: str) -> "RunContext":
@@ -82,6 +96,11 @@ class RunContext:
         """Path to the task plan JSON file."""
         return self.run_dir / "plan.json"
 
+    @property
+    def journal_file(self) -> Path:
+        """Path to the append-only event journal (one JSON object per line)."""
+        return self.run_dir / "events.jsonl"
+
     @property
     def log_file(self) -> Path:
         """Path to the execution log file."""
@@ -102,6 +121,7 @@ class RunContext:
             entry["data"] = data
         self.logs.append(entry)
         self.updated_at = datetime.now()
+        self._dirty = True
 
     def add_error(self, error: str) -> None:
         """Record an error."""
@@ -128,6 +148,8 @@ class RunContext:
             "logs": self.logs,
             "errors": self.errors,
             "artifacts": self.artifacts,
+            "agent_timeout": self.agent_timeout,
+            "cache_mode": self.cache_mode,
         }
 
     def save(self) -> None:
@@ -135,8 +157,43 @@ class RunContext:
         self.ensure_run_dir()
         self.updated_at = datetime.now()
 
-        with open(self.state_file, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        self.state_file.write_bytes(orjson.dumps(self.to_dict(), option=orjson.OPT_NON_STR_KEYS))
+        self._dirty = False
+
+    def journal_append(self, *events: dict[str, Any]) -> None:
+        """Append events to the journal without rewriting the saved state.
+
+        Appending costs only the size of the events, where save() rewrites
+        the whole state, so progress can be recorded after every task and
+        the state checkpointed less often.
+
+        Args:
+            *events: JSON-serializable events, written one per line
+        """
+        if not events:
+            return
+        self.ensure_run_dir()
+        timestamp = datetime.now().isoformat()
+        with self.journal_file.open("ab") as f:
+            f.write(b"".join(
+                orjson.dumps({"timestamp": timestamp, **event}, option=orjson.OPT_APPEND_NEWLINE)
+                for event in events
+            ))
+
+    def iter_journal(self) -> Iterator[dict[str, Any]]:
+        """Yield the journaled events, oldest first."""
+        try:
+            f = self.journal_file.open("rb")
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                yield orjson.loads(line)
+
+    def save_if_dirty(self) -> None:
+        """Persist state if it was logged to since the last save."""
+        if self._dirty:
+            self.save()
 
     @classmethod
     def load(cls, run_id: str) -> "RunContext":
@@ -147,8 +204,7 @@ class RunContext:
         if not state_file.exists():
             raise FileNotFoundError(f"Run not found: {run_id}")
 
-        with open(state_file, encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(state_file.read_bytes())
 
         ctx = cls(
             run_id=data["run_id"],
@@ -162,17 +218,73 @@ class RunContext:
             logs=data.get("logs", []),
             errors=data.get("errors", []),
             artifacts=data.get("artifacts", {}),
+            agent_timeout=data.get("agent_timeout"),
+            cache_mode=data.get("cache_mode", "off"),
         )
         return ctx
 
     @classmethod
-    def list_runs(cls) -> list[str]:
-        """List all run IDs."""
-        config = get_config()
-        if not config.runs_dir.exists():
-            return []
-        return [
-            d.name
-            for d in config.runs_dir.iterdir()
-            if d.is_dir() and (d / "state.json").exists()
-        ]
+    def load_summary(cls, run_id: str) -> tuple[RunStatus, str]:
+        """Load only a run's status and goal.
+
+        Both are saved ahead of the tasks and logs (see to_dict), so only
+        the head of the state file is read and parsed.
+
+        Args:
+            run_id: Run to load
+
+        Returns:
+            (status, goal)
+
+        Raises:
+            FileNotFoundError: If the run has no saved state
+        """
+        state_file = get_config().runs_dir / run_id / "state.json"
+        if not state_file.exists():
+            raise FileNotFoundError(f"Run not found: {run_id}")
+
+        head = b""
+        with state_file.open("rb") as f:
+            while chunk := f.read(4096):
+                start = max(0, len(head) - len(_HEAD_END))
+                head += chunk
+                # Quotes inside JSON strings are escaped, so this can't match in the goal
+                end = head.find(_HEAD_END, start)
+                if end != -1:
+                    data = orjson.loads(head[:end] + b"}")
+                    break
+            else:
+                data = orjson.loads(head)
+
+        return RunStatus(data["status"]), data["goal"]
+
+    @classmethod
+    def list_runs(cls, limit: int | None = None) -> list[str]:
+        """List run IDs.
+
+        Args:
+            limit: Only list this many of the most recent runs, newest first
+
+        Returns:
+            Run IDs, in directory order when no limit is given
+        """
+        if limit is None:
+            return list(cls.iter_runs())
+        # Run IDs start with a timestamp, so the largest are the most recent
+        return heapq.nlargest(limit, cls.iter_runs())
+
+    @classmethod
+    def iter_runs(cls) -> Iterator[str]:
+        """Yield run IDs, in directory order.
+
+        Run IDs start with their creation timestamp, so they sort by age.
+        """
+        try:
+            entries = os.scandir(get_config().runs_dir)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                # DirEntry caches the type from the directory read itself
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, "state.json")):
+                    yield entry.name
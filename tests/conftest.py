@@ -0,0 +1,76 @@
+"""Shared test fixtures."""
+
+import json
+from typing import Any
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+
+class FakeToolChatModel(BaseChatModel):
+    """Chat model answering every request with one streamed tool call."""
+
+    tool_args: dict[str, Any]
+    chunk_size: int = 16
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-tool"
+
+    def _tool_name(self, kwargs: dict[str, Any]) -> str:
+        return kwargs["tools"][0]["function"]["name"]
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        self.calls += 1
+        message = AIMessage(
+            content="",
+            tool_calls=[{"name": self._tool_name(kwargs), "args": self.tool_args, "id": "call_0"}],
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls += 1
+        args = json.dumps(self.tool_args)
+        for i in range(0, len(args), self.chunk_size):
+            first = i == 0
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(
+                    content="",
+                    tool_call_chunks=[{
+                        "name": self._tool_name(kwargs) if first else None,
+                        "args": args[i:i + self.chunk_size],
+                        "id": "call_0" if first else None,
+                        "index": 0,
+                    }],
+                )
+            )
+
+    def bind_tools(self, tools, **kwargs):
+        return self.bind(tools=[convert_to_openai_tool(t) for t in tools], **kwargs)
+
+
+AGENT_ARGS = {
+    "success": True,
+    "summary": "Done",
+    "reasoning": "Because",
+    "file_changes": [
+        {
+            "path": "health.py",
+            "action": "create",
+            "content": "ok = True\n",
+            "description": "Health",
+        },
+    ],
+    "recommendations": ["Ship it"],
+    "issues": [],
+}
+
+
+@pytest.fixture
+def fake_llm() -> FakeToolChatModel:
+    """A fake chat model returning AGENT_ARGS as structured output."""
+    return FakeToolChatModel(tool_args=AGENT_ARGS)
@@ -0,0 +1,273 @@
+"""Tests for agent executor helpers."""
+
+import asyncio
+import json
+import subprocess
+
+import pytest
+
+from dev_orchestrator.agents.agent_executor import (
+    AgentExecutor,
+    render_report,
+    select_important_files,
+)
+from dev_orchestrator.agents.base_agent import AgentOutput, AgentOutputRecord, FileChange
+from dev_orchestrator.core.config import get_config, reset_config
+from dev_orchestrator.core.git_ops import GitOps
+from dev_orchestrator.core.run_context import RunContext
+
+
+@pytest.fixture
+def runs_dir(tmp_path):
+    """Point the global config at a temporary runs directory."""
+    reset_config()
+    config = get_config()
+    config.runs_dir = tmp_path / "runs"
+    yield config.runs_dir
+    reset_config()
+
+
+def _change(path: str, action: str = "create", content: str = "") -> FileChange:
+    return FileChange(path=path, action=action, content=content, description="test")
+
+
+class TestSelectImportantFiles:
+    """Tests for select_important_files."""
+
+    def test_first_match_per_pattern(self):
+        """Test that only the first file per basename is selected."""
+        files = ["docs/README.md", "README.md", "pyproject.toml", "src/app.py"]
+
+        assert select_important_files(files) == ["docs/README.md", "pyproject.toml", "src/app.py"]
+
+    def test_shared_basename_patterns(self):
+        """Test that one file satisfies patterns sharing a basename."""
+        files = ["pkg/main.py", "main.py"]
+
+        assert select_important_files(files) == ["pkg/main.py"]
+
+    def test_ignores_suffix_only_matches(self):
+        """Test that files merely ending with a pattern are not selected."""
+        files = ["domain.py", "myapp.py", "notes.txt"]
+
+        assert select_important_files(files) == []
+
+    def test_empty_file_list(self):
+        """Test selection on an empty repository."""
+        assert select_important_files([]) == []
+
+
+class TestApplyFileChanges:
+    """Tests for AgentExecutor.apply_file_changes."""
+
+    def test_creates_nested_files(self, tmp_path):
+        """Test that missing parent directories are created."""
+        executor = AgentExecutor(RunContext.create(tmp_path, "Test"))
+        executor.final_state = {
+            "all_file_changes": [
+                _change("src/pkg/a.py", content="a = 1\n"),
+                _change("src/pkg/b.py", content="b = 2\n"),
+            ],
+        }
+
+        modified = executor.apply_file_changes()
+
+        assert modified == ["src/pkg/a.py", "src/pkg/b.py"]
+        assert (tmp_path / "src/pkg/a.py").read_text(encoding="utf-8") == "a = 1\n"
+
+    def test_later_change_wins(self, tmp_path):
+        """Test that the last change for a path is applied."""
+        executor = AgentExecutor(RunContext.create(tmp_path, "Test"))
+        executor.final_state = {
+            "all_file_changes": [
+                _change("notes.md", content="first"),
+                _change("notes.md", action="modify", content="second"),
+            ],
+        }
+
+        assert executor.apply_file_changes() == ["notes.md"]
+        assert (tmp_path / "notes.md").read_text(encoding="utf-8") == "second"
+
+    def test_delete(self, tmp_path):
+        """Test deleting an existing file."""
+        (tmp_path / "old.txt").write_text("old")
+        executor = AgentExecutor(RunContext.create(tmp_path, "Test"))
+        executor.final_state = {"all_file_changes": [_change("old.txt", action="delete")]}
+
+        executor.apply_file_changes()
+
+        assert not (tmp_path / "old.txt").exists()
+
+    def test_failures_reported_in_order(self, tmp_path):
+        """Test that one failed write among many is reported without losing the others."""
+        (tmp_path / "blocker").write_text("a file, not a directory")
+        executor = AgentExecutor(RunContext.create(tmp_path, "Test"))
+        paths = [f"many/f{i}.txt" for i in range(20)]
+        executor.final_state = {
+            "all_file_changes": [_change(p, content=p) for p in paths[:10]]
+            + [_change("blocker/x.txt")]
+            + [_change(p, content=p) for p in paths[10:]],
+        }
+
+        assert executor.apply_file_changes() == paths
+        assert executor.context.errors[0].startswith("Failed to apply blocker/x.txt")
+        assert (tmp_path / paths[-1]).read_text(encoding="utf-8") == paths[-1]
+
+
+class TestSaveAgentOutputs:
+    """Tests for AgentExecutor._save_agent_outputs."""
+
+    def test_writes_one_file_per_output(self, tmp_path, runs_dir):
+        """Test that each available agent output is saved as JSON."""
+        context = RunContext.create(tmp_path, "Test")
+        context.ensure_run_dir()
+        executor = AgentExecutor(context)
+        executor.final_state = {
+            "architect_output": AgentOutputRecord(success=True, summary="Designed", reasoning="r"),
+            "tester_output": None,
+        }
+
+        asyncio.run(executor._save_agent_outputs())
+
+        outputs_dir = context.run_dir / "agent_outputs"
+        assert [p.name for p in outputs_dir.iterdir()] == ["architect.json"]
+        data = json.loads((outputs_dir / "architect.json").read_text(encoding="utf-8"))
+        assert data["summary"] == "Designed"
+        assert data["file_changes"] == []
+
+    def test_compact_by_default(self, tmp_path, runs_dir):
+        """Test that outputs are compact unless pretty_save is set."""
+        output = AgentOutputRecord(success=True, summary="Designed", reasoning="r")
+        for pretty in (False, True):
+            context = RunContext.create(tmp_path, "Test")
+            context.ensure_run_dir()
+            executor = AgentExecutor(context, pretty_save=pretty)
+            executor.final_state = {"architect_output": output}
+
+            asyncio.run(executor._save_agent_outputs())
+
+            saved = context.run_dir / "agent_outputs" / "architect.json"
+            text = saved.read_text(encoding="utf-8")
+            assert ("\n" in text) is pretty
+
+
+class TestExecuteWorkflow:
+    """Tests for AgentExecutor.execute_workflow."""
+
+    def test_failure_keeps_finished_outputs(self, tmp_path, runs_dir, fake_llm, monkeypatch):
+        """Test that the outputs of finished phases are saved when a later phase raises."""
+        from dev_orchestrator.agents import base_agent, workflow
+
+        async def failing_review(self, **kwargs):
+            raise RuntimeError("reviewer crashed")
+
+        monkeypatch.setattr(base_agent, "create_chat_model", lambda temperature=None: fake_llm)
+        monkeypatch.setattr(workflow.ReviewerAgent, "execute", failing_review)
+        context = RunContext.create(tmp_path, "Test")
+        context.ensure_run_dir()
+        executor = AgentExecutor(context)
+        executor.workflow = workflow.AgentWorkflow(context)
+
+        with pytest.raises(RuntimeError, match="reviewer crashed"):
+            asyncio.run(executor.execute_workflow())
+
+        outputs_dir = context.run_dir / "agent_outputs"
+        assert sorted(p.name for p in outputs_dir.iterdir()) == [
+            "architect.json", "documenter.json", "implementer.json", "tester.json",
+        ]
+        assert executor.final_state["current_phase"] == "parallel_done"
+
+
+class TestRepoContext:
+    """Tests for repository context gathering."""
+
+    @pytest.fixture
+    def executor(self, tmp_path):
+        for args in (
+            ["init"],
+            ["config", "user.email", "test@test.com"],
+            ["config", "user.name", "Test User"],
+        ):
+            subprocess.run(["git", *args], cwd=tmp_path, capture_output=True)
+        (tmp_path / "README.md").write_text("# Test\n")
+        subprocess.run(["git", "add", "."], cwd=tmp_path, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "init"], cwd=tmp_path, capture_output=True)
+
+        executor = AgentExecutor(RunContext.create(tmp_path, "Test"))
+        executor.git_ops = GitOps(tmp_path)
+        return executor
+
+    def test_async_matches_sync(self, executor):
+        """Test that both gatherers build the same context."""
+        sync_context = executor._gather_repo_context()
+        executor.invalidate_repo_context()
+        async_context = asyncio.run(executor._gather_repo_context_async())
+
+        assert async_context == sync_context
+        assert async_context["file_contents"] == {"README.md": "# Test"}
+
+    def test_aclose_stops_cat_file(self, executor):
+        """Test that closing the executor stops the git process used for reads."""
+        executor._gather_repo_context()
+        proc = executor.git_ops._cat_file
+        assert proc is not None
+
+        asyncio.run(executor.aclose())
+
+        assert proc.poll() is not None
+
+    def test_cached_until_invalidated(self, executor):
+        """Test that the context is reused until invalidated."""
+        first = executor._gather_repo_context()
+
+        assert asyncio.run(executor._gather_repo_context_async()) is first
+
+        executor.invalidate_repo_context()
+        assert executor._gather_repo_context() is not first
+
+
+class TestGenerateReport:
+    """Tests for report rendering."""
+
+    def test_render_report(self):
+        """Test rendering a report from plain data."""
+        run_info = {
+            "run_id": "run_1",
+            "goal": "Add healthcheck",
+            "repo_path": "/repo",
+            "branch": "N/A",
+            "status": "completed",
+            "created": "2024-01-01T00:00:00",
+        }
+        output = AgentOutput(
+            success=True,
+            summary="Implemented",
+            reasoning="because",
+            file_changes=[_change("health.py")],
+        )
+
+        report = render_report(
+            run_info, [("implementer", output.model_dump(mode="json"))], ["health.py"], []
+        )
+
+        assert "| Run ID | `run_1` |" in report
+        assert "### ✅ Implementer" in report
+        assert "- `health.py` (create): test" in report
+        assert "No errors." in report
+
+    def test_async_matches_sync(self, tmp_path, runs_dir):
+        """Test that the threaded report equals the synchronous one."""
+        context = RunContext.create(tmp_path, "Test")
+        context.ensure_run_dir()
+        executor = AgentExecutor(context)
+        executor.final_state = {
+            "architect_output": AgentOutputRecord(success=False, summary="Failed", reasoning="r"),
+        }
+
+        report_path = executor.generate_report()
+        sync_report = context.report_file.read_text(encoding="utf-8")
+        async_path = asyncio.run(executor.generate_report_async())
+
+        assert report_path == async_path == str(context.report_file)
+        assert context.report_file.read_text(encoding="utf-8") == sync_report
+        assert "Failed" in sync_report
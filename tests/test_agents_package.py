@@ -0,0 +1,46 @@
+"""Tests for the agents package exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import dev_orchestrator.agents as agents
+
+
+def test_lazy_exports_resolve():
+    """Test that every public name can be imported from the package."""
+    from dev_orchestrator.agents import AgentExecutor, ArchitectAgent
+
+    assert ArchitectAgent.name == "architect"
+    assert AgentExecutor.__name__ == "AgentExecutor"
+    for name in agents.__all__:
+        assert getattr(agents, name) is not None
+
+
+def test_unknown_attribute():
+    """Test that unknown names still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        agents.NotAnAgent
+
+
+def test_import_does_not_load_langchain():
+    """Test that importing the package alone defers LangChain."""
+    code = (
+        "import sys, dev_orchestrator.agents; "
+        "sys.exit('langchain_core' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+    assert result.returncode == 0
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["ArchitectAgent", "ImplementerAgent", "TesterAgent", "DocumenterAgent", "ReviewerAgent",
+     "BatchedParallelAgent"],
+)
+def test_agents_execute_async(name):
+    """Test that agents run as coroutines, so their LLM calls overlap on one loop."""
+    import inspect
+
+    assert inspect.iscoroutinefunction(getattr(agents, name).execute)
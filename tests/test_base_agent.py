@@ -0,0 +1,315 @@
+"""Tests for base agent helpers."""
+
+import asyncio
+import dataclasses
+
+import pytest
+
+from dev_orchestrator.agents.base_agent import (
+    AgentOutput,
+    AgentOutputRecord,
+    FileChange,
+    FileChangeRecord,
+    summarize_architect_output,
+)
+from dev_orchestrator.agents.batched_agent import BatchedParallelAgent
+from dev_orchestrator.agents.documenter_agent import DocumenterAgent
+from dev_orchestrator.agents.implementer_agent import ImplementerAgent
+from dev_orchestrator.agents.response_cache import get_response_cache
+from dev_orchestrator.core.config import get_config, reset_config
+from dev_orchestrator.core.run_context import RunContext
+
+
+def _architect_output() -> AgentOutput:
+    return AgentOutput(
+        success=True,
+        summary="Add a health module",
+        reasoning="Use a dedicated module.\n\nLong discussion of alternatives.",
+        file_changes=[
+            FileChange(
+                path="health.py", action="create", content="x" * 1000, description="Endpoint"
+            ),
+        ],
+        recommendations=["Keep it small"],
+    )
+
+
+class TestSummarizeArchitectOutput:
+    """Tests for summarize_architect_output."""
+
+    def test_keeps_pivotal_information(self):
+        """Test that the summary keeps decisions and planned changes only."""
+        summary = summarize_architect_output(_architect_output())
+
+        assert "**Summary:** Add a health module" in summary
+        assert "**Key Decisions:** Use a dedicated module." in summary
+        assert '"path":"health.py"' in summary
+        assert "alternatives" not in summary
+        assert "Keep it small" not in summary
+        assert "xxx" not in summary
+
+    def test_truncates_reasoning(self):
+        """Test that long reasoning is truncated."""
+        output = AgentOutput(success=True, summary="s", reasoning="a" * 50)
+
+        summary = summarize_architect_output(output, max_reasoning=10)
+
+        assert "**Key Decisions:** aaaaaaaaaa..." in summary
+
+
+class TestFormatPreviousOutputs:
+    """Tests for BaseAgent._format_previous_outputs."""
+
+    def test_prefers_architect_summary(self):
+        """Test that the architect summary replaces the full output."""
+        agent = ImplementerAgent()
+        previous = {"architect": _architect_output()}
+
+        formatted = agent._format_previous_outputs(previous, "compact memory")
+
+        assert "### Architect\ncompact memory" in formatted
+        assert "Keep it small" not in formatted
+
+    def test_full_output_without_summary(self):
+        """Test that the full output is used when no summary is given."""
+        agent = ImplementerAgent()
+        previous = {"architect": _architect_output()}
+
+        formatted = agent._format_previous_outputs(previous)
+
+        assert "Keep it small" in formatted
+
+    def test_sorted_by_agent_name(self):
+        """Test that outputs render in a deterministic order."""
+        agent = ImplementerAgent()
+        output = AgentOutput(success=True, summary="s", reasoning="r")
+
+        formatted = agent._format_previous_outputs({"tester": output, "architect": output})
+
+        assert formatted.index("### Architect") < formatted.index("### Tester")
+
+
+class TestAgentOutputRecord:
+    """Tests for the slotted output records."""
+
+    def test_from_model(self):
+        """Test converting an AgentOutput into a record."""
+        record = AgentOutputRecord.from_model(_architect_output())
+
+        assert record.summary == "Add a health module"
+        assert record.file_changes[0] == FileChangeRecord(
+            path="health.py", action="create", content="x" * 1000, description="Endpoint"
+        )
+        assert record.recommendations == ("Keep it small",)
+        assert dataclasses.asdict(record)["file_changes"][0]["path"] == "health.py"
+
+    def test_immutable(self):
+        """Test that records cannot be modified."""
+        record = AgentOutputRecord.from_model(_architect_output())
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.summary = "changed"
+
+
+class TestFileChange:
+    """Tests for the FileChange model."""
+
+    def test_paths_are_interned(self):
+        """Test that equal paths share one string object."""
+        path = "".join(["src/", "app.py"])
+        first = FileChange(path=path, action="modify", content="", description="")
+        second = FileChange.model_validate_json(
+            '{"path": "src/app.py", "action": "create", "content": "", "description": ""}'
+        )
+
+        assert first.path is second.path
+
+
+class TestInvokeLLM:
+    """Tests for BaseAgent._invoke_llm."""
+
+    def test_streams_structured_output(self, fake_llm):
+        """Test that the streamed tool call is parsed into an AgentOutput."""
+        agent = ImplementerAgent(llm=fake_llm)
+
+        result = asyncio.run(agent.execute(goal="Add health", repo_context={}))
+
+        assert result.success is True
+        assert result.file_changes[0].path == "health.py"
+        assert result.recommendations == ["Ship it"]
+        assert agent.first_file_change.is_set()
+
+    def test_no_file_changes_leaves_event_unset(self, fake_llm):
+        """Test that the event is only set once file changes stream in."""
+        fake_llm.tool_args = {"success": True, "summary": "s", "reasoning": "r"}
+        agent = ImplementerAgent(llm=fake_llm)
+
+        result = asyncio.run(agent.execute(goal="Add health", repo_context={}))
+
+        assert result.summary == "s"
+        assert not agent.first_file_change.is_set()
+
+    def test_publishes_streamed_file_changes(self, fake_llm):
+        """Test that each file change is queued exactly once, in order."""
+        change = {"action": "create", "content": "x = 1\n", "description": "d"}
+        fake_llm.tool_args = {
+            "success": True,
+            "summary": "s",
+            "reasoning": "r",
+            "file_changes": [{"path": "a.py", **change}, {"path": "b.py", **change}],
+        }
+        agent = ImplementerAgent(llm=fake_llm)
+        agent.file_change_queue = asyncio.Queue()
+
+        asyncio.run(agent.execute(goal="Add health", repo_context={}))
+
+        queued = [agent.file_change_queue.get_nowait().path for _ in range(2)]
+        assert queued == ["a.py", "b.py"]
+        assert agent.file_change_queue.empty()
+
+    def test_invalid_output_is_reported(self, fake_llm):
+        """Test that an unparseable response yields a failed output."""
+        fake_llm.tool_args = {"summary": "missing fields"}
+        agent = ImplementerAgent(llm=fake_llm)
+
+        result = asyncio.run(agent.execute(goal="Add health", repo_context={}))
+
+        assert result.success is False
+
+
+class TestResponseCache:
+    """Tests for the on-disk agent response cache."""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path):
+        reset_config()
+        get_config().cache_dir = tmp_path / "cache"
+        yield get_config().cache_dir
+        reset_config()
+
+    def test_repeated_prompt_skips_llm(self, fake_llm, cache_dir, tmp_path):
+        """Test that an identical prompt is answered from the cache."""
+        context = RunContext.create(tmp_path, "Test")
+        context.cache_mode = "exact"
+
+        first_agent = ImplementerAgent(llm=fake_llm, context=context)
+        first = asyncio.run(first_agent.execute(goal="Add health", repo_context={}))
+        agent = ImplementerAgent(llm=fake_llm, context=context)
+        second = asyncio.run(agent.execute(goal="Add health", repo_context={}))
+
+        assert fake_llm.calls == 1
+        assert second == first
+        assert agent.first_file_change.is_set()
+        assert (cache_dir / "agent_responses.sqlite3").exists()
+
+    def test_off_by_default(self, fake_llm, cache_dir, tmp_path):
+        """Test that contexts do not cache unless asked to."""
+        context = RunContext.create(tmp_path, "Test")
+
+        for _ in range(2):
+            agent = ImplementerAgent(llm=fake_llm, context=context)
+            asyncio.run(agent.execute(goal="Add health", repo_context={}))
+
+        assert fake_llm.calls == 2
+        assert get_response_cache("off") is None
+
+    def test_unknown_mode(self):
+        """Test that an unknown cache mode is rejected."""
+        with pytest.raises(ValueError):
+            get_response_cache("fuzzy")
+        with pytest.raises(ValueError):
+            get_response_cache("semantic")
+
+    def test_memory_front(self, cache_dir, monkeypatch):
+        """Test that recent payloads are served from memory and old ones from disk."""
+        from dev_orchestrator.agents import response_cache
+
+        monkeypatch.setattr(response_cache, "MEMORY_ENTRIES", 2)
+        cache = response_cache.ResponseCache(cache_dir / "front.sqlite3")
+        for key in ("a", "b", "c"):
+            cache.put(key, key.upper())
+
+        queries = []
+        execute = cache._execute
+        monkeypatch.setattr(cache, "_execute", lambda *args: queries.append(args) or execute(*args))
+
+        assert (cache.get("c"), cache.get("b")) == ("C", "B")
+        assert queries == []
+        assert cache.get("a") == "A"
+        assert len(queries) == 1
+
+    def test_size_cap_evicts_least_used(self, cache_dir):
+        """Test that going over the cap deletes the least hit payloads first."""
+        from dev_orchestrator.agents.response_cache import ResponseCache
+
+        cache = ResponseCache(cache_dir / "capped.sqlite3", max_bytes=10)
+        cache.put("hot", "1234")
+        cache.put("cold", "5678")
+        cache.get("hot")
+        cache.put("new", "9012")
+
+        reopened = ResponseCache(cache_dir / "capped.sqlite3")
+        assert reopened.get("cold") is None
+        assert (reopened.get("hot"), reopened.get("new")) == ("1234", "9012")
+
+    def test_size_cap_keeps_new_payload_and_hits(self, cache_dir):
+        """Test that a new payload is never evicted and replacing a payload keeps its hits."""
+        from dev_orchestrator.agents.response_cache import ResponseCache
+
+        cache = ResponseCache(cache_dir / "capped.sqlite3", max_bytes=10)
+        cache.put("a", "1234")
+        cache.get("a")
+        cache.get("a")
+        cache.put("b", "5678")
+        cache.get("b")
+        cache.put("a", "4321")
+        cache.put("c", "9012")
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == ("4321", "9012")
+
+
+class TestOffLoopIfLarge:
+    """Tests for the size-based worker thread offload."""
+
+    def test_large_payloads_leave_the_loop(self, monkeypatch):
+        """Test that only payloads over the threshold run in a thread."""
+        import threading
+
+        from dev_orchestrator.agents import base_agent
+
+        monkeypatch.setattr(base_agent, "_OFFLOAD_BYTES", 10)
+
+        async def scenario():
+            loop_thread = threading.get_ident()
+            small = await base_agent._off_loop_if_large(10, threading.get_ident)
+            large = await base_agent._off_loop_if_large(11, threading.get_ident)
+            return small == loop_thread, large == loop_thread
+
+        assert asyncio.run(scenario()) == (True, False)
+
+
+class TestPromptTemplate:
+    """Tests for the per-class prompt template."""
+
+    def test_built_once_per_class(self):
+        """Test that instances of a class share one template."""
+        first = ImplementerAgent()._build_prompt()
+
+        assert ImplementerAgent()._build_prompt() is first
+        assert DocumenterAgent()._build_prompt() is not first
+
+    def test_uses_system_prompt(self):
+        """Test that the template carries the class system prompt."""
+        template = BatchedParallelAgent._get_prompt_template()
+        system = template.messages[0].prompt.template
+
+        assert system == BatchedParallelAgent().system_prompt
+        assert "===== ROLE: TESTER =====" in system
+
+    def test_system_prompt_is_shared_constant(self):
+        """Test that agents expose their module's interned prompt constant."""
+        from dev_orchestrator.agents import implementer_agent
+
+        assert ImplementerAgent().system_prompt is implementer_agent.SYSTEM_PROMPT
+        assert ImplementerAgent._class_system_prompt() is implementer_agent.SYSTEM_PROMPT
@@ -0,0 +1,258 @@
+"""Tests for the CLI."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from dev_orchestrator import __main__ as entrypoint
+from dev_orchestrator import __version__, cli
+from dev_orchestrator.core.config import get_config, reset_config
+from dev_orchestrator.core.run_context import RunContext, RunStatus
+
+
+@pytest.fixture
+def runs_dir(tmp_path):
+    """Point the global config at a temporary runs directory."""
+    reset_config()
+    config = get_config()
+    config.runs_dir = tmp_path / "runs"
+    yield config.runs_dir
+    reset_config()
+
+
+def _save_run(run_id: str, goal: str, status: RunStatus = RunStatus.COMPLETED) -> RunContext:
+    context = RunContext.create("/repo", goal)
+    context.run_id = run_id
+    context.status = status
+    context.save()
+    return context
+
+
+class TestStatusCommand:
+    """Tests for the status command."""
+
+    def test_lists_ten_most_recent_runs(self, runs_dir):
+        """Test that only the ten newest runs are listed, newest first."""
+        for i in range(12):
+            _save_run(f"run_20240101_0000{i:02d}_abc", f"Goal {'ABCDEFGHIJKL'[i]}")
+
+        result = CliRunner().invoke(cli.app, ["status"])
+
+        assert result.exit_code == 0
+        assert "Goal A" not in result.output and "Goal B" not in result.output
+        assert "Goal C" in result.output
+        assert result.output.index("Goal L") < result.output.index("Goal K")
+
+    def test_reloads_changed_runs(self, runs_dir):
+        """Test that a run saved again is not served from the cache."""
+        context = _save_run("run_20240101_000000_abc", "Goal", RunStatus.EXECUTING)
+        CliRunner().invoke(cli.app, ["status"])
+
+        context.status = RunStatus.FAILED
+        context.save()
+        result = CliRunner().invoke(cli.app, ["status"])
+
+        assert "failed" in result.output
+
+
+class TestReportCommand:
+    """Tests for the report command."""
+
+    def test_large_report_rendered_by_section(self, runs_dir, monkeypatch):
+        """Test that a report over the chunk size is rendered in full."""
+        from dev_orchestrator import console
+
+        context = _save_run("run_20240101_000000_abc", "Goal")
+        context.report_file.write_text("# Report\n\n## First\n\none\n\n## Second\n\ntwo\n")
+        monkeypatch.setattr(console, "MARKDOWN_CHUNK_BYTES", 0)
+
+        result = CliRunner().invoke(cli.app, ["report", context.run_id])
+
+        assert result.exit_code == 0
+        assert "First" in result.output and "two" in result.output
+
+
+def test_commands_registered_once():
+    """Test that no command name is registered twice."""
+    names = [c.name for c in cli.app.registered_commands]
+
+    assert sorted(names) == sorted(set(names))
+    assert "agents" in names
+
+
+def test_import_does_not_load_rich():
+    """Test that importing the CLI defers Rich until output is produced."""
+    code = "import sys, dev_orchestrator.cli; print('rich' in sys.modules)"
+
+    src_dir = str(Path(cli.__file__).parents[1])
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": src_dir},
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_format_status():
+    """Test status text, with a fallback color for other statuses."""
+    from dev_orchestrator.console import format_status
+
+    failed = format_status(RunStatus.FAILED)
+
+    assert (failed.plain, failed.style) == ("failed", "red")
+    assert format_status(RunStatus.PENDING).style == "dim"
+    assert format_status(RunStatus.FAILED) is failed
+
+
+def test_ellipsize():
+    """Test that only text over the limit is cut and marked."""
+    from dev_orchestrator.console import ellipsize
+
+    assert ellipsize("short", 5) == "short"
+    assert ellipsize("longer", 5) == "longe..."
+
+
+def test_iter_markdown_sections():
+    """Test that sections split at level-2 headings outside code fences."""
+    from dev_orchestrator.console import iter_markdown_sections
+
+    lines = ["# Report\n", "## A\n", "```\n", "## not a heading\n", "```\n", "## B\n", "b\n"]
+
+    sections = list(iter_markdown_sections(lines))
+
+    assert sections == [
+        "# Report\n",
+        "## A\n```\n## not a heading\n```\n",
+        "## B\nb\n",
+    ]
+
+
+class TestFastPath:
+    """Tests for the entry point's Typer-free fast path."""
+
+    def test_version(self, monkeypatch, capsys):
+        """Test that --version is answered directly."""
+        monkeypatch.setattr("sys.argv", ["orchestrator", "--version"])
+
+        entrypoint.main()
+
+        assert capsys.readouterr().out == f"dev-orchestrator v{__version__}\n"
+
+    def test_list(self, runs_dir, monkeypatch, capsys):
+        """Test that list renders the recent runs table."""
+        _save_run("run_20240101_000000_abc", "Goal")
+        monkeypatch.setattr("sys.argv", ["orchestrator", "list"])
+
+        entrypoint.main()
+
+        assert "Goal" in capsys.readouterr().out
+
+    def test_list_alias_dispatches_to_status(self, monkeypatch):
+        """Test that list with arguments is rewritten to status for Typer."""
+        seen = []
+        monkeypatch.setattr("sys.argv", ["orchestrator", "list", "--help"])
+        monkeypatch.setattr(cli, "app", lambda: seen.append(list(sys.argv)))
+        monkeypatch.setattr(cli, "select_command", lambda argv: None)
+
+        entrypoint.main()
+
+        assert seen == [["orchestrator", "status", "--help"]]
+
+
+class TestSelectCommand:
+    """Tests for registering only the invoked command."""
+
+    @pytest.fixture(autouse=True)
+    def restore_commands(self, monkeypatch):
+        """Undo the pruning of the shared app's commands."""
+        monkeypatch.setattr(cli.app, "registered_commands", list(cli.app.registered_commands))
+
+    def test_keeps_only_invoked_command(self):
+        """Test that options before and after the command are skipped."""
+        cli.select_command(["--version", "report", "--help"])
+
+        assert [c.name for c in cli.app.registered_commands] == ["report"]
+
+    @pytest.mark.parametrize("argv", [[], ["--help"], ["unknown"]])
+    def test_keeps_all_without_known_command(self, argv):
+        """Test that help and unknown commands still see every command."""
+        before = list(cli.app.registered_commands)
+
+        cli.select_command(argv)
+
+        assert cli.app.registered_commands == before
+
+
+def test_new_table_is_fresh_per_call():
+    """Test that tables built from the same column specs are independent."""
+    from dev_orchestrator.console import RUNS_COLUMNS, new_table
+
+    first = new_table(RUNS_COLUMNS, title="Runs")
+    first.add_row("run", "done", "goal")
+    second = new_table(RUNS_COLUMNS)
+
+    assert [c.header for c in second.columns] == ["Run ID", "Status", "Goal"]
+    assert second.row_count == 0
+
+
+def test_repo_display_path(tmp_path, monkeypatch):
+    """Test that repo paths are made absolute, resolving only dot parts."""
+    monkeypatch.chdir(tmp_path)
+
+    assert cli._repo_display_path("repo") == tmp_path / "repo"
+    assert cli._repo_display_path("repo/../other") == (tmp_path / "other").resolve()
+    assert cli._repo_display_path(str(tmp_path)) == tmp_path
+
+
+def test_progress_reporter_prints_lines_off_terminal(capsys):
+    """Test that progress is printed line by line when not on a terminal, without repeats."""
+    from dev_orchestrator.console import progress_reporter
+
+    with progress_reporter("Starting...") as report:
+        report("Starting...")
+        report("Done")
+        report("Done")
+
+    assert capsys.readouterr().out.splitlines() == ["Starting...", "Done"]
+
+
+def test_show_plan(capsys):
+    """Test that the plan is printed as indented lines per task."""
+    from dev_orchestrator.core.planner import Plan, Task, TaskType
+
+    plan = Plan(goal="Goal", tasks=[
+        Task(id="t1", type=TaskType.ANALYZE, title="Look", description="", role="analyst"),
+        Task(
+            id="t2", type=TaskType.IMPLEMENT, title="Build", description="", role="dev",
+            dependencies=["t1"],
+        ),
+    ])
+
+    cli._show_plan(plan)
+
+    assert capsys.readouterr().out.splitlines() == [
+        "Plan: Goal",
+        "  t1 Look",
+        "    Role: analyst",
+        "    Type: analyze",
+        "  t2 Build",
+        "    Role: dev",
+        "    Type: implement",
+        "    Depends on: t1",
+    ]
+
+
+def test_config_command_lists_settings(runs_dir):
+    """Test that config shows every setting."""
+    result = CliRunner().invoke(cli.app, ["config"])
+
+    assert result.exit_code == 0
+    for key in get_config().to_dict():
+        assert key in result.output
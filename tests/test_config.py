@@ -0,0 +1,91 @@
+"""Tests for configuration module."""
+
+from pathlib import Path
+
+import pytest
+
+from dev_orchestrator.core.config import OrchestratorConfig
+
+
+class TestOrchestratorConfig:
+    """Tests for OrchestratorConfig."""
+
+    def test_env_overrides(self, monkeypatch):
+        """Test that environment variables override defaults."""
+        monkeypatch.setenv("ORCHESTRATOR_DRY_RUN", "YES")
+        monkeypatch.setenv("ORCHESTRATOR_VERBOSE", "off")
+        monkeypatch.setenv("ORCHESTRATOR_BRANCH_PREFIX", "bot")
+
+        config = OrchestratorConfig()
+
+        assert config.dry_run is True
+        assert config.verbose is False
+        assert config.branch_prefix == "bot"
+
+    def test_to_dict_follows_changes(self, tmp_path):
+        """Test that the cached dict is rebuilt after a setting changes."""
+        config = OrchestratorConfig(orchestrator_root=tmp_path)
+        assert config.to_dict()["runs_dir"] == str(tmp_path / "runs")
+
+        config.runs_dir = Path("/elsewhere")
+        config.verbose = True
+
+        assert config.to_dict()["runs_dir"] == "/elsewhere"
+        assert config.to_dict()["verbose"] is True
+
+    def test_to_dict_returns_copy(self):
+        """Test that changing a returned dict does not affect the cache."""
+        config = OrchestratorConfig()
+
+        config.to_dict()["log_level"] = "DEBUG"
+
+        assert config.to_dict()["log_level"] == "INFO"
+
+    def test_ensure_dirs_once(self, tmp_path, monkeypatch):
+        """Test that mkdir is only called on the first call per directory."""
+        calls = []
+        mkdir = Path.mkdir
+
+        def counting_mkdir(path, *args, **kwargs):
+            calls.append(path)
+            return mkdir(path, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+        config = OrchestratorConfig(orchestrator_root=tmp_path)
+
+        config.ensure_dirs()
+        config.ensure_dirs()
+        OrchestratorConfig(orchestrator_root=tmp_path).ensure_dirs()
+
+        assert calls == [config.runs_dir]
+        assert config.runs_dir.is_dir()
+
+    def test_get_config_loads_dotenv(self, monkeypatch):
+        """Test that the first get_config applies .env overrides, loading .env once."""
+        from dev_orchestrator.core import config as config_module
+
+        loads = []
+
+        def load_dotenv():
+            loads.append(True)
+            monkeypatch.setenv("ORCHESTRATOR_BRANCH_PREFIX", "fromdotenv")
+
+        monkeypatch.delenv("ORCHESTRATOR_BRANCH_PREFIX", raising=False)
+        monkeypatch.setattr("dotenv.load_dotenv", load_dotenv)
+        monkeypatch.setattr(config_module, "_dotenv_loaded", False)
+        config_module.reset_config()
+        try:
+            assert config_module.get_config().branch_prefix == "fromdotenv"
+            config_module.reset_config()
+            config_module.get_config()
+        finally:
+            config_module.reset_config()
+
+        assert loads == [True]
+
+    def test_unknown_attribute_rejected(self):
+        """Test that the slotted config rejects misspelled settings."""
+        config = OrchestratorConfig()
+
+        with pytest.raises(AttributeError):
+            config.dryrun = True
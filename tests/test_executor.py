@@ -0,0 +1,143 @@
+"""Tests for executor module."""
+
+import asyncio
+import threading
+
+import pytest
+
+from dev_orchestrator.core.config import get_config, reset_config
+from dev_orchestrator.core.executor import Executor
+from dev_orchestrator.core.planner import Plan, Task, TaskType
+from dev_orchestrator.core.roles.base import RoleProposal
+from dev_orchestrator.core.run_context import RunContext
+
+
+class EchoRole:
+    """Role stub proposing details naming its task."""
+
+    def execute(self, task: Task) -> RoleProposal:
+        details = f"Details of {task.id}"
+        return RoleProposal(
+            role="echo", task_id=task.id, success=True, summary="ok", details=details
+        )
+
+
+@pytest.fixture
+def executor(tmp_path):
+    """An executor for a three-task plan, with runs under tmp_path."""
+    reset_config()
+    get_config().runs_dir = tmp_path / "runs"
+    executor = Executor(RunContext.create(tmp_path, "Goal"))
+    executor.roles = {"echo": EchoRole()}
+    executor.plan = Plan(goal="Goal", tasks=[
+        Task(id=f"t{i}", type=TaskType.ANALYZE, title=f"Task {i}", description="", role="echo")
+        for i in range(3)
+    ])
+    yield executor
+    reset_config()
+
+
+class TestExecutor:
+    """Tests for Executor."""
+
+    def test_execute_plan_journals_tasks(self, executor):
+        """Test that every finished task is journaled and the state saved at the end."""
+        executor.execute_plan()
+
+        events = list(executor.context.iter_journal())
+        assert [(e["task"], e["status"]) for e in events] == [
+            ("t0", "completed"), ("t1", "completed"), ("t2", "completed"),
+        ]
+        assert executor.context.state_file.exists()
+
+    def test_report_streams_proposals(self, executor):
+        """Test that proposal sections are copied into the report in plan order."""
+        executor.execute_plan()
+
+        report_path = executor.generate_report()
+
+        report = executor.context.report_file.read_text(encoding="utf-8")
+        assert report_path == str(executor.context.report_file)
+        positions = [report.index(f"Details of t{i}") for i in range(3)]
+        assert positions == sorted(positions)
+        assert report.index("## Proposals") < positions[0]
+        assert positions[-1] < report.index("## File Changes")
+
+    def test_report_without_proposals(self, executor):
+        """Test the report of a run that produced no proposals."""
+        executor.generate_report()
+
+        report = executor.context.report_file.read_text(encoding="utf-8")
+        assert "No proposals generated.\n\n## File Changes" in report
+
+    def test_level_concurrency_limited(self, executor):
+        """Test that independent tasks overlap, but no more than task_concurrency at once."""
+        running = []
+        peak = []
+        barrier = threading.Barrier(2, timeout=5)
+
+        class SlowRole(EchoRole):
+            def execute(self, task):
+                running.append(task.id)
+                peak.append(len(running))
+                barrier.wait()
+                running.remove(task.id)
+                return super().execute(task)
+
+        executor.roles = {"echo": SlowRole()}
+        executor.config.task_concurrency = 2
+        tasks = executor.plan.tasks + [
+            Task(id="t3", type=TaskType.ANALYZE, title="Task 3", description="", role="echo")
+        ]
+
+        asyncio.run(executor.execute_level(tasks))
+
+        assert max(peak) == 2
+        assert [p.task_id for p in executor.proposals] == ["t0", "t1", "t2", "t3"]
+
+    def test_report_task_summary(self, executor):
+        """Test the task table rows, with the icon for each status."""
+        executor.execute_task(executor.plan.tasks[0])
+
+        executor.generate_report()
+
+        report = executor.context.report_file.read_text(encoding="utf-8")
+        assert (
+            "|---|------|------|--------|\n"
+            "| 1 | Task 0 | echo | ✅ completed |\n"
+            "| 2 | Task 1 | echo | ⏳ pending |\n"
+            "| 3 | Task 2 | echo | ⏳ pending |\n\n## Proposals"
+        ) in report
+
+    def test_proposals_on_disk_before_report(self, executor):
+        """Test that finished proposals are readable on disk before the report is generated."""
+        executor.execute_plan()
+
+        sections = executor.proposals_file.read_text(encoding="utf-8")
+        assert all(f"Details of t{i}" in sections for i in range(3))
+
+    def test_apply_changes_lists_each_file_once(self, executor, tmp_path):
+        """Test that a file changed by two roles is listed, and reported, once."""
+        from dev_orchestrator.core.roles import DocumenterRole, ImplementerRole
+
+        executor.roles = {
+            "implementer": ImplementerRole(executor.context),
+            "documenter": DocumenterRole(executor.context),
+        }
+        executor.proposals = [
+            RoleProposal(
+                role="implementer", task_id="t1", success=True, summary="", details="",
+                file_changes=[
+                    {"file": "b.md", "action": "create", "content": "b"},
+                    {"file": "a.md", "action": "create", "content": "a"},
+                ],
+            ),
+            RoleProposal(
+                role="documenter", task_id="t2", success=True, summary="", details="",
+                file_changes=[{"file": "a.md", "action": "update", "content": "more"}],
+            ),
+        ]
+
+        assert executor.apply_changes() == ["a.md", "b.md"]
+        assert (tmp_path / "a.md").read_text(encoding="utf-8") == "a\nmore"
+        assert executor._format_file_changes() == "- `a.md`\n- `b.md`"
@@ -9,6 +9,34 @@ import pytest
 from dev_orchestrator.core.git_ops import GitError, GitOps, GitResult
 
 
+@pytest.fixture
+def git_without_batch_command(tmp_path, monkeypatch):
+    """Point the config at a git wrapper whose cat-file lacks --batch-command.
+
+    Returns a function setting the version the wrapper reports.
+    """
+    from dev_orchestrator.core.config import get_config, reset_config
+
+    script = tmp_path / "git"
+
+    def set_version(version: str) -> None:
+        script.write_text(
+            "#!/bin/sh\n"
+            'case "$*" in\n'
+            f'  version) echo "git version {version}" ;;\n'
+            "  *--batch-command*) echo 'error: unknown option' >&2; exit 129 ;;\n"
+            '  *) exec git "$@" ;;\n'
+            "esac\n"
+        )
+        script.chmod(0o755)
+
+    set_version("2.30.0")
+    reset_config()
+    monkeypatch.setattr(get_config(), "git_executable", str(script))
+    yield set_version
+    reset_config()
+
+
 @pytest.fixture
 def temp_git_repo(tmp_path):
     """Create a temporary git repository for testing."""
@@ -73,6 +101,25 @@ class TestGitOps:
         assert git_ops.branch_exists(current) is True
         assert git_ops.branch_exists("nonexistent-branch") is False
 
+    def test_branch_exists_one_off_uses_rev_parse(self, temp_git_repo):
+        """Test that a lone branch check does not start a cat-file process."""
+        git_ops = GitOps(temp_git_repo)
+        assert git_ops.branch_exists("nonexistent-branch") is False
+        assert git_ops._cat_file is None
+        assert git_ops._batch_command is None
+
+    def test_branch_exists_sees_new_branches(self, temp_git_repo, monkeypatch):
+        """Test that branch checks reuse a running cat-file and see branches created outside."""
+        git_ops = GitOps(temp_git_repo)
+        git_ops.read_file("README.md")
+        assert git_ops.branch_exists("later") is False
+
+        subprocess.run(["git", "branch", "later"], cwd=temp_git_repo, capture_output=True)
+        monkeypatch.setattr(git_ops, "_run_git", None)
+
+        assert git_ops.branch_exists("later") is True
+        assert git_ops.branch_exists("HEAD") is False
+
     def test_is_protected_branch(self, temp_git_repo):
         """Test protected branch detection."""
         git_ops = GitOps(temp_git_repo)
@@ -140,6 +187,44 @@ class TestGitOps:
         assert status["clean"] is False
         assert "newfile.txt" in status["files"]["untracked"]
 
+    def test_get_status_classifies_entries(self, temp_git_repo):
+        """Test modified, added, deleted and renamed entries, including odd paths."""
+        (temp_git_repo / "gone.txt").write_text("gone")
+        (temp_git_repo / "old.txt").write_text("old")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "Add"], cwd=temp_git_repo, capture_output=True)
+
+        (temp_git_repo / "README.md").write_text("changed")
+        (temp_git_repo / "gone.txt").unlink()
+        (temp_git_repo / "new file.txt").write_text("new")
+        subprocess.run(["git", "add", "new file.txt"], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(
+            ["git", "mv", "old.txt", "moved.txt"], cwd=temp_git_repo, capture_output=True
+        )
+
+        files = GitOps(temp_git_repo).get_status()["files"]
+
+        assert files == {
+            "modified": ["README.md"],
+            "added": ["new file.txt"],
+            "deleted": ["gone.txt"],
+            "untracked": [],
+        }
+
+    def test_get_status_detached(self, temp_git_repo):
+        """Test that a detached HEAD is reported like rev-parse does."""
+        subprocess.run(["git", "checkout", "--detach"], cwd=temp_git_repo, capture_output=True)
+
+        assert GitOps(temp_git_repo).get_status()["branch"] == "HEAD"
+
+    def test_snapshot(self, temp_git_repo):
+        """Test that a snapshot combines status and recent commits."""
+        snapshot = GitOps(temp_git_repo).snapshot(log_count=1)
+
+        assert snapshot["clean"] is True
+        assert snapshot["branch"] in ["main", "master"]
+        assert [c["message"] for c in snapshot["commits"]] == ["Initial commit"]
+
     def test_stage_and_commit(self, temp_git_repo):
         """Test staging and committing files."""
         git_ops = GitOps(temp_git_repo)
@@ -157,6 +242,21 @@ class TestGitOps:
         status = git_ops.get_status()
         assert status["clean"] is True
 
+    def test_stage_many_files(self, temp_git_repo):
+        """Test staging new and deleted files in one call."""
+        git_ops = GitOps(temp_git_repo)
+        git_ops.create_branch("test-stage")
+
+        (temp_git_repo / "sub dir").mkdir()
+        (temp_git_repo / "sub dir" / "a b.txt").write_text("a")
+        (temp_git_repo / "new.txt").write_text("new")
+        (temp_git_repo / "README.md").unlink()
+        (temp_git_repo / "unstaged.txt").write_text("ignored")
+        git_ops.stage_files(["sub dir/a b.txt", "new.txt", "README.md"])
+
+        staged = git_ops._run_git(["diff", "--cached", "--name-status"]).stdout.splitlines()
+        assert sorted(staged) == ["A\tnew.txt", "A\tsub dir/a b.txt", "D\tREADME.md"]
+
     def test_commit_on_protected_branch_fails(self, temp_git_repo):
         """Test that commits on protected branches are rejected."""
         git_ops = GitOps(temp_git_repo)
@@ -167,6 +267,37 @@ class TestGitOps:
         with pytest.raises(GitError, match="protected"):
             git_ops.commit("Should fail")
 
+    def test_commit_rechecks_branch_switched_outside(self, temp_git_repo):
+        """Test that the protected-branch check does not trust the cached branch."""
+        git_ops = GitOps(temp_git_repo)
+        git_ops.create_branch("feature")
+        default = git_ops.get_default_branch()
+        subprocess.run(["git", "checkout", default], cwd=temp_git_repo, capture_output=True)
+
+        with pytest.raises(GitError, match="protected"):
+            git_ops.commit("Should fail", allow_empty=True)
+
+    def test_branch_lookups_cached(self, temp_git_repo, monkeypatch):
+        """Test that repeated lookups and a create/checkout cycle reuse known answers."""
+        git_ops = GitOps(temp_git_repo)
+        git_ops.validate_repo()
+        default = git_ops.get_default_branch()
+        git_ops.create_branch("feature")
+
+        calls = []
+        run_git = git_ops._run_git
+        monkeypatch.setattr(
+            git_ops, "_run_git", lambda args, **kw: calls.append(args) or run_git(args, **kw)
+        )
+
+        assert git_ops.validate_repo() is True
+        assert git_ops.get_default_branch() == default
+        assert git_ops.get_current_branch() == "feature"
+        assert git_ops.branch_exists("feature") is True
+        git_ops.checkout_branch(default)
+        assert git_ops.get_current_branch() == default
+        assert calls == [["checkout", default]]
+
     def test_get_diff(self, temp_git_repo):
         """Test getting diff of changes."""
         git_ops = GitOps(temp_git_repo)
@@ -188,6 +319,21 @@ class TestGitOps:
         assert "hash" in commits[0]
         assert "author" in commits[0]
 
+    def test_get_log_message_with_pipes(self, temp_git_repo):
+        """Test that field separators in messages do not shift the fields."""
+        subprocess.run(
+            ["git", "commit", "--allow-empty", "-m", "Use a | b | c"],
+            cwd=temp_git_repo,
+            capture_output=True,
+        )
+
+        commits = GitOps(temp_git_repo).get_log(count=2)
+
+        assert [c["message"] for c in commits] == ["Use a | b | c", "Initial commit"]
+        assert commits[0]["author"] == "Test User"
+        assert commits[0]["email"] == "test@test.com"
+        assert len(commits[0]["hash"]) == 40
+
     def test_get_file_list(self, temp_git_repo):
         """Test getting list of tracked files."""
         git_ops = GitOps(temp_git_repo)
@@ -195,6 +341,101 @@ class TestGitOps:
 
         assert "README.md" in files
 
+    def test_read_file(self, temp_git_repo):
+        """Test reading a file at HEAD."""
+        git_ops = GitOps(temp_git_repo)
+
+        assert git_ops.read_file("README.md") == "# Test Repository"
+
+    def test_read_file_max_bytes(self, temp_git_repo):
+        """Test that files over max_bytes are skipped."""
+        git_ops = GitOps(temp_git_repo)
+
+        assert git_ops.read_file("README.md", max_bytes=100) == "# Test Repository"
+        assert git_ops.read_file("README.md", max_bytes=5) is None
+
+    def test_read_file_missing(self, temp_git_repo):
+        """Test reading a file that does not exist at HEAD."""
+        git_ops = GitOps(temp_git_repo)
+
+        with pytest.raises(GitError):
+            git_ops.read_file("missing.txt", max_bytes=100)
+
+    def test_read_files_share_one_process(self, temp_git_repo):
+        """Test that reads reuse the cat-file process until closed."""
+        (temp_git_repo / "a b.txt").write_text("spaced\n")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "Add"], cwd=temp_git_repo, capture_output=True)
+        git_ops = GitOps(temp_git_repo)
+
+        assert git_ops.read_file("README.md") == "# Test Repository"
+        proc = git_ops._cat_file
+        with pytest.raises(GitError):
+            git_ops.read_file("missing.txt")
+        assert git_ops.read_file("a b.txt") == "spaced"
+        assert git_ops._cat_file is proc
+
+        git_ops.close()
+        assert proc.poll() is not None
+        assert git_ops.read_file("README.md", ref="HEAD~1") == "# Test Repository"
+
+    def test_read_files(self, temp_git_repo, monkeypatch):
+        """Test batched reads, across request groups, skipping missing and large files."""
+        from dev_orchestrator.core import git_ops as git_ops_module
+
+        (temp_git_repo / "big.txt").write_text("x" * 200)
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "Add"], cwd=temp_git_repo, capture_output=True)
+        monkeypatch.setattr(git_ops_module, "_CAT_FILE_GROUP", 2)
+        git_ops = GitOps(temp_git_repo)
+
+        contents = git_ops.read_files(["missing.txt", "big.txt", "README.md"], max_bytes=100)
+
+        assert contents == {"README.md": "# Test Repository"}
+        assert git_ops.read_files(["big.txt"]) == {"big.txt": "x" * 200}
+
+    def test_context_manager_closes(self, temp_git_repo):
+        """Test that leaving the with block stops the cat-file process."""
+        with GitOps(temp_git_repo) as git_ops:
+            assert git_ops.read_file("README.md") == "# Test Repository"
+            proc = git_ops._cat_file
+
+        assert proc.poll() is not None
+        assert git_ops._cat_file is None
+
+    def test_reads_fall_back_to_show(self, temp_git_repo, git_without_batch_command):
+        """Test reads on a git without cat-file --batch-command."""
+        git_ops = GitOps(temp_git_repo)
+
+        assert git_ops.read_file("README.md") == "# Test Repository"
+        assert git_ops.read_file("README.md", max_bytes=5) is None
+        assert git_ops.read_files(["missing.txt", "README.md"]) == {
+            "README.md": "# Test Repository"
+        }
+        assert git_ops._cat_file is None
+
+    def test_branch_exists_falls_back_to_rev_parse(
+        self, temp_git_repo, git_without_batch_command
+    ):
+        """Test branch lookups on a git without cat-file --batch-command."""
+        git_ops = GitOps(temp_git_repo)
+        default = git_ops.get_current_branch()
+
+        assert git_ops.branch_exists(default) is True
+        assert git_ops.branch_exists("nonexistent") is False
+        assert git_ops._cat_file is None
+
+    def test_cat_file_exit_is_an_error(self, temp_git_repo, git_without_batch_command):
+        """Test that a cat-file process that exits is not taken for missing files."""
+        git_without_batch_command("2.40.0")
+        git_ops = GitOps(temp_git_repo)
+
+        # An EOF or a broken pipe, depending on when git exits
+        with pytest.raises(GitError, match="cat-file"):
+            git_ops.read_file("README.md")
+        with pytest.raises(GitError, match="cat-file"):
+            git_ops.read_files(["README.md"])
+
     def test_generate_branch_name(self, temp_git_repo):
         """Test branch name generation."""
         git_ops = GitOps(temp_git_repo)
@@ -213,6 +454,14 @@ class TestGitOps:
         # Branch name should be reasonable length
         assert len(name) < 100
 
+    def test_generate_branch_name_slug(self, temp_git_repo):
+        """Test that punctuation is dropped and whitespace runs become one dash."""
+        git_ops = GitOps(temp_git_repo)
+
+        name = git_ops.generate_branch_name("  Fix: café_menu\tcrash (v2)!  ")
+
+        assert name.rsplit("/", 1)[1] == "fix-cafémenucrash-v2"
+
 
 class TestGitResult:
     """Tests for GitResult dataclass."""
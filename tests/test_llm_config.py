@@ -0,0 +1,102 @@
+"""Tests for LLM configuration module."""
+
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from dev_orchestrator.core.llm_config import (
+    LLMConfig,
+    close_http_async_client,
+    create_chat_model,
+    get_http_async_client,
+)
+
+CONFIG = LLMConfig(openai_api_key="sk-test")
+
+
+class TestHttpAsyncClient:
+    """Tests for the per-loop shared HTTP client."""
+
+    def test_shared_within_loop(self):
+        """Test that models created on one loop share its client."""
+
+        async def scenario():
+            first = create_chat_model(CONFIG)
+            second = create_chat_model(CONFIG, temperature=0.5)
+            return first.http_async_client, second.http_async_client
+
+        first, second = asyncio.run(scenario())
+
+        assert first is not None
+        assert first is second
+
+    def test_one_client_per_loop(self):
+        """Test that each event loop gets its own client."""
+
+        async def scenario():
+            return get_http_async_client(CONFIG)
+
+        assert asyncio.run(scenario()) is not asyncio.run(scenario())
+
+    def test_close(self):
+        """Test that closing releases the loop's client and a new one is made after."""
+
+        async def scenario():
+            first = get_http_async_client(CONFIG)
+            await close_http_async_client()
+            await close_http_async_client()
+            return first, get_http_async_client(CONFIG)
+
+        first, second = asyncio.run(scenario())
+
+        assert first.is_closed
+        assert second is not first and not second.is_closed
+
+    def test_none_outside_loop(self):
+        """Test that no client is created without a running loop."""
+        assert get_http_async_client(CONFIG) is None
+        assert create_chat_model(CONFIG).http_async_client is None
+
+
+def test_check_llm_available_is_cached(monkeypatch):
+    """Test that the availability check runs once per process until cleared."""
+    from dev_orchestrator.core import llm_config
+
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    llm_config.get_llm_config.cache_clear()
+    llm_config.check_llm_available.cache_clear()
+    try:
+        assert llm_config.check_llm_available() == (False, "OPENAI_API_KEY not set")
+
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        assert llm_config.check_llm_available()[0] is False
+
+        llm_config.get_llm_config.cache_clear()
+        llm_config.check_llm_available.cache_clear()
+        assert llm_config.check_llm_available()[0] is True
+    finally:
+        llm_config.get_llm_config.cache_clear()
+        llm_config.check_llm_available.cache_clear()
+
+
+def test_import_defers_heavy_modules():
+    """Test that importing the module, or reading the config, defers heavy imports."""
+    from dev_orchestrator.core import llm_config
+
+    code = (
+        "import sys; from dev_orchestrator.core import llm_config; "
+        "print(any(m in sys.modules for m in ('langchain_openai', 'httpx', 'dotenv')), end=' '); "
+        "llm_config.get_llm_config(); print('langchain_openai' in sys.modules)"
+    )
+    src_dir = str(Path(llm_config.__file__).parents[2])
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": src_dir},
+    )
+
+    assert result.stdout.strip() == "False False"
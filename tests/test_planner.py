@@ -170,6 +170,36 @@ class TestPlan:
         assert len(pending) == 1
         assert pending[0].id == "t2"
 
+    def test_plan_levels(self):
+        """Test grouping tasks into levels by dependencies."""
+
+        def task(task_id: str, *deps: str) -> Task:
+            return Task(
+                id=task_id,
+                type=TaskType.IMPLEMENT,
+                title=task_id,
+                description="",
+                role="implementer",
+                dependencies=list(deps),
+            )
+
+        plan = Plan(
+            goal="Test",
+            tasks=[
+                task("docs", "design"),
+                task("design"),
+                task("code", "design", "missing"),
+                task("tests", "code"),
+                task("a", "b"),
+                task("b", "a"),
+            ],
+        )
+
+        levels = [[t.id for t in level] for level in plan.levels()]
+
+        # Unknown dependencies are ignored; the a <-> b cycle runs last, one at a time
+        assert levels == [["design"], ["docs", "code"], ["tests"], ["a"], ["b"]]
+
     def test_plan_get_task(self):
         """Test getting task by ID."""
         task = Task(
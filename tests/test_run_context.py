@@ -108,6 +108,57 @@ class TestRunContext:
         assert loaded.branch_name == "feature/test"
         assert len(loaded.errors) == 1
 
+    def test_save_if_dirty(self, tmp_path):
+        """Test that state is only written when it changed since the last save."""
+        from dev_orchestrator.core.config import get_config
+
+        config = get_config()
+        config.runs_dir = tmp_path / "runs"
+
+        context = RunContext.create(tmp_path / "repo", "Test goal")
+        context.save_if_dirty()
+        assert not context.state_file.exists()
+
+        context.set_status(RunStatus.COMPLETED)
+        context.save_if_dirty()
+        assert RunContext.load(context.run_id).status == RunStatus.COMPLETED
+
+        context.state_file.unlink()
+        context.save_if_dirty()
+        assert not context.state_file.exists()
+
+    def test_journal_append(self, tmp_path):
+        """Test that events are appended as lines without saving the state."""
+        from dev_orchestrator.core.config import get_config
+
+        config = get_config()
+        config.runs_dir = tmp_path / "runs"
+
+        context = RunContext.create(tmp_path / "repo", "Test goal")
+        assert list(context.iter_journal()) == []
+
+        context.journal_append({"task": "t1"}, {"task": "t2"})
+        context.journal_append({"task": "t3", "status": "failed"})
+
+        events = list(context.iter_journal())
+        assert [e["task"] for e in events] == ["t1", "t2", "t3"]
+        assert events[2]["status"] == "failed" and "timestamp" in events[2]
+        assert not context.state_file.exists()
+
+    def test_load_summary(self, tmp_path):
+        """Test loading status and goal from the head of the state file."""
+        from dev_orchestrator.core.config import get_config
+
+        config = get_config()
+        config.runs_dir = tmp_path / "runs"
+
+        goal = 'Quote " and ,"tasks": ' + "x" * 5000
+        context = RunContext.create(tmp_path / "repo", goal)
+        context.set_status(RunStatus.FAILED)
+        context.save()
+
+        assert RunContext.load_summary(context.run_id) == (RunStatus.FAILED, goal)
+
     def test_load_nonexistent(self, tmp_path):
         """Test loading non-existent run."""
         from dev_orchestrator.core.config import get_config
@@ -139,6 +190,38 @@ class TestRunContext:
         assert ctx1.run_id in runs
         assert ctx2.run_id in runs
 
+    def test_list_runs_limit(self, tmp_path):
+        """Test listing only the most recent runs, newest first."""
+        from dev_orchestrator.core.config import get_config
+
+        config = get_config()
+        config.runs_dir = tmp_path / "runs"
+
+        for i in range(3):
+            ctx = RunContext.create(tmp_path / "repo", f"Goal {i}")
+            ctx.run_id = f"run_20240101_00000{i}_abc"
+            ctx.save()
+
+        assert RunContext.list_runs(limit=2) == [
+            "run_20240101_000002_abc",
+            "run_20240101_000001_abc",
+        ]
+
+    def test_iter_runs_skips_incomplete_dirs(self, tmp_path):
+        """Test that only directories with saved state are yielded."""
+        from dev_orchestrator.core.config import get_config
+
+        config = get_config()
+        config.runs_dir = tmp_path / "runs"
+        assert list(RunContext.iter_runs()) == []
+
+        ctx = RunContext.create(tmp_path / "repo", "Goal")
+        ctx.save()
+        (config.runs_dir / "run_without_state").mkdir()
+        (config.runs_dir / "stray.txt").write_text("")
+
+        assert list(RunContext.iter_runs()) == [ctx.run_id]
+
     def test_run_paths(self, tmp_path):
         """Test run directory paths."""
         from dev_orchestrator.core.config import get_config
@@ -0,0 +1,311 @@
+"""Tests for the multi-agent workflow."""
+
+import asyncio
+
+import pytest
+
+from dev_orchestrator.agents import base_agent, workflow
+from dev_orchestrator.agents.base_agent import AgentOutput
+from dev_orchestrator.core.run_context import RunContext
+
+
+@pytest.fixture
+def patched_llm(monkeypatch, fake_llm):
+    """Make every agent use the fake chat model."""
+    monkeypatch.setattr(base_agent, "create_chat_model", lambda temperature=None: fake_llm)
+    return fake_llm
+
+
+def test_run_workflow(patched_llm):
+    """Test a full 1-N-1 run against the fake model."""
+    state = asyncio.run(workflow.run_workflow("Add health", "/repo", {}))
+
+    assert state["current_phase"] == "complete"
+    assert state["architect_summary"].startswith("**Summary:** Done")
+    for name in ("architect", "implementer", "tester", "documenter", "reviewer"):
+        assert state[f"{name}_output"].success
+    assert [fc.path for fc in state["all_file_changes"]] == ["health.py"]
+    assert state["all_recommendations"] == ["Ship it"]
+    assert patched_llm.calls == 5
+
+
+def test_agent_workflow_compiles_once(patched_llm, monkeypatch):
+    """Test that AgentWorkflow reuses one compiled graph across runs."""
+    compiled = []
+    create_workflow = workflow.create_workflow
+
+    def counting_create_workflow(*args, **kwargs):
+        compiled.append(True)
+        return create_workflow(*args, **kwargs)
+
+    monkeypatch.setattr(workflow, "create_workflow", counting_create_workflow)
+    agent_workflow = workflow.AgentWorkflow()
+
+    for _ in range(2):
+        state = asyncio.run(agent_workflow.execute("Add health", "/repo", {}))
+
+    assert len(compiled) == 1
+    assert state["current_phase"] == "complete"
+    assert patched_llm.calls == 10
+
+
+def test_failed_architect_skips_parallel_agents(patched_llm):
+    """Test that a failed architect routes straight to the reviewer."""
+    patched_llm.tool_args = {"summary": "missing fields"}
+
+    state = asyncio.run(workflow.run_workflow("Add health", "/repo", {}))
+
+    assert state["architect_output"].success is False
+    assert state["implementer_output"] is None
+    assert state["current_phase"] == "complete"
+    assert patched_llm.calls == 2
+
+
+def test_skips_agents_without_work(patched_llm):
+    """Test that the tester and reviewer are skipped without file changes."""
+    patched_llm.tool_args = {"success": True, "summary": "s", "reasoning": "r"}
+
+    state = asyncio.run(workflow.run_workflow("Add health", "/repo", {}))
+
+    assert state["tester_output"].summary.startswith("tester skipped")
+    assert state["reviewer_output"].summary == "Nothing to review"
+    assert patched_llm.calls == 3
+
+
+def test_prepare_during_waits_for_event():
+    """Test that agents are prepared once the event fires."""
+    prepared = []
+
+    class Agent:
+        def prepare(self):
+            prepared.append(True)
+
+    async def scenario():
+        ready = asyncio.Event()
+        release = asyncio.Event()
+
+        async def architect():
+            ready.set()
+            await release.wait()
+
+        task = asyncio.create_task(architect())
+        await workflow._prepare_during(task, ready, (Agent(), Agent()))
+        assert not task.done()
+        release.set()
+        await task
+
+    asyncio.run(scenario())
+
+    assert prepared == [True, True]
+
+
+def test_llm_cache_skips_repeated_calls(patched_llm):
+    """Test that a second identical run is served from the LLM cache."""
+    from langchain_core.globals import set_llm_cache
+
+    try:
+        workflow.AgentWorkflow(use_llm_cache=True)
+        asyncio.run(workflow.run_workflow("Add health", "/repo", {}))
+        calls = patched_llm.calls
+
+        state = asyncio.run(workflow.run_workflow("Add health", "/repo", {}))
+    finally:
+        set_llm_cache(None)
+
+    assert patched_llm.calls == calls
+    assert state["implementer_output"].file_changes[0].path == "health.py"
+
+
+class _StubAgent:
+    """Agent stub whose execute takes ``delay`` seconds."""
+
+    def __init__(self, name: str, delay: float = 0.0):
+        self.name = name
+        self.delay = delay
+
+    async def execute(self, **kwargs):
+        await asyncio.sleep(self.delay)
+        return AgentOutput(success=True, summary="ok", reasoning="r")
+
+
+def test_parallel_agent_timeout(tmp_path):
+    """Test that a hung agent times out without failing its siblings."""
+    context = RunContext.create(tmp_path, "Goal")
+    context.agent_timeout = 0.05
+    state = workflow.create_initial_state("Goal", str(tmp_path), {})
+
+    result = asyncio.run(workflow.parallel_agents_node(state, context, agents=(
+        _StubAgent("documenter"), _StubAgent("implementer", delay=10), _StubAgent("tester")
+    )))
+
+    assert result["implementer_output"].success is False
+    assert "timed out after 0.05s" in result["implementer_output"].summary
+    assert result["tester_output"].success
+    assert result["documenter_output"].success
+
+
+def test_run_dag_orders_agents(tmp_path):
+    """Test that the tester waits for the implementer but the documenter does not."""
+    from dev_orchestrator.agents.base_agent import FileChange
+
+    events = []
+
+    class Agent:
+        def __init__(self, name, delay=0.0):
+            self.name, self.delay = name, delay
+
+        async def execute(self, previous_outputs, **kwargs):
+            events.append((self.name, "start", sorted(previous_outputs)))
+            await asyncio.sleep(self.delay)
+            events.append((self.name, "end"))
+            change = FileChange(path="a.py", action="create", content="", description="d")
+            return AgentOutput(success=True, summary="ok", reasoning="r", file_changes=[change])
+
+    state = workflow.create_initial_state("Goal", str(tmp_path), {})
+    state["architect_output"] = AgentOutput(success=True, summary="plan", reasoning="r")
+
+    outputs = asyncio.run(workflow.run_dag(state, agents={
+        "implementer": Agent("implementer", delay=0.02),
+        "tester": Agent("tester"),
+        "documenter": Agent("documenter"),
+    }))
+
+    assert set(outputs) == {"architect", "implementer", "tester", "documenter"}
+    assert ("documenter", "start", ["architect"]) in events[:2]
+    assert events.index(("tester", "start", ["architect", "implementer"])) > events.index(
+        ("implementer", "end")
+    )
+
+
+def test_tester_starts_on_streamed_changes(tmp_path):
+    """Test that the tester starts on the implementer's first streamed file change."""
+    from dev_orchestrator.agents.base_agent import FileChange
+
+    events = []
+    change = FileChange(path="a.py", action="create", content="", description="d")
+
+    class Implementer:
+        name = "implementer"
+        file_change_queue = None
+
+        async def execute(self, **kwargs):
+            self.file_change_queue.put_nowait(change)
+            await asyncio.sleep(0.02)
+            events.append(("implementer", "end"))
+            return AgentOutput(
+                success=True, summary="ok", reasoning="r", file_changes=[change, change]
+            )
+
+    class Tester:
+        name = "tester"
+
+        async def execute(self, previous_outputs, **kwargs):
+            events.append(("tester", "start", previous_outputs["implementer"].file_changes))
+            return AgentOutput(success=True, summary="ok", reasoning="r")
+
+    state = workflow.create_initial_state("Goal", str(tmp_path), {})
+    implementer = Implementer()
+
+    outputs = asyncio.run(workflow.run_dag(state, agents={
+        "implementer": implementer, "tester": Tester(), "documenter": _StubAgent("documenter"),
+    }))
+
+    assert events == [("tester", "start", [change]), ("implementer", "end")]
+    assert outputs["implementer"].file_changes == [change, change]
+    assert implementer.file_change_queue is None
+
+
+def test_run_dag_shares_formatted_previous_outputs(tmp_path):
+    """Test that agents with the same ancestors share one rendering."""
+    from dev_orchestrator.agents.base_agent import FileChange
+
+    received = {}
+
+    class Agent:
+        def __init__(self, name):
+            self.name = name
+
+        async def execute(self, pre_formatted_previous, **kwargs):
+            received[self.name] = pre_formatted_previous
+            change = FileChange(path="a.py", action="create", content="", description="d")
+            return AgentOutput(success=True, summary="ok", reasoning="r", file_changes=[change])
+
+    state = workflow.create_initial_state("Goal", str(tmp_path), {})
+    state["architect_output"] = AgentOutput(success=True, summary="plan", reasoning="r")
+
+    asyncio.run(workflow.run_dag(state, agents={
+        name: Agent(name) for name in ("implementer", "tester", "documenter")
+    }))
+
+    assert received["implementer"] is received["documenter"]
+    assert "### Architect" in received["implementer"]
+    assert "### Implementer" in received["tester"]
+
+
+def test_focus_repo_context():
+    """Test that only files in the architect's design keep full contents."""
+    from dev_orchestrator.agents.base_agent import FileChange
+
+    repo_context = {"file_contents": {"app.py": "a" * 1000, "README.md": "r" * 1000}}
+    design = AgentOutput(
+        success=True, summary="s", reasoning="r",
+        file_changes=[FileChange(path="app.py", action="modify", content="", description="d")],
+    )
+
+    focused = workflow.focus_repo_context(repo_context, design)["_formatted"]
+
+    assert "a" * 1000 in focused
+    assert "r" * 500 + "..." in focused
+    assert "r" * 501 not in focused
+    assert workflow.focus_repo_context(repo_context, None) is repo_context
+
+
+def test_output_aggregate():
+    """Test that aggregation dedups changes by path and keeps order."""
+    from dev_orchestrator.agents.base_agent import FileChange
+    from dev_orchestrator.agents.reviewer_agent import OutputAggregate
+
+    def change(path, content):
+        return FileChange(path=path, action="create", content=content, description="d")
+
+    first = AgentOutput(
+        success=True, summary="s", reasoning="r",
+        file_changes=[change("a.py", "old"), change("b.py", "b")],
+        issues=["x"], recommendations=["r1"],
+    )
+    second = AgentOutput(
+        success=True, summary="s", reasoning="r",
+        file_changes=[change("a.py", "new")],
+        issues=["x", "y"], recommendations=["r1"],
+    )
+
+    aggregate = OutputAggregate([first, second])
+
+    assert [(fc.path, fc.content) for fc in aggregate.file_changes] == [
+        ("a.py", "new"), ("b.py", "b"),
+    ]
+    assert aggregate.issues == ["x", "y"]
+    assert aggregate.recommendations == ["r1"]
+
+
+def test_run_batch(patched_llm):
+    """Test running several goals through one workflow."""
+    goals = [(f"Goal {i}", "/repo", {}) for i in range(3)]
+
+    states = asyncio.run(workflow.AgentWorkflow().run_batch(goals, max_concurrency=2))
+
+    assert [s["goal"] for s in states] == ["Goal 0", "Goal 1", "Goal 2"]
+    assert all(s["current_phase"] == "complete" for s in states)
+
+
+def test_initial_state_formats_repo_context_once():
+    """Test that the initial state carries the formatted repository context."""
+    repo_context = {"repo_path": "/repo", "files": ["a.py"], "file_contents": {}}
+
+    state = workflow.create_initial_state("Goal", "/repo", repo_context)
+
+    assert "_formatted" not in repo_context
+    assert state["repo_context"]["_formatted"] == base_agent.format_repo_context(repo_context)
+    assert workflow.create_initial_state("Goal", "/repo", state["repo_context"])[
+        "repo_context"
+    ] is state["repo_context"]